@@ -23,7 +23,9 @@ Architecture:
 For detailed documentation, see: https://github.com/correlator-io/correlator-dbt
 """
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
 __version__: str
 try:
@@ -47,10 +49,31 @@ __all__ = [
     "parse_run_results",
 ]
 
-from .emitter import (
-    construct_test_events,
-    create_wrapping_event,
-    emit_events,
-    group_tests_by_dataset,
-)
-from .parser import parse_manifest, parse_run_results
+# Public API is resolved lazily (PEP 562) so that importing the package - as
+# the CLI entry point does - doesn't load openlineage-python and requests.
+_LAZY_EXPORTS = {
+    "construct_test_events": ".emitter",
+    "create_wrapping_event": ".emitter",
+    "emit_events": ".emitter",
+    "group_tests_by_dataset": ".emitter",
+    "parse_manifest": ".parser",
+    "parse_run_results": ".parser",
+}
+
+if TYPE_CHECKING:
+    from .emitter import (
+        construct_test_events,
+        create_wrapping_event,
+        emit_events,
+        group_tests_by_dataset,
+    )
+    from .parser import parse_manifest, parse_run_results
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API members on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
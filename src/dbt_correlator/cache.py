@@ -0,0 +1,316 @@
+"""Artifact caching for dbt-correlator.
+
+This module caches the decoded contents of dbt artifacts (run_results.json,
+manifest.json) so that repeated reads of an unchanged file skip JSON parsing.
+
+Cache entries are keyed by ``(path, mtime_ns, size)``. Any rewrite of the
+artifact (e.g., by a new dbt invocation) changes the file stat, so
+invalidation is automatic - there is no explicit expiry.
+
+Cached values are shared between callers and must be treated as read-only.
+The parser and emitter only ever read artifact data, never mutate it.
+
+Values derived deterministically from artifacts (e.g., test datasets grouped
+for events, model lineage) can be memoized with memoize_derived(), keyed on
+the artifacts' stat keys, so unchanged artifacts skip recomputation too.
+
+Because every CLI invocation is a fresh process, an optional on-disk sidecar
+cache persists the decoded data next to the artifact in marshal format, which
+loads several times faster than JSON. Sidecar files are named after the
+artifact's stat key, so a rewritten artifact never matches a stale sidecar:
+
+    target/manifest.json
+    target/.manifest.json.<mtime_ns>.<size>.dbtc
+"""
+
+import gc
+import logging
+import marshal
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of distinct artifact versions kept in memory
+ARTIFACT_CACHE_SIZE = 16
+
+# Maximum number of artifact-derived values kept in memory
+DERIVED_CACHE_SIZE = 32
+
+# Sidecar file suffix and header. marshal output is only guaranteed to be
+# readable by the same Python version, so the version is part of the header.
+SIDECAR_SUFFIX = ".dbtc"
+SIDECAR_HEADER = (
+    f"dbt-correlator:{marshal.version}:{sys.version_info[0]}.{sys.version_info[1]}\n"
+).encode()
+
+
+T = TypeVar("T")
+
+_derived_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+_derived_lock = threading.Lock()
+
+
+class _GcPauseState:
+    """Nesting depth of paused_gc() and the collector state to restore."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.depth = 0
+        self.was_enabled = False
+
+
+_gc_pause = _GcPauseState()
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """Pause the cyclic garbage collector while building large object graphs.
+
+    Decoding a dbt artifact allocates millions of containers, none of which
+    can form reference cycles yet. Each allocation burst otherwise triggers
+    repeated collections that rescan the growing graph (25-40% of decode
+    time for large artifacts). Safe to nest and to use from several threads;
+    the collector is restored when the outermost pause exits.
+
+    Example:
+        >>> with paused_gc():
+        ...     data = json.loads(raw)
+    """
+    with _gc_pause.lock:
+        if _gc_pause.depth == 0:
+            _gc_pause.was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause.depth += 1
+    try:
+        yield
+    finally:
+        with _gc_pause.lock:
+            _gc_pause.depth -= 1
+            if _gc_pause.depth == 0 and _gc_pause.was_enabled:
+                gc.enable()
+
+
+def get_stat_key(path: Path) -> tuple[int, int]:
+    """Get cache validation key for a file.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Tuple of (mtime_ns, size) identifying the current file version.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_sidecar_path(
+    path: Path, mtime_ns: int, size: int, variant: Optional[str] = None
+) -> Path:
+    """Get on-disk sidecar cache path for a given artifact version.
+
+    Args:
+        path: Path to the JSON artifact.
+        mtime_ns: Artifact modification time in nanoseconds.
+        size: Artifact size in bytes.
+        variant: Optional name of the transform applied to the cached data,
+            so transformed and full data never share a sidecar.
+
+    Returns:
+        Hidden sidecar path in the artifact's directory.
+
+    Example:
+        >>> get_sidecar_path(Path("target/manifest.json"), 1700000000, 42)
+        PosixPath('target/.manifest.json.1700000000.42.dbtc')
+    """
+    tag = f".{variant}" if variant else ""
+    return path.with_name(f".{path.name}.{mtime_ns}.{size}{tag}{SIDECAR_SUFFIX}")
+
+
+def _read_sidecar(sidecar: Path) -> Any:
+    """Read decoded data from a sidecar file.
+
+    Returns:
+        Decoded data, or None if the sidecar is missing, from another Python
+        version, or unreadable.
+    """
+    try:
+        raw = sidecar.read_bytes()
+    except OSError:
+        return None
+
+    if not raw.startswith(SIDECAR_HEADER):
+        return None
+
+    try:
+        # Sidecars are written by this module and only hold JSON-compatible
+        # types (dict, list, str, int, float, bool, None).
+        return marshal.loads(raw[len(SIDECAR_HEADER) :])  # nosec B302
+    except (EOFError, ValueError, TypeError):
+        logger.debug("Ignoring corrupt artifact cache: %s", sidecar)
+        return None
+
+
+def _write_sidecar(
+    path: Path, sidecar: Path, data: Any, variant: Optional[str] = None
+) -> None:
+    """Atomically write a sidecar file and purge older versions of the same variant.
+
+    Sidecars of other variants (e.g., the lean and full manifest) are kept,
+    so invocations that alternate between them don't evict each other.
+
+    Failures (e.g., read-only target directory) are logged and ignored - the
+    sidecar is an optimization, never a requirement.
+    """
+    tmp_name = None
+    try:
+        payload = SIDECAR_HEADER + marshal.dumps(data)
+        fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, sidecar)
+    except (OSError, ValueError) as e:
+        logger.debug("Could not write artifact cache %s: %s", sidecar, e)
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        return
+
+    # Sidecar names are .{name}.{mtime_ns}.{size}[.{variant}]{SIDECAR_SUFFIX}
+    prefix = f".{path.name}."
+    tag = [variant] if variant else []
+    for stale in path.parent.glob(f"{prefix}*{SIDECAR_SUFFIX}"):
+        parts = stale.name[len(prefix) : -len(SIDECAR_SUFFIX)].split(".")
+        if stale != sidecar and parts[2:] == tag:
+            with suppress(OSError):
+                stale.unlink()
+
+
+@lru_cache(maxsize=ARTIFACT_CACHE_SIZE)
+def _load_json(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    persistent: bool,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Load and decode a JSON file (memoized on path and file stat).
+
+    The mtime_ns and size arguments are part of the cache key so that a
+    modified file is re-read, and name the sidecar when persistent is set.
+    The transform, if any, is applied before caching, so only its result
+    is kept in memory and on disk.
+    """
+    # Deferred so that importing the cache (as the CLI does for stat keys)
+    # doesn't load the JSON backend
+    from . import jsonio
+
+    artifact = Path(path)
+    variant = transform.__name__.strip("_") if transform else None
+    sidecar = get_sidecar_path(artifact, mtime_ns, size, variant)
+
+    if persistent:
+        with paused_gc():
+            data = _read_sidecar(sidecar)
+        if data is not None:
+            return data
+
+    with paused_gc():
+        data = jsonio.loads(artifact.read_bytes())
+        if transform is not None:
+            data = transform(data)
+
+    if persistent:
+        _write_sidecar(artifact, sidecar, data, variant)
+    return data
+
+
+def load_json_artifact(
+    path: Path,
+    persistent: bool = False,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Load a JSON artifact, reusing the decoded data if the file is unchanged.
+
+    Args:
+        path: Path to the JSON artifact.
+        persistent: If True, also read/write an on-disk sidecar cache so that
+            later processes can skip JSON parsing for the same artifact.
+        transform: Optional module-level function applied to the decoded
+            data before it is cached (e.g., to drop unused fields). Part of
+            the cache key; its name distinguishes its sidecar.
+
+    Returns:
+        Decoded JSON data. Shared between callers - do not mutate.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        json.JSONDecodeError: If the file contains invalid JSON.
+
+    Example:
+        >>> data = load_json_artifact(Path("target/manifest.json"))
+        >>> data is load_json_artifact(Path("target/manifest.json"))
+        True
+    """
+    mtime_ns, size = get_stat_key(path)
+    return _load_json(str(path), mtime_ns, size, persistent, transform)
+
+
+def memoize_derived(key: Optional[Hashable], build: Callable[[], T]) -> T:
+    """Return a value derived from artifacts, computing it once per key.
+
+    Keys must identify every input of build(), including the stat keys of
+    the artifacts involved, so a rewritten artifact never hits a stale
+    entry. Least recently used entries are evicted beyond
+    DERIVED_CACHE_SIZE.
+
+    Args:
+        key: Cache key, or None to always call build() (e.g., for artifacts
+            not read from disk).
+        build: Zero-argument callable computing the value.
+
+    Returns:
+        Cached or freshly built value. Shared between callers - do not mutate.
+
+    Example:
+        >>> key = ("lineage", run_results.source_key, manifest.source_key)
+        >>> run_data = memoize_derived(key, lambda: build(run_results, manifest))
+    """
+    if key is None:
+        return build()
+
+    with _derived_lock:
+        if key in _derived_cache:
+            _derived_cache.move_to_end(key)
+            return cast(T, _derived_cache[key])
+
+    # Built outside the lock - concurrent misses for one key just race
+    value = build()
+
+    with _derived_lock:
+        _derived_cache[key] = value
+        while len(_derived_cache) > DERIVED_CACHE_SIZE:
+            _derived_cache.popitem(last=False)
+    return value
+
+
+def clear_artifact_cache() -> None:
+    """Drop all in-memory cached artifact data.
+
+    Also drops values memoized with memoize_derived(). Useful for
+    long-running processes and tests that need a cold cache. On-disk
+    sidecar files are left in place.
+    """
+    _load_json.cache_clear()
+    with _derived_lock:
+        _derived_cache.clear()
@@ -21,42 +21,55 @@ using the same patterns as other correlator plugins.
 
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import ChainMap
+from collections.abc import Iterable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, cast
 
 import click
-from uuid6 import uuid7
 
 from . import __version__
+from .cache import get_stat_key
 from .config import (
-    CONFIG_TO_CLI_MAPPING,
-    flatten_config,
+    EMIT_COMPRESSIONS,
+    EMIT_MAX_WORKERS,
+    build_default_map,
     get_manifest_path,
     get_run_results_path,
     load_yaml_config,
 )
-from .emitter import (
-    PRODUCER,
-    ParentRunMetadata,
-    construct_lineage_events,
-    construct_test_events,
-    create_wrapping_event,
-    emit_events,
-)
-from .parser import (
-    extract_all_model_lineage,
-    extract_model_results,
-    get_executed_models,
-    parse_manifest,
-    parse_run_results,
-)
+
+# The emitter and parser pull in openlineage-python and requests, which
+# dominate import time. They are imported inside the workflow functions so
+# --help, --version and argument errors return without loading them.
+if TYPE_CHECKING:
+    from .emitter import ParentRunMetadata
 
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# How often to check whether dbt has written a new manifest.json while it runs
+MANIFEST_POLL_INTERVAL_SECONDS = 1.0
+
+# RAM-backed directory preferred for --scratch-target (falls back to the
+# system temp directory where it does not exist)
+SCRATCH_TARGET_PARENT = "/dev/shm"  # nosec B108
+
+# dbt's partial parsing state, seeded into the scratch target so dbt does not
+# re-parse the whole project when its target directory changes
+PARTIAL_PARSE_FILENAME = "partial_parse.msgpack"
+
 
 @dataclass
 class WorkflowConfig:
@@ -87,6 +100,19 @@ class WorkflowConfig:
         dataset_namespace: Optional dataset namespace override for strict OL compliance.
         skip_dbt_run: If True, skip dbt execution and use existing artifacts.
         dbt_args: Additional arguments to pass to dbt command.
+        cache_artifacts: If True, persist decoded artifacts to an on-disk
+            sidecar cache in the target directory for faster re-parsing.
+        scratch_target: If True, point dbt's --target-path at a temporary
+            (RAM-backed where available) directory that is removed once the
+            artifacts are parsed, instead of writing to the project's target/.
+        manifest_lean: If True, keep only the manifest fields dbt-correlator
+            reads, reducing memory use and sidecar size for large projects.
+        eager_start: If True, emit the START event in its own request before
+            dbt runs. If False, defer it to the final batch (one request total).
+            None (default) means eager, except with skip_dbt_run, where
+            there is no dbt run to observe and START is batched.
+        emit_compression: Request body encoding for emission ("none" or "gzip").
+        emit_concurrency: Maximum number of event chunks POSTed concurrently.
         emit_test_events: Whether to emit dataQualityAssertions events.
         include_runtime_metrics: Whether to include outputStatistics facet.
     """
@@ -101,6 +127,12 @@ class WorkflowConfig:
     dataset_namespace: Optional[str] = None
     skip_dbt_run: bool = False
     dbt_args: tuple[str, ...] = ()
+    cache_artifacts: bool = False
+    scratch_target: bool = False
+    manifest_lean: bool = False
+    eager_start: Optional[bool] = None
+    emit_compression: str = "none"
+    emit_concurrency: int = EMIT_MAX_WORKERS
 
     # Workflow-specific flags derived from command type
     emit_test_events: bool = False
@@ -108,76 +140,9 @@ class WorkflowConfig:
     include_runtime_metrics: bool = False
 
     @classmethod
-    def for_test(
-        cls,
-        project_dir: str,
-        profiles_dir: str,
-        endpoint: str,
-        job_namespace: str,
-        job_name: Optional[str] = None,
-        api_key: Optional[str] = None,
-        dataset_namespace: Optional[str] = None,
-        skip_dbt_run: bool = False,
-        dbt_args: tuple[str, ...] = (),
-    ) -> "WorkflowConfig":
-        """Create configuration for dbt test workflow.
-
-        Test workflow: emits test events only, no lineage events or runtime metrics.
-        Tests validate existing data - they don't produce outputs.
-        """
-        return cls(
-            command="test",
-            project_dir=project_dir,
-            profiles_dir=profiles_dir,
-            endpoint=endpoint,
-            job_namespace=job_namespace,
-            job_name=job_name,
-            api_key=api_key,
-            dataset_namespace=dataset_namespace,
-            skip_dbt_run=skip_dbt_run,
-            dbt_args=dbt_args,
-            emit_test_events=True,
-            emit_lineage_events=False,
-            include_runtime_metrics=False,
-        )
-
-    @classmethod
-    def for_run(
-        cls,
-        project_dir: str,
-        profiles_dir: str,
-        endpoint: str,
-        job_namespace: str,
-        job_name: Optional[str] = None,
-        api_key: Optional[str] = None,
-        dataset_namespace: Optional[str] = None,
-        skip_dbt_run: bool = False,
-        dbt_args: tuple[str, ...] = (),
-    ) -> "WorkflowConfig":
-        """Create configuration for dbt run workflow.
-
-        Run workflow: emits lineage events with runtime metrics, no test events.
-        Uses get_executed_models() to filter models.
-        """
-        return cls(
-            command="run",
-            project_dir=project_dir,
-            profiles_dir=profiles_dir,
-            endpoint=endpoint,
-            job_namespace=job_namespace,
-            job_name=job_name,
-            api_key=api_key,
-            dataset_namespace=dataset_namespace,
-            skip_dbt_run=skip_dbt_run,
-            dbt_args=dbt_args,
-            emit_test_events=False,
-            emit_lineage_events=True,
-            include_runtime_metrics=True,
-        )
-
-    @classmethod
-    def for_build(
+    def for_command(
         cls,
+        command: Literal["test", "run", "build"],
         project_dir: str,
         profiles_dir: str,
         endpoint: str,
@@ -187,15 +152,27 @@ class WorkflowConfig:
         dataset_namespace: Optional[str] = None,
         skip_dbt_run: bool = False,
         dbt_args: tuple[str, ...] = (),
+        cache_artifacts: bool = False,
+        scratch_target: bool = False,
+        manifest_lean: bool = False,
+        eager_start: Optional[bool] = None,
+        emit_compression: str = "none",
+        emit_concurrency: int = EMIT_MAX_WORKERS,
     ) -> "WorkflowConfig":
-        """Create configuration for dbt build workflow.
-
-        Build workflow: emits both lineage events AND test events with runtime metrics.
-        Uses get_executed_models() to filter models.
-        Single runId shared across all events for better correlation.
+        """Create configuration for a dbt command workflow.
+
+        Workflow flags are derived from the command:
+            - test: emits test events only, no lineage events or runtime
+              metrics. Tests validate existing data - they don't produce outputs.
+            - run: emits lineage events with runtime metrics, no test events.
+              Uses get_executed_models() to filter models.
+            - build: emits both lineage events AND test events with runtime
+              metrics. Single runId shared across all events for better
+              correlation.
         """
+        produces_outputs = command in ("run", "build")
         return cls(
-            command="build",
+            command=command,
             project_dir=project_dir,
             profiles_dir=profiles_dir,
             endpoint=endpoint,
@@ -205,9 +182,15 @@ class WorkflowConfig:
             dataset_namespace=dataset_namespace,
             skip_dbt_run=skip_dbt_run,
             dbt_args=dbt_args,
-            emit_test_events=True,
-            emit_lineage_events=True,
-            include_runtime_metrics=True,
+            cache_artifacts=cache_artifacts,
+            scratch_target=scratch_target,
+            manifest_lean=manifest_lean,
+            eager_start=eager_start,
+            emit_compression=emit_compression,
+            emit_concurrency=emit_concurrency,
+            emit_test_events=command in ("test", "build"),
+            emit_lineage_events=produces_outputs,
+            include_runtime_metrics=produces_outputs,
         )
 
 
@@ -232,6 +215,11 @@ def load_config_callback(
         click.BadParameter: If config file exists but is invalid YAML.
         click.BadParameter: If explicitly specified config file doesn't exist.
     """
+    # Shell completion parses the command line resiliently on every keypress
+    # and never runs the command, so the config file is not needed
+    if ctx.resilient_parsing:
+        return value
+
     config_path = Path(value) if value else None
 
     # If explicit path provided and file doesn't exist, fail early
@@ -246,21 +234,15 @@ def load_config_callback(
         raise click.BadParameter(str(e), param=param, param_hint="--config") from e
 
     if yaml_config:
-        # Flatten nested YAML to match Click option names
-        flat_config = flatten_config(yaml_config)
-
-        # Map flat config keys to Click option names using shared mapping
-        default_map: dict[str, Any] = {}
-        for config_key, click_key in CONFIG_TO_CLI_MAPPING.items():
-            if config_key in flat_config:
-                default_map[click_key] = flat_config[config_key]
+        # Map nested YAML keys to Click option names using shared mapping
+        default_map = build_default_map(yaml_config)
 
-        # Set default_map on context for this command
-        # Merge existing default_map with config file values
+        # Set default_map on context for this command. Config file values
+        # take precedence over an existing default_map; a ChainMap layers
+        # them without copying it (ChainMap only ever writes to the first map)
         if ctx.default_map:
-            merged = dict(ctx.default_map)
-            merged.update(default_map)
-            ctx.default_map = merged
+            parent_map = cast(MutableMapping[str, Any], ctx.default_map)
+            ctx.default_map = ChainMap(default_map, parent_map)
         else:
             ctx.default_map = default_map
 
@@ -289,7 +271,7 @@ def get_api_key_with_fallback() -> Optional[str]:
     return os.environ.get("CORRELATOR_API_KEY") or os.environ.get("OPENLINEAGE_API_KEY")
 
 
-def get_parent_run_metadata() -> Optional[ParentRunMetadata]:
+def get_parent_run_metadata() -> Optional["ParentRunMetadata"]:
     """Read parent run context from OPENLINEAGE_PARENT_ID environment variable.
 
     Format: "{namespace}/{job_name}/{run_id}" — the same format produced by
@@ -305,6 +287,8 @@ def get_parent_run_metadata() -> Optional[ParentRunMetadata]:
     Returns:
         ParentRunMetadata if OPENLINEAGE_PARENT_ID is set and valid, else None.
     """
+    from .emitter import ParentRunMetadata
+
     parent_id = os.getenv("OPENLINEAGE_PARENT_ID")
     if not parent_id:
         return None
@@ -392,9 +376,14 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
     commands. It consolidates the common workflow logic:
 
     1. Parses manifest for job name (if not provided)
-    2. Emits START wrapping event immediately
-    3. Runs dbt command (unless skip_dbt_run)
-    4. Parses dbt artifacts
+    2. Emits START wrapping event immediately in a background thread, so dbt
+       starts without waiting on the backend (unless batched, see eager_start;
+       batched by default with skip_dbt_run, since there is no run to observe)
+    3. Runs dbt command (unless skip_dbt_run), prefetching the new
+       manifest.json in a background thread while dbt executes. With
+       scratch_target, dbt writes to a temporary target directory instead
+    4. Parses dbt artifacts (manifest and run_results concurrently), then
+       removes the scratch target directory if one was used
     5-8. Optionally constructs lineage events (run/build only)
          - Test command skips lineage: tests validate inputs, don't produce outputs
     9. Optionally constructs test events (test/build only)
@@ -414,6 +403,18 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
         Emission failures are logged as warnings but don't affect the exit code.
         This ensures lineage is "fire-and-forget" - dbt execution is primary.
     """
+    from uuid6 import uuid7
+
+    from .emitter import (
+        PRODUCER,
+        ParentRunMetadata,
+        construct_test_events,
+        create_wrapping_event,
+        emit_events,
+        iter_lineage_events,
+    )
+    from .parser import extract_run_data, parse_manifest, parse_run_results
+
     wrapping_run_id = str(uuid7())
     dbt_exit_code = 0
     manifest = None  # Will be parsed once and reused
@@ -425,13 +426,25 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
     job_name = config.job_name
     if not job_name:
         try:
-            manifest = parse_manifest(str(get_manifest_path(config.project_dir)))
+            manifest = parse_manifest(
+                str(get_manifest_path(config.project_dir)),
+                persistent_cache=config.cache_artifacts,
+                lean=config.manifest_lean,
+            )
             job_name = get_default_job_name(manifest, config.command)
         except FileNotFoundError:
             job_name = f"dbt.{config.command}"  # Fallback if no manifest yet
 
-    # 2. Create and emit START event immediately
+    # 2. Create START event and emit it immediately in the background (dbt is
+    #    launched without waiting for the round-trip), unless it is batched
+    #    with the final emission to save a request. Re-emitting from existing
+    #    artifacts has no dbt run in between, so START is batched by default.
+    if config.eager_start is None:
+        batch_start = config.skip_dbt_run
+    else:
+        batch_start = not config.eager_start
     start_timestamp = datetime.now(timezone.utc)
+    start_monotonic = time.monotonic()
     start_event = create_wrapping_event(
         "START",
         wrapping_run_id,
@@ -440,56 +453,123 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
         start_timestamp,
         parent=orchestrator_parent,
     )
+    start_emitter: Optional[threading.Thread] = None
+    if not batch_start:
+        start_emitter = threading.Thread(
+            target=emit_start_event, args=(config, start_event), daemon=True
+        )
+        start_emitter.start()
+
+    # 3. Run dbt command (unless skip). With scratch_target, dbt writes its
+    #    artifacts to a temporary directory that is removed after step 4; the
+    #    sidecar cache is pointless there, so it is disabled.
+    target_path: Optional[str] = None
+    cache_artifacts = config.cache_artifacts
+    if config.scratch_target and not config.skip_dbt_run:
+        target_path = create_scratch_target(config.project_dir)
+        cache_artifacts = False
     try:
-        emit_events([start_event], config.endpoint, config.api_key)
-    except (ConnectionError, TimeoutError, ValueError) as e:
-        click.echo(f"Warning: Failed to emit START event: {e}", err=True)
-
-    # 3. Run dbt command (unless skip)
-    if not config.skip_dbt_run:
-        try:
-            result = run_dbt_command(
-                config.command, config.project_dir, config.profiles_dir, config.dbt_args
+        if not config.skip_dbt_run:
+            # dbt writes manifest.json right after parsing, long before
+            # execution finishes. Parse it in the background so it is cached
+            # by the time dbt exits, hiding manifest parse latency behind the
+            # dbt run.
+            manifest_path = get_manifest_path(config.project_dir, target_path)
+            dbt_args = config.dbt_args
+            if target_path is not None:
+                dbt_args = (*dbt_args, "--target-path", target_path)
+            stop_prefetch = threading.Event()
+            prefetcher = threading.Thread(
+                target=prefetch_manifest,
+                args=(manifest_path, _stat_or_none(manifest_path), stop_prefetch),
+                kwargs={
+                    "persistent_cache": cache_artifacts,
+                    "lean": config.manifest_lean,
+                },
+                daemon=True,
             )
-            dbt_exit_code = result.returncode
-        except FileNotFoundError:
-            click.echo(
-                "Error: dbt executable not found. Please install dbt-core.",
-                err=True,
+            prefetcher.start()
+            try:
+                dbt_exit_code = run_dbt_command(
+                    config.command, config.project_dir, config.profiles_dir, dbt_args
+                )
+            except FileNotFoundError:
+                click.echo(
+                    "Error: dbt executable not found. Please install dbt-core.",
+                    err=True,
+                )
+                return 127  # Command not found exit code
+            finally:
+                stop_prefetch.set()
+                prefetcher.join()
+
+            # dbt may have rewritten the manifest - re-read it (served from
+            # the artifact cache when the prefetcher already parsed it)
+            manifest = None
+
+        # 4. Parse dbt artifacts (reuse manifest if already parsed and still
+        # current). The two files are independent, so the manifest is parsed
+        # in a worker thread while run_results is parsed here.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            manifest_future = None
+            if manifest is None:
+                manifest_future = executor.submit(
+                    parse_manifest,
+                    str(get_manifest_path(config.project_dir, target_path)),
+                    persistent_cache=cache_artifacts,
+                    lean=config.manifest_lean,
+                )
+            # Compiled SQL and thread IDs are never emitted
+            run_results = parse_run_results(
+                str(get_run_results_path(config.project_dir, target_path)),
+                persistent_cache=cache_artifacts,
+                lean=True,
             )
-            return 127  # Command not found exit code
-
-    # 4. Parse dbt artifacts (reuse manifest if already parsed for job_name)
-    try:
-        run_results = parse_run_results(str(get_run_results_path(config.project_dir)))
-        if manifest is None:
-            manifest = parse_manifest(str(get_manifest_path(config.project_dir)))
+            if manifest_future is not None:
+                manifest = manifest_future.result()
     except FileNotFoundError as e:
         click.echo(f"Error: {e}", err=True)
         return 1
+    finally:
+        if target_path is not None:
+            shutil.rmtree(target_path, ignore_errors=True)
+        # START must reach the backend before the terminal event; it has had
+        # the whole dbt run to do so, so this rarely waits
+        if start_emitter is not None:
+            start_emitter.join()
+    # Either reused from job-name resolution or parsed above
+    assert manifest is not None
+
+    # dbt has finished and artifacts are read - a single clock read serves as
+    # both the lineage event time and the terminal event time. It is measured
+    # from START on the monotonic clock, so a wall-clock step during a long
+    # dbt run (e.g., NTP correction) can't put COMPLETE/FAIL before START.
+    completed_timestamp = start_timestamp + timedelta(
+        seconds=time.monotonic() - start_monotonic
+    )
 
-    # 5-8. Construct lineage events (only for run/build commands)
+    # 5-8. Prepare lineage events (only for run/build commands)
     # Test command only emits test events - tests validate inputs, don't produce outputs
-    lineage_events: list[Any] = []
+    lineage_events: Iterable[Any] = ()
+    lineage_count = 0
     model_ids: set[str] = set()
     if config.emit_lineage_events:
-        # Determine which models to emit lineage for
-        model_ids = get_executed_models(run_results)
-
-        # Extract model lineage for executed models
-        model_lineages = extract_all_model_lineage(
+        # Executed models, their lineage and runtime metrics in one pass
+        run_data = extract_run_data(
+            run_results,
             manifest,
-            model_ids=model_ids,
             namespace_override=config.dataset_namespace,
         )
+        model_ids = run_data.executed_models
 
-        # Extract runtime metrics (only for run/build commands)
+        # Runtime metrics only for run/build commands
         execution_results = None
         if config.include_runtime_metrics:
-            execution_results = extract_model_results(run_results)
+            execution_results = run_data.execution_results
 
-        # Construct lineage events (each model gets unique runId)
-        event_time = datetime.now(timezone.utc).isoformat()
+        # Lineage events (each model gets unique runId) are built lazily
+        # while earlier batches are already being emitted
+        event_time = completed_timestamp.isoformat()
         wrapping_parent = ParentRunMetadata(
             run_id=wrapping_run_id,
             job_name=job_name,
@@ -504,8 +584,9 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
                 orchestrator_parent.root_job_namespace if orchestrator_parent else None
             ),
         )
-        lineage_events = construct_lineage_events(
-            model_lineages=model_lineages,
+        lineage_count = len(run_data.lineages)
+        lineage_events = iter_lineage_events(
+            model_lineages=run_data.lineages,
             job_namespace=config.job_namespace,
             producer=PRODUCER,
             event_time=event_time,
@@ -529,26 +610,32 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
         )
 
     # 10. Create terminal event (COMPLETE or FAIL)
-    terminal_timestamp = datetime.now(timezone.utc)
     terminal_type = "COMPLETE" if dbt_exit_code == 0 else "FAIL"
     terminal_event = create_wrapping_event(
         terminal_type,
         wrapping_run_id,
         job_name,
         config.job_namespace,
-        terminal_timestamp,
+        completed_timestamp,
         parent=orchestrator_parent,
     )
 
-    # 11. Batch emit all events: lineage + tests (if any) + terminal
-    all_events = [*lineage_events, *test_events, terminal_event]
+    # 11. Batch emit all events: [START] + lineage + tests (if any) + terminal
+    leading_events = [start_event] if batch_start else []
+    all_events = chain(leading_events, lineage_events, test_events, [terminal_event])
 
     try:
-        emit_events(all_events, config.endpoint, config.api_key)
+        emit_events(
+            all_events,
+            config.endpoint,
+            config.api_key,
+            compression=config.emit_compression,
+            max_workers=config.emit_concurrency,
+        )
         # Build success message based on what was emitted
         parts = []
-        if lineage_events:
-            parts.append(f"{len(lineage_events)} lineage events")
+        if lineage_count:
+            parts.append(f"{lineage_count} lineage events")
         if test_events:
             parts.append(f"{len(test_events)} test events")
         parts.append("terminal event")
@@ -564,12 +651,113 @@ def execute_workflow(config: WorkflowConfig) -> int:  # noqa: PLR0912, PLR0915
     return dbt_exit_code
 
 
+def emit_start_event(config: WorkflowConfig, start_event: Any) -> None:
+    """Emit the START event on its own, warning instead of raising on failure.
+
+    Intended to run in a background thread while dbt executes.
+
+    Args:
+        config: WorkflowConfig with the endpoint and emission settings.
+        start_event: START wrapping event to emit.
+    """
+    from .emitter import emit_events
+
+    try:
+        emit_events(
+            [start_event],
+            config.endpoint,
+            config.api_key,
+            compression=config.emit_compression,
+            max_workers=config.emit_concurrency,
+        )
+    except (ConnectionError, TimeoutError, ValueError) as e:
+        click.echo(f"Warning: Failed to emit START event: {e}", err=True)
+
+
+def create_scratch_target(project_dir: str) -> str:
+    """Create a temporary dbt target directory for a single workflow run.
+
+    The directory is created under SCRATCH_TARGET_PARENT when it exists
+    (tmpfs on Linux), so dbt's artifact writes never reach disk. dbt's
+    partial parsing state is copied in from the project's target directory,
+    if present, so moving the target does not force a full project re-parse.
+
+    Args:
+        project_dir: Path to dbt project directory.
+
+    Returns:
+        Path of the new directory. The caller is responsible for removing it.
+    """
+    parent = SCRATCH_TARGET_PARENT if os.path.isdir(SCRATCH_TARGET_PARENT) else None
+    target_path = tempfile.mkdtemp(prefix="dbt-correlator-", dir=parent)
+    partial_parse = Path(project_dir) / "target" / PARTIAL_PARSE_FILENAME
+    try:
+        shutil.copyfile(partial_parse, Path(target_path) / PARTIAL_PARSE_FILENAME)
+    except OSError:
+        logger.debug("No partial parse state to seed from %s", partial_parse)
+    return target_path
+
+
+def _stat_or_none(path: Path) -> Optional[tuple[int, int]]:
+    """Get artifact stat key, or None if the artifact does not exist yet."""
+    try:
+        return get_stat_key(path)
+    except FileNotFoundError:
+        return None
+
+
+def prefetch_manifest(
+    manifest_path: Path,
+    baseline: Optional[tuple[int, int]],
+    stop: threading.Event,
+    persistent_cache: bool = False,
+    lean: bool = False,
+    poll_interval: float = MANIFEST_POLL_INTERVAL_SECONDS,
+) -> None:
+    """Parse manifest.json as soon as a running dbt command rewrites it.
+
+    Polls the manifest's stat key until it differs from the baseline taken
+    before dbt started, then parses it once. The parsed data lands in the
+    artifact cache, so the workflow's own parse_manifest call after dbt exits
+    is a cache hit. Partially written files fail to parse and are retried
+    once their stat key changes; a version that changes again before dbt
+    exits simply misses the cache and is parsed normally.
+
+    Intended to run in a background thread while dbt executes.
+
+    Args:
+        manifest_path: Path to manifest.json in the dbt target directory.
+        baseline: Stat key of the manifest before dbt started (None if absent).
+        stop: Event set by the workflow when dbt has exited.
+        persistent_cache: Whether to also write the on-disk sidecar cache.
+        lean: Whether to keep only the manifest fields dbt-correlator reads.
+        poll_interval: Seconds between stat checks.
+    """
+    from .parser import parse_manifest
+
+    skip = baseline
+    while not stop.wait(poll_interval):
+        current = _stat_or_none(manifest_path)
+        if current is None or current == skip:
+            continue
+        try:
+            parse_manifest(
+                str(manifest_path), persistent_cache=persistent_cache, lean=lean
+            )
+        except (FileNotFoundError, ValueError, KeyError) as e:
+            # Most likely caught dbt mid-write - retry once the file changes
+            logger.debug("Manifest prefetch failed, will retry: %s", e)
+            skip = current
+            continue
+        return
+
+
 def run_dbt_command(
     command: str,
     project_dir: str,
     profiles_dir: str,
     dbt_args: tuple[str, ...] = (),
-) -> subprocess.CompletedProcess[bytes]:
+) -> int:
     """Execute a dbt command as subprocess.
 
     Runs dbt with the specified command (test, run, build) using the
@@ -583,14 +771,13 @@ def run_dbt_command(
         dbt_args: Additional arguments to pass to dbt command.
 
     Returns:
-        CompletedProcess with returncode from dbt execution.
+        Exit code from dbt execution.
 
     Raises:
         FileNotFoundError: If dbt executable is not found in PATH.
 
     Example:
-        >>> result = run_dbt_command("test", ".", "~/.dbt", ("--select", "my_model"))
-        >>> result.returncode
+        >>> run_dbt_command("test", ".", "~/.dbt", ("--select", "my_model"))
         0
     """
     # Convert paths to absolute for consistent behavior regardless of cwd
@@ -609,19 +796,42 @@ def run_dbt_command(
     ]
 
     try:
-        # Stream output to console (no capture)
         # Use absolute project dir as cwd for dbt to find dbt_project.yml
-        return subprocess.run(
-            cmd,
-            check=False,  # Don't raise on non-zero exit
-            cwd=abs_project_dir,
-        )
+        return _run_dbt(cmd, abs_project_dir)
     except FileNotFoundError as e:
         raise FileNotFoundError(
             f"dbt executable not found. Please install dbt-core: {e}"
         ) from e
 
 
+def _run_dbt(cmd: list[str], cwd: str) -> int:
+    """Launch dbt and wait for it, returning its exit code.
+
+    The only place the CLI spawns a process, so tests can replace it with an
+    in-process fake.
+
+    Args:
+        cmd: Full dbt command line.
+        cwd: Working directory for dbt.
+
+    Returns:
+        Exit code from dbt.
+
+    Raises:
+        FileNotFoundError: If the dbt executable is not found in PATH.
+    """
+    # Stream output to console (no capture)
+    # File descriptors opened by Python are non-inheritable (PEP 446), so
+    # there is nothing to close in the child; skipping the close_fds pass
+    # also lets CPython launch dbt with posix_spawn
+    return subprocess.run(
+        cmd,
+        check=False,  # Don't raise on non-zero exit
+        cwd=cwd,
+        close_fds=False,
+    ).returncode
+
+
 def get_default_job_name(manifest: Any, command: str) -> str:
     """Get default job name matching dbt-ol convention.
 
@@ -660,70 +870,140 @@ def cli() -> None:
     pass
 
 
+# Parameter types shared by every workflow command. Click types are
+# stateless, so one instance serves all commands instead of one per command.
+_CONFIG_FILE_TYPE = click.Path(dir_okay=False)
+_PROJECT_DIR_TYPE = click.Path(exists=True, file_okay=False, dir_okay=True)
+_PROFILES_DIR_TYPE = click.Path(file_okay=False, dir_okay=True)
+_EMIT_COMPRESSION_TYPE = click.Choice(EMIT_COMPRESSIONS)
+_EMIT_CONCURRENCY_TYPE = click.IntRange(min=1)
+
+
+def workflow_options(command: str) -> Callable[[F], F]:
+    """Apply the options shared by the test, run and build commands.
+
+    Args:
+        command: dbt command name, used in command-specific help text.
+
+    Returns:
+        Decorator adding the shared Click options and dbt_args argument.
+    """
+    decorators = [
+        click.option(
+            "--config",
+            "-c",
+            callback=load_config_callback,
+            is_eager=True,
+            expose_value=False,
+            help="Path to config file (default: .dbt-correlator.yml)",
+            type=_CONFIG_FILE_TYPE,
+        ),
+        click.option(
+            "--project-dir",
+            default=".",
+            help="Path to dbt project directory (default: current directory)",
+            type=_PROJECT_DIR_TYPE,
+        ),
+        click.option(
+            "--profiles-dir",
+            default="~/.dbt",
+            help="Path to dbt profiles directory (default: ~/.dbt)",
+            type=_PROFILES_DIR_TYPE,
+        ),
+        click.option(
+            "--correlator-endpoint",
+            envvar="CORRELATOR_ENDPOINT",
+            default=None,
+            help="OpenLineage API endpoint URL. Works with Correlator or any OL-compatible "
+            "backend (env: CORRELATOR_ENDPOINT or OPENLINEAGE_URL)",
+            type=str,
+        ),
+        click.option(
+            "--openlineage-namespace",
+            envvar="OPENLINEAGE_NAMESPACE",
+            default="dbt",
+            help="Job namespace for OpenLineage events (default: dbt, env: OPENLINEAGE_NAMESPACE)",
+            type=str,
+        ),
+        click.option(
+            "--correlator-api-key",
+            envvar="CORRELATOR_API_KEY",
+            default=None,
+            help="Optional API key for authentication (env: CORRELATOR_API_KEY or OPENLINEAGE_API_KEY)",
+            type=str,
+        ),
+        click.option(
+            "--job-name",
+            default=None,
+            help=f"Job name for OpenLineage events (default: {{project_name}}.{command})",
+            type=str,
+        ),
+        click.option(
+            "--dataset-namespace",
+            envvar="DBT_CORRELATOR_NAMESPACE",
+            default=None,
+            help="Dataset namespace override (default: {adapter}://{database})",
+            type=str,
+        ),
+        click.option(
+            "--skip-dbt-run",
+            is_flag=True,
+            default=False,
+            help=f"Skip running dbt {command}, only emit OpenLineage events from existing artifacts",
+        ),
+        click.option(
+            "--cache-artifacts/--no-cache-artifacts",
+            default=False,
+            help="Cache parsed dbt artifacts in hidden sidecar files in target/ to "
+            "speed up re-parsing (default: off)",
+        ),
+        click.option(
+            "--scratch-target",
+            is_flag=True,
+            default=False,
+            help="Have dbt write its artifacts to a temporary (RAM-backed where "
+            "available) directory that is removed after parsing, leaving target/ "
+            "untouched",
+        ),
+        click.option(
+            "--manifest-lean",
+            is_flag=True,
+            default=False,
+            help="Keep only the manifest fields needed for events, reducing memory "
+            "use for large projects",
+        ),
+        click.option(
+            "--eager-start/--batch-start",
+            default=None,
+            help="Emit START before dbt runs, or batch it with the final events "
+            "to save a request (default: eager, batch with --skip-dbt-run)",
+        ),
+        click.option(
+            "--emit-compression",
+            type=_EMIT_COMPRESSION_TYPE,
+            default="none",
+            help="Compress event payloads sent to the backend (default: none)",
+        ),
+        click.option(
+            "--emit-concurrency",
+            type=_EMIT_CONCURRENCY_TYPE,
+            default=EMIT_MAX_WORKERS,
+            help="Maximum number of event chunks POSTed concurrently; lower it "
+            "to stay within backend rate limits (default: 8)",
+        ),
+        click.argument("dbt_args", nargs=-1, type=click.UNPROCESSED),
+    ]
+
+    def decorator(func: F) -> F:
+        for option in reversed(decorators):
+            func = option(func)
+        return func
+
+    return decorator
+
+
 @cli.command()
-@click.option(
-    "--config",
-    "-c",
-    callback=load_config_callback,
-    is_eager=True,
-    expose_value=False,
-    help="Path to config file (default: .dbt-correlator.yml)",
-    type=click.Path(dir_okay=False),
-)
-@click.option(
-    "--project-dir",
-    default=".",
-    help="Path to dbt project directory (default: current directory)",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--profiles-dir",
-    default="~/.dbt",
-    help="Path to dbt profiles directory (default: ~/.dbt)",
-    type=click.Path(file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--correlator-endpoint",
-    envvar="CORRELATOR_ENDPOINT",
-    default=None,
-    help="OpenLineage API endpoint URL. Works with Correlator or any OL-compatible "
-    "backend (env: CORRELATOR_ENDPOINT or OPENLINEAGE_URL)",
-    type=str,
-)
-@click.option(
-    "--openlineage-namespace",
-    envvar="OPENLINEAGE_NAMESPACE",
-    default="dbt",
-    help="Job namespace for OpenLineage events (default: dbt, env: OPENLINEAGE_NAMESPACE)",
-    type=str,
-)
-@click.option(
-    "--correlator-api-key",
-    envvar="CORRELATOR_API_KEY",
-    default=None,
-    help="Optional API key for authentication (env: CORRELATOR_API_KEY or OPENLINEAGE_API_KEY)",
-    type=str,
-)
-@click.option(
-    "--job-name",
-    default=None,
-    help="Job name for OpenLineage events (default: {project_name}.test)",
-    type=str,
-)
-@click.option(
-    "--dataset-namespace",
-    envvar="DBT_CORRELATOR_NAMESPACE",
-    default=None,
-    help="Dataset namespace override (default: {adapter}://{database})",
-    type=str,
-)
-@click.option(
-    "--skip-dbt-run",
-    is_flag=True,
-    default=False,
-    help="Skip running dbt test, only emit OpenLineage event from existing artifacts",
-)
-@click.argument("dbt_args", nargs=-1, type=click.UNPROCESSED)
+@workflow_options("test")
 def test(
     project_dir: str,
     profiles_dir: str,
@@ -733,6 +1013,12 @@ def test(
     job_name: Optional[str],
     dataset_namespace: Optional[str],
     skip_dbt_run: bool,
+    cache_artifacts: bool,
+    scratch_target: bool,
+    manifest_lean: bool,
+    eager_start: Optional[bool],
+    emit_compression: str,
+    emit_concurrency: int,
     dbt_args: tuple[str, ...],
 ) -> None:
     """Run dbt test and emit OpenLineage events with test results.
@@ -765,7 +1051,8 @@ def test(
     # Resolve credentials with dbt-ol compatible env var fallbacks
     endpoint, api_key = resolve_credentials(correlator_endpoint, correlator_api_key)
 
-    config = WorkflowConfig.for_test(
+    config = WorkflowConfig.for_command(
+        "test",
         project_dir=project_dir,
         profiles_dir=profiles_dir,
         endpoint=endpoint,
@@ -775,74 +1062,18 @@ def test(
         dataset_namespace=dataset_namespace,
         skip_dbt_run=skip_dbt_run,
         dbt_args=dbt_args,
+        cache_artifacts=cache_artifacts,
+        scratch_target=scratch_target,
+        manifest_lean=manifest_lean,
+        eager_start=eager_start,
+        emit_compression=emit_compression,
+        emit_concurrency=emit_concurrency,
     )
     sys.exit(execute_workflow(config))
 
 
 @cli.command()
-@click.option(
-    "--config",
-    "-c",
-    callback=load_config_callback,
-    is_eager=True,
-    expose_value=False,
-    help="Path to config file (default: .dbt-correlator.yml)",
-    type=click.Path(dir_okay=False),
-)
-@click.option(
-    "--project-dir",
-    default=".",
-    help="Path to dbt project directory (default: current directory)",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--profiles-dir",
-    default="~/.dbt",
-    help="Path to dbt profiles directory (default: ~/.dbt)",
-    type=click.Path(file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--correlator-endpoint",
-    envvar="CORRELATOR_ENDPOINT",
-    default=None,
-    help="OpenLineage API endpoint URL. Works with Correlator or any OL-compatible "
-    "backend (env: CORRELATOR_ENDPOINT or OPENLINEAGE_URL)",
-    type=str,
-)
-@click.option(
-    "--openlineage-namespace",
-    envvar="OPENLINEAGE_NAMESPACE",
-    default="dbt",
-    help="Job namespace for OpenLineage events (default: dbt, env: OPENLINEAGE_NAMESPACE)",
-    type=str,
-)
-@click.option(
-    "--correlator-api-key",
-    envvar="CORRELATOR_API_KEY",
-    default=None,
-    help="Optional API key for authentication (env: CORRELATOR_API_KEY or OPENLINEAGE_API_KEY)",
-    type=str,
-)
-@click.option(
-    "--job-name",
-    default=None,
-    help="Job name for OpenLineage events (default: {project_name}.run)",
-    type=str,
-)
-@click.option(
-    "--dataset-namespace",
-    envvar="DBT_CORRELATOR_NAMESPACE",
-    default=None,
-    help="Dataset namespace override (default: {adapter}://{database})",
-    type=str,
-)
-@click.option(
-    "--skip-dbt-run",
-    is_flag=True,
-    default=False,
-    help="Skip running dbt, only emit OpenLineage events from existing artifacts",
-)
-@click.argument("dbt_args", nargs=-1, type=click.UNPROCESSED)
+@workflow_options("run")
 def run(
     project_dir: str,
     profiles_dir: str,
@@ -852,6 +1083,12 @@ def run(
     job_name: Optional[str],
     dataset_namespace: Optional[str],
     skip_dbt_run: bool,
+    cache_artifacts: bool,
+    scratch_target: bool,
+    manifest_lean: bool,
+    eager_start: Optional[bool],
+    emit_compression: str,
+    emit_concurrency: int,
     dbt_args: tuple[str, ...],
 ) -> None:
     """Run dbt run and emit OpenLineage lineage events with runtime metrics.
@@ -883,7 +1120,8 @@ def run(
     # Resolve credentials with dbt-ol compatible env var fallbacks
     endpoint, api_key = resolve_credentials(correlator_endpoint, correlator_api_key)
 
-    config = WorkflowConfig.for_run(
+    config = WorkflowConfig.for_command(
+        "run",
         project_dir=project_dir,
         profiles_dir=profiles_dir,
         endpoint=endpoint,
@@ -893,74 +1131,18 @@ def run(
         dataset_namespace=dataset_namespace,
         skip_dbt_run=skip_dbt_run,
         dbt_args=dbt_args,
+        cache_artifacts=cache_artifacts,
+        scratch_target=scratch_target,
+        manifest_lean=manifest_lean,
+        eager_start=eager_start,
+        emit_compression=emit_compression,
+        emit_concurrency=emit_concurrency,
     )
     sys.exit(execute_workflow(config))
 
 
 @cli.command()
-@click.option(
-    "--config",
-    "-c",
-    callback=load_config_callback,
-    is_eager=True,
-    expose_value=False,
-    help="Path to config file (default: .dbt-correlator.yml)",
-    type=click.Path(dir_okay=False),
-)
-@click.option(
-    "--project-dir",
-    default=".",
-    help="Path to dbt project directory (default: current directory)",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--profiles-dir",
-    default="~/.dbt",
-    help="Path to dbt profiles directory (default: ~/.dbt)",
-    type=click.Path(file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--correlator-endpoint",
-    envvar="CORRELATOR_ENDPOINT",
-    default=None,
-    help="OpenLineage API endpoint URL. Works with Correlator or any OL-compatible "
-    "backend (env: CORRELATOR_ENDPOINT or OPENLINEAGE_URL)",
-    type=str,
-)
-@click.option(
-    "--openlineage-namespace",
-    envvar="OPENLINEAGE_NAMESPACE",
-    default="dbt",
-    help="Job namespace for OpenLineage events (default: dbt, env: OPENLINEAGE_NAMESPACE)",
-    type=str,
-)
-@click.option(
-    "--correlator-api-key",
-    envvar="CORRELATOR_API_KEY",
-    default=None,
-    help="Optional API key for authentication (env: CORRELATOR_API_KEY or OPENLINEAGE_API_KEY)",
-    type=str,
-)
-@click.option(
-    "--job-name",
-    default=None,
-    help="Job name for OpenLineage events (default: {project_name}.build)",
-    type=str,
-)
-@click.option(
-    "--dataset-namespace",
-    envvar="DBT_CORRELATOR_NAMESPACE",
-    default=None,
-    help="Dataset namespace override (default: {adapter}://{database})",
-    type=str,
-)
-@click.option(
-    "--skip-dbt-run",
-    is_flag=True,
-    default=False,
-    help="Skip running dbt, only emit OpenLineage events from existing artifacts",
-)
-@click.argument("dbt_args", nargs=-1, type=click.UNPROCESSED)
+@workflow_options("build")
 def build(
     project_dir: str,
     profiles_dir: str,
@@ -970,6 +1152,12 @@ def build(
     job_name: Optional[str],
     dataset_namespace: Optional[str],
     skip_dbt_run: bool,
+    cache_artifacts: bool,
+    scratch_target: bool,
+    manifest_lean: bool,
+    eager_start: Optional[bool],
+    emit_compression: str,
+    emit_concurrency: int,
     dbt_args: tuple[str, ...],
 ) -> None:
     """Run dbt build and emit both lineage events and test results.
@@ -1005,7 +1193,8 @@ def build(
     # Resolve credentials with dbt-ol compatible env var fallbacks
     endpoint, api_key = resolve_credentials(correlator_endpoint, correlator_api_key)
 
-    config = WorkflowConfig.for_build(
+    config = WorkflowConfig.for_command(
+        "build",
         project_dir=project_dir,
         profiles_dir=profiles_dir,
         endpoint=endpoint,
@@ -1015,6 +1204,12 @@ def build(
         dataset_namespace=dataset_namespace,
         skip_dbt_run=skip_dbt_run,
         dbt_args=dbt_args,
+        cache_artifacts=cache_artifacts,
+        scratch_target=scratch_target,
+        manifest_lean=manifest_lean,
+        eager_start=eager_start,
+        emit_compression=emit_compression,
+        emit_concurrency=emit_concurrency,
     )
     sys.exit(execute_workflow(config))
 
@@ -12,14 +12,30 @@ See docs/CONFIGURATION.md for detailed documentation.
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-import yaml
+from .cache import get_stat_key
+
+# PyYAML is imported on first config load rather than at import time, so
+# `dbt-correlator --help` and `--version` don't pay for it
+if TYPE_CHECKING:
+    import yaml
 
 # Default config file names (searched in order)
 DEFAULT_CONFIG_FILENAMES = (".dbt-correlator.yml", ".dbt-correlator.yaml")
 
+# Maximum number of distinct config file versions kept in memory
+CONFIG_CACHE_SIZE = 8
+
+# Supported request body encodings for event emission ("none" sends identity,
+# "zstd" requires the optional zstandard package)
+EMIT_COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Default maximum number of concurrent POSTs when a batch is split into chunks
+EMIT_MAX_WORKERS = 8
+
 # Mapping from YAML nested keys to CorrelatorConfig field names
 CONFIG_FIELD_MAPPING: dict[tuple[str, str], str] = {
     ("correlator", "endpoint"): "correlator_endpoint",
@@ -42,6 +58,14 @@ CONFIG_TO_CLI_MAPPING: dict[str, str] = {
     "job_name": "job_name",
 }
 
+# Mapping from YAML nested keys straight to CLI option names, composed once
+# from the two mappings above so config loading needs a single pass
+YAML_TO_CLI_MAPPING: dict[tuple[str, str], str] = {
+    yaml_key: CONFIG_TO_CLI_MAPPING[field_name]
+    for yaml_key, field_name in CONFIG_FIELD_MAPPING.items()
+    if field_name in CONFIG_TO_CLI_MAPPING
+}
+
 
 def _interpolate_env_vars(value: str) -> str:
     """Expand ${VAR_NAME} patterns in string values.
@@ -91,6 +115,39 @@ def _interpolate_dict_values(data: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+@lru_cache(maxsize=1)
+def get_yaml_safe_loader() -> "type[yaml.SafeLoader]":
+    """Get the fastest available safe YAML loader.
+
+    Returns:
+        yaml.CSafeLoader when PyYAML was built with libyaml (several times
+        faster), otherwise yaml.SafeLoader. Both construct the same safe types.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _parse_yaml_file(path: str, _mtime_ns: int, _size: int) -> Any:
+    """Read and parse a YAML file (memoized on resolved path and file stat).
+
+    The stat arguments are only part of the cache key, so a rewritten file
+    is parsed again.
+
+    Returns the raw parsed data before environment variable interpolation,
+    so changes to the environment are always picked up. Shared between
+    callers - do not mutate.
+
+    Raises:
+        yaml.YAMLError: If the file contains invalid YAML.
+    """
+    import yaml
+
+    text = Path(path).read_text(encoding="utf-8")
+    return yaml.load(text, Loader=get_yaml_safe_loader())  # nosec B506
+
+
 def load_yaml_config(config_path: Optional[Path] = None) -> dict[str, Any]:
     """Load configuration from YAML file.
 
@@ -101,6 +158,9 @@ def load_yaml_config(config_path: Optional[Path] = None) -> dict[str, Any]:
 
     Environment variables in the format ${VAR_NAME} are expanded.
 
+    The parsed YAML is cached per file version (path, mtime, size), so
+    repeated loads of an unchanged file within a process skip YAML parsing.
+
     Args:
         config_path: Optional explicit path to config file.
                     If None, searches default locations.
@@ -127,21 +187,26 @@ def load_yaml_config(config_path: Optional[Path] = None) -> dict[str, Any]:
         for filename in DEFAULT_CONFIG_FILENAMES:
             paths_to_try.append(Path.home() / filename)
 
-    # Find first existing config file
+    # Find first existing config file. The stat doubles as the existence
+    # check and the cache key, so each candidate costs one syscall.
     found_path: Optional[Path] = None
     for path in paths_to_try:
-        if path.exists():
-            found_path = path
-            break
+        try:
+            stat_key = get_stat_key(path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        found_path = path
+        break
 
     # No config file found
     if found_path is None:
         return {}
 
     # Read and parse YAML
+    import yaml
+
     try:
-        content = found_path.read_text(encoding="utf-8")
-        data = yaml.safe_load(content)
+        data = _parse_yaml_file(os.path.abspath(found_path), *stat_key)
 
         # Handle empty file or file with only comments
         if data is None:
@@ -183,11 +248,39 @@ def flatten_config(nested: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
-def get_run_results_path(project_dir: str) -> Path:
+def build_default_map(nested: dict[str, Any]) -> dict[str, Any]:
+    """Map nested YAML config directly to Click option names.
+
+    Equivalent to flatten_config() followed by renaming keys through
+    CONFIG_TO_CLI_MAPPING, without building the intermediate flat dict.
+
+    Args:
+        nested: Nested dict from YAML (e.g., {"correlator": {"endpoint": "..."}})
+
+    Returns:
+        Dict suitable for Click's default_map, keyed by CLI option name.
+
+    Example:
+        >>> build_default_map({"dbt": {"project_dir": "./proj"}})
+        {"project_dir": "./proj"}
+    """
+    result: dict[str, Any] = {}
+
+    for (section, key), click_key in YAML_TO_CLI_MAPPING.items():
+        values = nested.get(section)
+        if isinstance(values, dict) and key in values:
+            result[click_key] = values[key]
+
+    return result
+
+
+def get_run_results_path(project_dir: str, target_path: Optional[str] = None) -> Path:
     """Get path to dbt run_results.json file.
 
     Args:
         project_dir: Path to dbt project directory.
+        target_path: dbt target directory, if overridden with --target-path.
+            Defaults to the project's target directory.
 
     Returns:
         Path to run_results.json in target directory.
@@ -196,14 +289,18 @@ def get_run_results_path(project_dir: str) -> Path:
         >>> get_run_results_path(".")
         PosixPath('target/run_results.json')
     """
+    if target_path is not None:
+        return Path(target_path) / "run_results.json"
     return Path(project_dir) / "target" / "run_results.json"
 
 
-def get_manifest_path(project_dir: str) -> Path:
+def get_manifest_path(project_dir: str, target_path: Optional[str] = None) -> Path:
     """Get path to dbt manifest.json file.
 
     Args:
         project_dir: Path to dbt project directory.
+        target_path: dbt target directory, if overridden with --target-path.
+            Defaults to the project's target directory.
 
     Returns:
         Path to manifest.json in target directory.
@@ -212,4 +309,6 @@ def get_manifest_path(project_dir: str) -> Path:
         >>> get_manifest_path(".")
         PosixPath('target/manifest.json')
     """
+    if target_path is not None:
+        return Path(target_path) / "manifest.json"
     return Path(project_dir) / "target" / "manifest.json"
@@ -41,11 +41,16 @@ OpenLineage Specification:
     - Run cycle: https://openlineage.io/docs/spec/run-cycle
 """
 
+import gzip
 import logging
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Union, cast
 
 import attr
 import requests
@@ -72,17 +77,28 @@ from openlineage.client.generated.parent_run import (
     RootRun,
 )
 from openlineage.client.generated.parent_run import Run as ParentRun
+from requests.adapters import HTTPAdapter
 from uuid6 import uuid7
 
-from . import __version__
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+from . import __version__, jsonio
+from .cache import memoize_derived
+from .config import EMIT_COMPRESSIONS, EMIT_MAX_WORKERS
 from .parser import (
+    DATACLASS_SLOTS,
     Manifest,
     ModelExecutionResult,
     ModelLineage,
     RunResults,
     build_dataset_info,
+    derived_key,
+    extract_project_name,
+    manifest_key,
     map_test_status,
-    resolve_test_to_model_node,
 )
 
 logger = logging.getLogger(__name__)
@@ -90,8 +106,45 @@ logger = logging.getLogger(__name__)
 # Plugin version for producer field
 PRODUCER = f"https://github.com/correlator-io/correlator-dbt/{__version__}"
 
+# Run states accepted by create_wrapping_event, by event type name
+WRAPPING_EVENT_STATES = {
+    "START": RunState.START,
+    "COMPLETE": RunState.COMPLETE,
+    "FAIL": RunState.FAIL,
+}
+
+# HTTP connection pool sizing for the shared emission session
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+
+# Fastest gzip level - OpenLineage batches are highly repetitive, so even
+# level 1 shrinks them by an order of magnitude
+GZIP_COMPRESS_LEVEL = 1
+
+# zstd's default level - a better ratio than gzip level 1 at similar speed
+ZSTD_COMPRESS_LEVEL = 3
+
+# Events per HTTP POST
+EMIT_BATCH_SIZE = 100
+
+# Scalar types passed through unchanged by _to_primitive (exact types, so
+# str-based Enums are still converted to their values)
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Attribute names of each attrs class seen by _to_primitive
+_ATTRS_FIELD_NAMES: dict[type, Optional[tuple[str, ...]]] = {}
 
-@dataclass
+# Endpoints that rejected a compressed body with 415 Unsupported Media Type.
+# Later requests to them in this process are sent uncompressed.
+_uncompressed_endpoints: set[str] = set()
+_uncompressed_endpoints_lock = threading.Lock()
+
+# A test's (model unique_id, (namespace, name)), or the reason it can't be
+# mapped to a dataset
+_TestDataset = Union[tuple[str, tuple[str, str]], str]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ParentRunMetadata:
     """Parent run context for establishing job hierarchy.
 
@@ -110,24 +163,61 @@ class ParentRunMetadata:
     root_job_namespace: Optional[str] = None
 
 
-def _serialize_attr_value(
-    inst: Any,  # noqa: ARG001
-    field: Any,  # noqa: ARG001
-    value: Any,
-) -> Any:
-    """Serialize attrs field values, converting Enums to their string values.
+@dataclass(**DATACLASS_SLOTS)
+class _TestRow:
+    """A test result with the test metadata needed for its assertion.
+
+    Internal form of the records returned by group_tests_by_dataset(), one
+    per test result - cheaper to build and read than a dict.
+    """
+
+    unique_id: str
+    status: str
+    failures: Optional[int]
+    message: Optional[str]
+    execution_time_seconds: float
+    test_name: str
+    column_name: Optional[str]
+    model_unique_id: str
+
+
+def _attrs_field_names(cls: type) -> Optional[tuple[str, ...]]:
+    """Get the attribute names of an attrs class (None for other classes).
+
+    Resolved once per class, so serializing thousands of facets doesn't
+    repeat the attrs introspection attr.asdict() performs per instance.
+    """
+    try:
+        return _ATTRS_FIELD_NAMES[cls]
+    except KeyError:
+        names = tuple(f.name for f in attr.fields(cls)) if attr.has(cls) else None
+        _ATTRS_FIELD_NAMES[cls] = names
+        return names
+
+
+def _to_primitive(value: Any) -> Any:
+    """Convert an attrs object graph to JSON-ready builtins.
 
-    This function is used as the value_serializer for attr.asdict() to handle
-    Enum types (like EventType) that are not JSON serializable by default.
+    Produces the same structure as attr.asdict() for OpenLineage events:
+    attrs instances become dicts, tuples and sets become lists, and Enums
+    (like EventType) become their values.
 
     Args:
-        inst: The attrs instance being serialized (unused, required by API).
-        field: The attrs field being serialized (unused, required by API).
-        value: The value to serialize.
+        value: attrs instance, container or scalar.
 
     Returns:
-        The serialized value (Enum.value for Enums, original value otherwise).
+        Equivalent structure of dicts, lists and scalars.
     """
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
+    names = _attrs_field_names(value_type)
+    if names is not None:
+        return {name: _to_primitive(getattr(value, name)) for name in names}
+    if isinstance(value, dict):
+        return {_to_primitive(k): _to_primitive(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_primitive(item) for item in value]
     if isinstance(value, Enum):
         return value.value
     return value
@@ -146,7 +236,7 @@ def _serialize_event_with_extended_fields(event: RunEvent) -> dict[str, Any]:
     Returns:
         Serialized event dict with extended fields merged into assertions.
     """
-    event_dict = attr.asdict(event, value_serializer=_serialize_attr_value)  # type: ignore[call-arg]
+    event_dict: dict[str, Any] = _to_primitive(event)
 
     # Merge extended fields into assertions
     for input_dataset in event_dict.get("inputs", []):
@@ -248,7 +338,7 @@ def create_wrapping_event(
         run_facets["parent"] = _build_parent_facet(parent=parent, producer=PRODUCER)
 
     return RunEvent(  # type: ignore[call-arg]
-        eventType=getattr(RunState, event_type),
+        eventType=WRAPPING_EVENT_STATES[event_type],
         eventTime=timestamp.isoformat(),
         run=Run(runId=run_id, facets=run_facets if run_facets else None),  # type: ignore[call-arg]
         job=Job(namespace=job_namespace, name=job_name),  # type: ignore[call-arg]
@@ -294,6 +384,33 @@ def group_tests_by_dataset(
         Dataset: duckdb://jaffle_shop|main.orders, Tests: 5
     """
     grouped: dict[str, list[dict[str, Any]]] = {}
+    for (namespace, name), row in _iter_test_rows(
+        run_results, manifest, namespace_override
+    ):
+        # Use pipe separator to avoid conflicts with "://" in namespace URLs
+        grouped.setdefault(f"{namespace}|{name}", []).append(asdict(row))
+    return grouped
+
+
+def _iter_test_rows(
+    run_results: RunResults,
+    manifest: Manifest,
+    namespace_override: Optional[str],
+) -> Iterator[tuple[tuple[str, str], _TestRow]]:
+    """Yield ((namespace, name), test row) for each test mapped to a dataset.
+
+    Single pass over the results that group_tests_by_dataset() collects and
+    _build_test_inputs() folds straight into assertions. Results that can't
+    be mapped are logged and skipped.
+    """
+    # Depends only on the manifest, so it is shared (read-only) by every
+    # run_results read against the same manifest version
+    test_datasets = memoize_derived(
+        manifest_key("test_datasets", manifest, namespace_override),
+        lambda: _build_test_datasets(manifest, namespace_override),
+    )
+    # Model datasets for results that are not test nodes (resolved below)
+    model_datasets: dict[str, tuple[str, str]] = {}
 
     for result in run_results.results:
         # Get test node from manifest
@@ -308,37 +425,110 @@ def group_tests_by_dataset(
         test_kwargs = test_metadata.get("kwargs", {})
         column_name = test_kwargs.get("column_name")
 
-        # Resolve test to model, then build dataset info
-        try:
-            model_node = resolve_test_to_model_node(test_node, manifest)
-            model_unique_id = model_node.get("unique_id", "")
-            dataset_info = build_dataset_info(model_node, manifest, namespace_override)
-            # Use pipe separator to avoid conflicts with "://" in namespace URLs
-            dataset_key = f"{dataset_info.namespace}|{dataset_info.name}"
-        except (KeyError, ValueError) as e:
+        # Resolve test to model, then build dataset info. Results for nodes
+        # outside the precomputed test mapping are resolved on the spot.
+        resolved = test_datasets.get(result.unique_id)
+        if resolved is None:
+            resolved = _resolve_test_dataset(
+                test_node, manifest, namespace_override, model_datasets
+            )
+        if isinstance(resolved, str):
             logger.warning(
-                f"Could not extract dataset info for test {result.unique_id}: {e}"
+                f"Could not extract dataset info for test {result.unique_id}: "
+                f"{resolved}"
             )
             continue
+        model_unique_id, dataset = resolved
+
+        yield (
+            dataset,
+            _TestRow(
+                unique_id=result.unique_id,
+                status=result.status,
+                failures=result.failures,
+                message=result.message,
+                execution_time_seconds=result.execution_time_seconds,
+                test_name=test_name,
+                column_name=column_name,
+                model_unique_id=model_unique_id,
+            ),
+        )
 
-        # Add test result to grouped dict
-        if dataset_key not in grouped:
-            grouped[dataset_key] = []
 
-        grouped[dataset_key].append(
-            {
-                "unique_id": result.unique_id,
-                "status": result.status,
-                "failures": result.failures,
-                "message": result.message,
-                "execution_time_seconds": result.execution_time_seconds,
-                "test_name": test_name,
-                "column_name": column_name,
-                "model_unique_id": model_unique_id,
-            }
+def _build_test_datasets(
+    manifest: Manifest, namespace_override: Optional[str]
+) -> dict[str, _TestDataset]:
+    """Resolve every test node in the manifest to its model and dataset.
+
+    Built once per manifest version through memoize_derived(). Failures are
+    kept as the reason the test can't be mapped (e.g., source tests have no
+    model ref), so each one is computed only once per manifest version.
+
+    Returns:
+        (model unique_id, (namespace, name)) or failure reason, per test
+        unique_id.
+    """
+    # (namespace, name) per model unique_id - many tests target the same
+    # model, so each model's dataset info is built once
+    model_datasets: dict[str, tuple[str, str]] = {}
+    return {
+        unique_id: _resolve_test_dataset(
+            node, manifest, namespace_override, model_datasets
         )
+        for unique_id, node in manifest.nodes.items()
+        if unique_id.startswith("test.")
+    }
 
-    return grouped
+
+def _resolve_test_dataset(
+    test_node: dict[str, Any],
+    manifest: Manifest,
+    namespace_override: Optional[str],
+    model_datasets: dict[str, tuple[str, str]],
+) -> _TestDataset:
+    """Resolve a test node to its model unique_id and (namespace, name).
+
+    Follows resolve_test_to_model_node(), but a test without a model ref or
+    whose model is missing from the manifest (e.g., source tests) returns the
+    reason instead of raising. model_datasets caches (namespace, name) by
+    model unique_id and is updated in place.
+
+    Returns:
+        (model unique_id, (namespace, name)), or the reason the test can't
+        be mapped.
+    """
+    test_unique_id = test_node.get("unique_id", "")
+    refs = test_node.get("refs")
+    if not refs:
+        return (
+            f"Test node has no refs: {test_unique_id}. "
+            f"Cannot determine which dataset the test is validating."
+        )
+    model_name = refs[0].get("name")
+    if not model_name:
+        return (
+            f"Test node ref has no name: {test_unique_id}. "
+            f"Cannot resolve model reference."
+        )
+
+    try:
+        model_unique_id = f"model.{extract_project_name(test_unique_id)}.{model_name}"
+        model_node = manifest.nodes.get(model_unique_id)
+        if model_node is None:
+            return (
+                f"Model node not found in manifest: {model_unique_id}. "
+                f"Referenced by test: {test_unique_id}"
+            )
+        dataset = model_datasets.get(model_unique_id)
+        if dataset is None:
+            dataset_info = build_dataset_info(model_node, manifest, namespace_override)
+            dataset = (dataset_info.namespace, dataset_info.name)
+            model_datasets[model_unique_id] = dataset
+    except (KeyError, ValueError) as e:
+        # Malformed nodes only (e.g., a unique_id without a project, or a
+        # model missing its database/schema)
+        return str(e.args[0]) if e.args else type(e).__name__
+    return model_unique_id, dataset
 
 
 def construct_test_events(
@@ -393,52 +583,83 @@ def construct_test_events(
         - ParentRunFacet set to orchestrator when orchestrated
         - Multiple inputs, each with dataQualityAssertions facet
     """
-    grouped = group_tests_by_dataset(run_results, manifest, namespace_override)
+    # Datasets and assertions depend only on the artifacts, so they are
+    # memoized per artifact version; only run identity is applied per call
+    inputs = memoize_derived(
+        derived_key("test_inputs", run_results, manifest, namespace_override),
+        lambda: _build_test_inputs(run_results, manifest, namespace_override),
+    )
 
-    if not grouped:
+    if inputs is None:
         return []
 
-    # Build all input datasets with their assertions
-    inputs: list[InputDataset] = []
+    # Build run facets for orchestrator parent
+    run_facets: dict[str, ParentRunFacet] = {}
+    if parent:
+        run_facets["parent"] = _build_parent_facet(parent=parent, producer=PRODUCER)
 
-    for dataset_key, tests in grouped.items():
-        # Parse dataset key: namespace|name (pipe separator avoids "://" conflicts)
-        try:
-            dataset_namespace, dataset_name = dataset_key.split("|", 1)
-        except ValueError:
-            logger.warning(f"Invalid dataset key format: {dataset_key}")
-            continue
+    event = RunEvent(  # type: ignore[call-arg]
+        eventType=RunState.RUNNING,
+        eventTime=run_results.metadata.generated_at.isoformat(),
+        run=Run(runId=run_id, facets=run_facets if run_facets else None),  # type: ignore[call-arg]
+        job=Job(namespace=job_namespace, name=job_name),  # type: ignore[call-arg]
+        producer=PRODUCER,
+        inputs=list(inputs),
+        outputs=[],
+    )
 
-        # Build assertions using SDK classes
-        assertions: list[Assertion] = []
-        extended_fields: list[dict[str, Any]] = []  # Store extended fields separately
+    return [event]
 
-        for test in tests:
-            # Map dbt status to OpenLineage success boolean
-            success = map_test_status(test["status"])
 
-            # Build assertion name
-            assertion_name = test["test_name"]
-            if test["column_name"]:
-                assertion_name = f"{test['test_name']}({test['column_name']})"
+def _build_test_inputs(
+    run_results: RunResults,
+    manifest: Manifest,
+    namespace_override: Optional[str],
+) -> Optional[list[InputDataset]]:
+    """Build input datasets with dataQualityAssertions facets for test events.
 
-            # Create SDK Assertion object (standard fields only)
-            assertion = Assertion(  # type: ignore[call-arg]
-                assertion=assertion_name,
-                success=success,
-                column=test["column_name"] if test["column_name"] else None,
-            )
-            assertions.append(assertion)
-
-            # Store extended fields for post-serialization merge
-            exec_time = test.get("execution_time_seconds")
-            extended_fields.append(
-                {
-                    "durationMs": int((exec_time or 0) * 1000),
-                    "message": test.get("message"),
-                }
-            )
+    Deterministic for given artifacts - construct_test_events() memoizes it.
+
+    Returns:
+        Input datasets, or None if no test could be mapped to a dataset.
+    """
+    # Assertions and their extended fields (stored separately) per
+    # (namespace, name), built in the same pass that maps tests to datasets
+    per_dataset: dict[tuple[str, str], list[Any]] = {}
+
+    for dataset, test in _iter_test_rows(run_results, manifest, namespace_override):
+        assertions, extended_fields = per_dataset.setdefault(dataset, [[], []])
+
+        # Map dbt status to OpenLineage success boolean
+        success = map_test_status(test.status)
 
+        # Build assertion name (column-level tests get a "(column)" suffix)
+        column = test.column_name or None
+        assertion_name = f"{test.test_name}({column})" if column else test.test_name
+
+        # Create SDK Assertion object (standard fields only)
+        assertion = Assertion(  # type: ignore[call-arg]
+            assertion=assertion_name,
+            success=success,
+            column=column,
+        )
+        assertions.append(assertion)
+
+        # Store extended fields for post-serialization merge
+        extended_fields.append(
+            {
+                "durationMs": int((test.execution_time_seconds or 0) * 1000),
+                "message": test.message,
+            }
+        )
+
+    if not per_dataset:
+        return None
+
+    # Build all input datasets with their assertions
+    inputs: list[InputDataset] = []
+
+    for (namespace, name), (assertions, extended_fields) in per_dataset.items():
         # Create facet using SDK class
         dqa_facet = DataQualityAssertionsDatasetFacet(assertions=assertions)  # type: ignore[call-arg]
 
@@ -447,28 +668,13 @@ def construct_test_events(
         dqa_facet._extended_fields = extended_fields  # type: ignore[attr-defined]
 
         dataset = InputDataset(  # type: ignore[call-arg]
-            namespace=dataset_namespace,
-            name=dataset_name,
+            namespace=namespace,
+            name=name,
             inputFacets={"dataQualityAssertions": dqa_facet},
         )
         inputs.append(dataset)
 
-    # Build run facets for orchestrator parent
-    run_facets: dict[str, ParentRunFacet] = {}
-    if parent:
-        run_facets["parent"] = _build_parent_facet(parent=parent, producer=PRODUCER)
-
-    event = RunEvent(  # type: ignore[call-arg]
-        eventType=RunState.RUNNING,
-        eventTime=run_results.metadata.generated_at.isoformat(),
-        run=Run(runId=run_id, facets=run_facets if run_facets else None),  # type: ignore[call-arg]
-        job=Job(namespace=job_namespace, name=job_name),  # type: ignore[call-arg]
-        producer=PRODUCER,
-        inputs=inputs,
-        outputs=[],
-    )
-
-    return [event]
+    return inputs
 
 
 def _has_extended_fields(event: RunEvent) -> bool:
@@ -487,30 +693,85 @@ def _serialize_event(event: RunEvent) -> dict[str, Any]:
     """Serialize a single event, handling extended fields if present."""
     if _has_extended_fields(event):
         return _serialize_event_with_extended_fields(event)
-    return attr.asdict(event, value_serializer=_serialize_attr_value)  # type: ignore[call-arg]
+    event_dict: dict[str, Any] = _to_primitive(event)
+    return event_dict
+
+
+def _get_session(max_workers: int = EMIT_MAX_WORKERS) -> requests.Session:
+    """Get the process-wide HTTP session used for event emission.
+
+    Reusing one session keeps the connection opened by the START emission
+    alive for the terminal batch, saving a TCP/TLS handshake per invocation.
+
+    Args:
+        max_workers: Concurrent POSTs the session must serve. The pool keeps
+            at least this many connections per host, so concurrent chunks
+            beyond HTTP_POOL_MAXSIZE don't discard their connection after
+            each request and handshake again for the next chunk.
+
+    Returns:
+        Shared requests.Session with a pooled adapter for http and https.
+    """
+    return _create_session(max(HTTP_POOL_MAXSIZE, max_workers))
+
+
+@lru_cache(maxsize=4)
+def _create_session(pool_maxsize: int) -> requests.Session:
+    """Create an HTTP session with a pooled adapter (one per pool size)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def emit_events(
-    events: list[RunEvent],
+    events: Iterable[RunEvent],
     endpoint: str,
     api_key: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    compression: str = "none",
+    batch_size: int = EMIT_BATCH_SIZE,
+    max_workers: int = EMIT_MAX_WORKERS,
 ) -> None:
     """Emit batch of OpenLineage events to backend.
 
-    Sends all events in a single HTTP POST using OpenLineage batch format.
-    More efficient than individual emission (50x fewer requests for 50 events).
+    Sends events using OpenLineage batch format. Up to batch_size events go
+    in a single HTTP POST - more efficient than individual emission (50x
+    fewer requests for 50 events). Larger streams are split into chunks. The
+    first chunk (which holds the START event when it is batched) is sent
+    before any other; the middle chunks are then POSTed concurrently as soon
+    as they fill up, so events produced by a generator are sent while later
+    ones are still being constructed. The final chunk (which holds the
+    terminal event) is sent only after all other chunks have completed.
 
     Supports any OpenLineage-compatible backend.
 
     Args:
-        events: List of OpenLineage RunEvents to emit.
+        events: OpenLineage RunEvents to emit, as a list or any iterable
+            (e.g., a generator yielding events as they are constructed).
         endpoint: OpenLineage API endpoint URL.
         api_key: Optional API key for authentication (X-API-Key header).
+        session: Optional HTTP session. Defaults to the shared pooled session,
+            so consecutive calls reuse open connections.
+        compression: Request body encoding, one of EMIT_COMPRESSIONS.
+            "gzip" and "zstd" send a compressed body with a matching
+            Content-Encoding header. If the backend answers 415, the batch
+            is resent uncompressed, as is everything else for that endpoint.
+        batch_size: Maximum number of events per HTTP POST.
+        max_workers: Maximum number of chunks POSTed concurrently. Lower it
+            to respect backend rate limits; 1 sends chunks one at a time.
 
     Raises:
-        ConnectionError: If unable to connect to endpoint.
+        ConnectionError: If unable to connect to endpoint, or a batch failed
+            with an unexpected error.
         TimeoutError: If request times out.
-        ValueError: If response indicates error (4xx/5xx status codes).
+        ValueError: If response indicates error (4xx/5xx status codes),
+            or compression is not supported (or "zstd" without the zstandard
+            package installed), or max_workers is below 1.
 
     Example:
         >>> events = [start_event, *test_events, complete_event]
@@ -520,28 +781,176 @@ def emit_events(
         - Uses OpenLineage batch format (array of events)
         - Handles 207 partial success gracefully (logs warning)
         - No retry logic (consistent with dbt-ol pattern)
+        - Connections are pooled and reused across calls
+        - A failed chunk does not stop the others; the first error is raised
+          once every chunk has been attempted
         - Fire-and-forget: lineage emission doesn't block dbt execution
     """
-    if not events:
-        logger.debug("No events to emit")
-        return
+    if compression not in EMIT_COMPRESSIONS:
+        raise ValueError(
+            f"Unsupported emit compression: {compression!r}. "
+            f"Expected one of: {', '.join(EMIT_COMPRESSIONS)}"
+        )
+    if compression == "zstd" and zstandard is None:
+        raise ValueError(
+            "zstd emit compression requires the zstandard package. "
+            "Install it with: pip install correlator-dbt[zstd]"
+        )
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
 
     # Prepare headers
     headers = {"Content-Type": "application/json"}
     if api_key:
         headers["X-API-Key"] = api_key
 
+    if session is None:
+        session = _get_session(max_workers)
+
+    _post_chunks(
+        session, endpoint, events, headers, compression, batch_size, max_workers
+    )
+
+
+def _post_chunks(
+    session: requests.Session,
+    endpoint: str,
+    events: Iterable[RunEvent],
+    headers: dict[str, str],
+    compression: str,
+    batch_size: int,
+    max_workers: int,
+) -> None:
+    """POST an event stream in chunks of up to batch_size events.
+
+    The first chunk is sent on its own, the middle chunks concurrently on up
+    to max_workers threads, and the final chunk once all others have
+    completed. The first error is raised once every chunk has been attempted.
+
+    Raises:
+        ConnectionError: If unable to connect, or any unexpected error.
+        TimeoutError: If request times out.
+        ValueError: If response indicates error (4xx/5xx status codes).
+    """
+    # A chunk is POSTed once the next event arrives, so a lazily constructed
+    # stream overlaps construction with network I/O. The first chunk - which
+    # holds START when it is batched - is sent before any other, so the
+    # backend never sees a run's events ahead of its START, and the final
+    # chunk - which holds the terminal event - is never sent concurrently.
+    errors: list[BaseException] = []
+    futures: list[Future[None]] = []
+    chunk_count = 0
+    final_chunk: list[RunEvent] = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for event in events:
+            if len(final_chunk) == batch_size:
+                if chunk_count == 0:
+                    try:
+                        _post_chunk(
+                            session, endpoint, final_chunk, headers, compression
+                        )
+                    except (ConnectionError, TimeoutError, ValueError) as e:
+                        errors.append(e)
+                else:
+                    futures.append(
+                        executor.submit(
+                            _post_chunk,
+                            session,
+                            endpoint,
+                            final_chunk,
+                            headers,
+                            compression,
+                        )
+                    )
+                chunk_count += 1
+                final_chunk = []
+            final_chunk.append(event)
+
+    if not final_chunk:
+        logger.debug("No events to emit")
+        return
+
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            errors.append(error)
+
+    try:
+        _post_chunk(session, endpoint, final_chunk, headers, compression)
+    except (ConnectionError, TimeoutError, ValueError) as e:
+        errors.append(e)
+
+    if errors:
+        if len(errors) > 1:
+            logger.warning(f"{len(errors)} of {chunk_count + 1} event batches failed")
+        raise errors[0]
+
+
+def _post_chunk(
+    session: requests.Session,
+    endpoint: str,
+    events: list[RunEvent],
+    headers: dict[str, str],
+    compression: str,
+) -> None:
+    """POST one batch of events, reporting unexpected failures as ConnectionError.
+
+    Keeps emit_events() to its documented exceptions, which callers such as
+    the CLI turn into a warning, whichever chunk or worker thread failed.
+
+    Raises:
+        ConnectionError: If unable to connect, or any unexpected error.
+        TimeoutError: If request times out.
+        ValueError: If response indicates error (4xx/5xx status codes).
+    """
+    try:
+        _post_events(session, endpoint, events, headers, compression)
+    except (ConnectionError, TimeoutError, ValueError):
+        raise
+    except Exception as e:
+        raise ConnectionError(
+            f"Failed to emit {len(events)} events to {endpoint}: {e}"
+        ) from e
+
+
+def _post_events(
+    session: requests.Session,
+    endpoint: str,
+    events: list[RunEvent],
+    headers: dict[str, str],
+    compression: str,
+) -> None:
+    """Serialize and POST one batch of events.
+
+    A compressed batch rejected with 415 is resent uncompressed, and the
+    endpoint is remembered so later batches skip compression.
+
+    Raises:
+        ConnectionError: If unable to connect to endpoint.
+        TimeoutError: If request times out.
+        ValueError: If response indicates error (4xx/5xx status codes).
+    """
     # Serialize events to JSON array (batch format)
-    event_dicts = [_serialize_event(event) for event in events]
+    body = _encode_batch(events)
+    if endpoint in _uncompressed_endpoints:
+        compression = "none"
 
     try:
-        # Single HTTP POST with all events
-        response = requests.post(
+        # Single HTTP POST with all events in this batch
+        response = session.post(
             endpoint,
-            json=event_dicts,
-            headers=headers,
+            data=_compress(body, compression),
+            headers=_with_content_encoding(headers, compression),
             timeout=30,
         )
+        if response.status_code == 415 and compression != "none":
+            logger.info(
+                f"Backend at {endpoint} rejected {compression} bodies, "
+                "sending uncompressed"
+            )
+            with _uncompressed_endpoints_lock:
+                _uncompressed_endpoints.add(endpoint)
+            response = session.post(endpoint, data=body, headers=headers, timeout=30)
 
         # Handle responses - support various OpenLineage consumers
         _handle_emit_response(response, len(events))
@@ -556,6 +965,32 @@ def emit_events(
         ) from e
 
 
+def _encode_batch(events: list[RunEvent]) -> bytes:
+    """Encode events as a JSON array, one event at a time.
+
+    Only one event's intermediate dict is alive at any point, rather than
+    the dicts of the whole batch alongside its encoded bytes.
+    """
+    return b"[" + b",".join(jsonio.dumps(_serialize_event(e)) for e in events) + b"]"
+
+
+def _compress(body: bytes, compression: str) -> bytes:
+    """Encode a request body with one of EMIT_COMPRESSIONS."""
+    if compression == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+    if compression == "zstd":
+        compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESS_LEVEL)
+        return cast(bytes, compressor.compress(body))
+    return body
+
+
+def _with_content_encoding(headers: dict[str, str], compression: str) -> dict[str, str]:
+    """Add the Content-Encoding header for a compressed body."""
+    if compression == "none":
+        return headers
+    return {**headers, "Content-Encoding": compression}
+
+
 def _handle_emit_response(response: requests.Response, event_count: int) -> None:
     """Handle HTTP response from OpenLineage backend.
 
@@ -611,6 +1046,7 @@ def construct_lineage_event(
     event_time: str,
     execution_result: Optional[ModelExecutionResult] = None,
     parent: Optional[ParentRunMetadata] = None,
+    parent_facet: Optional[ParentRunFacet] = None,
 ) -> RunEvent:
     """Construct OpenLineage RUNNING event for model lineage.
 
@@ -629,6 +1065,9 @@ def construct_lineage_event(
             When provided, adds outputStatistics facet with row count.
         parent: Optional parent run context for job hierarchy
             (e.g., wrapping job as parent of model events).
+        parent_facet: Optional prebuilt ParentRunFacet, used instead of
+            building one from parent (lets callers share one facet across
+            the events of a batch).
 
     Returns:
         OpenLineage RunEvent with RUNNING status, inputs, and output.
@@ -678,7 +1117,9 @@ def construct_lineage_event(
 
     # Build run facets for parent hierarchy
     run_facets: dict[str, ParentRunFacet] = {}
-    if parent:
+    if parent_facet:
+        run_facets["parent"] = parent_facet
+    elif parent:
         run_facets["parent"] = _build_parent_facet(parent=parent, producer=producer)
 
     return RunEvent(  # type: ignore[call-arg]
@@ -744,8 +1185,48 @@ def construct_lineage_events(
         appears as both input (dependency) and output (producer) across
         different models. Unique runIds per model prevent this aggregation.
     """
-    events = []
+    return list(
+        iter_lineage_events(
+            model_lineages=model_lineages,
+            job_namespace=job_namespace,
+            producer=producer,
+            event_time=event_time,
+            execution_results=execution_results,
+            parent=parent,
+        )
+    )
+
+
+def iter_lineage_events(
+    model_lineages: Iterable[ModelLineage],
+    job_namespace: str,
+    producer: str,
+    event_time: str,
+    execution_results: Optional[dict[str, ModelExecutionResult]] = None,
+    parent: Optional[ParentRunMetadata] = None,
+) -> Iterator[RunEvent]:
+    """Lazily construct RUNNING lineage events, one per model.
 
+    Generator form of construct_lineage_events. Passing it straight to
+    emit_events lets the first batches go out while events for the
+    remaining models are still being built.
+
+    Args:
+        model_lineages: ModelLineage objects to construct events for.
+        job_namespace: OpenLineage namespace (e.g., "dbt").
+        producer: Producer URL for OpenLineage events.
+        event_time: ISO 8601 timestamp for all events.
+        execution_results: Optional dict mapping model unique_id to
+            ModelExecutionResult.
+        parent: Optional parent run context for job hierarchy.
+
+    Yields:
+        OpenLineage RunEvent (eventType=RUNNING) with a unique runId per model.
+
+    Note:
+        The parent facet is the same for every event, so it is built once.
+    """
+    parent_facet = _build_parent_facet(parent, producer) if parent else None
     for lineage in model_lineages:
         # Generate unique runId for this model (UUID7 per OpenLineage spec)
         model_run_id = str(uuid7())
@@ -755,15 +1236,12 @@ def construct_lineage_events(
         if execution_results:
             exec_result = execution_results.get(lineage.unique_id)
 
-        event = construct_lineage_event(
+        yield construct_lineage_event(
             model_lineage=lineage,
             run_id=model_run_id,
             job_namespace=job_namespace,
             producer=producer,
             event_time=event_time,
             execution_result=exec_result,
-            parent=parent,
+            parent_facet=parent_facet,
         )
-        events.append(event)
-
-    return events
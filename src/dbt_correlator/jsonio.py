@@ -0,0 +1,70 @@
+"""JSON encoding and decoding for dbt-correlator.
+
+This module is the single entry point for JSON in the artifact and event
+paths. When the optional ``orjson`` package is installed (``pip install
+correlator-dbt[fast]``), it is used for both directions; it decodes large
+dbt manifests several times faster than the standard library. Without it,
+the standard library ``json`` module is used.
+
+Both backends produce equivalent results:
+    - Input the fast path rejects (e.g., NaN/Infinity literals, which the
+      standard library accepts) is retried with the standard library, so
+      behavior and error messages never depend on which backend is installed.
+    - Output is compact UTF-8 encoded JSON.
+"""
+
+import json
+from typing import Any, cast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Name of the active JSON backend ("orjson" or "json")
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON document.
+
+    Args:
+        data: UTF-8 encoded JSON document.
+
+    Returns:
+        Decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+
+    Example:
+        >>> loads(b'{"nodes": {}}')
+        {'nodes': {}}
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Fall through to stdlib for its lenient parsing and errors
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode object as compact UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object (dict, list, str, int, float, bool, None).
+
+    Returns:
+        UTF-8 encoded JSON document.
+
+    Raises:
+        TypeError: If the object contains non-serializable values.
+
+    Example:
+        >>> dumps([{"eventType": "START"}])
+        b'[{"eventType":"START"}]'
+    """
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(obj))
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
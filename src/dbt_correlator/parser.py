@@ -17,15 +17,72 @@ Implementation follows dbt artifact schema:
 
 import json
 import logging
-from dataclasses import dataclass
+import sys
+from collections.abc import Hashable
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
-logger = logging.getLogger(__name__)
+from .cache import get_stat_key, load_json_artifact, memoize_derived, paused_gc
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Parsed artifacts and the records built once per test/model/dataset use
+# __slots__ (Python 3.10+) for smaller instances and faster attribute access
+# in large projects
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# datetime.fromisoformat() accepts a "Z" UTC suffix from Python 3.11
+FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Node/source fields kept by parse_manifest(lean=True) - everything the
+# parser and emitter read. Large fields (compiled SQL, columns, docs, config)
+# are dropped.
+MANIFEST_NODE_FIELDS = (
+    "unique_id",
+    "resource_type",
+    "name",
+    "alias",
+    "identifier",
+    "database",
+    "schema",
+    "refs",
+    "depends_on",
+    "test_metadata",
+)
+
+# Per-result fields read by parse_run_results, in TestResult field order, with
+# the value used when a result lacks the field. The rest (timing,
+# relation_name, batch_results) and the top-level invocation args are dropped
+# right after decoding, so they are never cached in memory or in the sidecar.
+RUN_RESULT_DEFAULTS: dict[str, Any] = {
+    "unique_id": "",
+    "status": "",
+    "execution_time": 0.0,
+    "failures": None,
+    "message": None,
+    "compiled_code": None,
+    "thread_id": None,
+    "adapter_response": None,
+}
+RUN_RESULT_FIELDS = tuple(RUN_RESULT_DEFAULTS)
+
+# Result fields with only a handful of distinct values (pass, fail, ...). The
+# column projection interns them, so every result shares one string per value
+# and map_test_status's comparison with "pass" short-circuits on identity.
+RUN_RESULT_INTERNED = ("status",)
+
+# Result fields parse_run_results(lean=True) leaves unset (None). Nothing in
+# dbt-correlator reads them, and compiled SQL is the bulk of run_results.json.
+RUN_RESULT_LEAN_EXCLUDED = ("compiled_code", "thread_id")
+
+# Identifies the artifact version a parsed object was read from: (path, mtime_ns, size)
+SourceKey = tuple[str, int, int]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TestResult:
     """Represents a single dbt test execution result.
 
@@ -50,7 +107,7 @@ class TestResult:
     adapter_response: Optional[dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResultsMetadata:
     """Metadata from dbt run_results.json.
 
@@ -67,20 +124,23 @@ class RunResultsMetadata:
     elapsed_time: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RunResults:
     """Parsed dbt run_results.json file.
 
     Attributes:
         metadata: Run metadata (timestamps, invocation_id, etc.)
         results: list of test execution results
+        source_key: Artifact version this was parsed from, used to memoize
+            derived values. None when not parsed from a file.
     """
 
     metadata: RunResultsMetadata
     results: list[TestResult]
+    source_key: Optional[SourceKey] = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DatasetInfo:
     """Dataset namespace and name extracted from manifest.
 
@@ -93,7 +153,7 @@ class DatasetInfo:
     name: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ModelLineage:
     """Lineage information for a single dbt model.
 
@@ -122,7 +182,7 @@ class ModelLineage:
     output: DatasetInfo
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ModelExecutionResult:
     """Execution result for a single model from dbt run.
 
@@ -157,7 +217,23 @@ class ModelExecutionResult:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
+class RunData:
+    """Model data extracted from run_results in a single pass.
+
+    Attributes:
+        executed_models: Unique ids of models present in run_results.
+        execution_results: Runtime metrics keyed by model unique_id.
+        lineages: Lineage for each executed model found in the manifest,
+            in run_results order.
+    """
+
+    executed_models: set[str]
+    execution_results: dict[str, ModelExecutionResult]
+    lineages: list[ModelLineage]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Manifest:
     """Parsed dbt manifest.json file.
 
@@ -165,22 +241,37 @@ class Manifest:
         nodes: dictionary of all dbt nodes (models, tests, etc.)
         sources: dictionary of source definitions
         metadata: Manifest metadata (dbt version, generated_at, etc.)
+        source_key: Artifact version this was parsed from, used to memoize
+            derived values. None when not parsed from a file.
     """
 
     nodes: dict[str, Any]
     sources: dict[str, Any]
     metadata: dict[str, Any]
+    source_key: Optional[SourceKey] = field(default=None, compare=False, repr=False)
 
 
-def get_data_from_file(file_path: str) -> dict[str, Any]:
+def get_data_from_file(
+    file_path: str,
+    persistent_cache: bool = False,
+    transform: Optional[Callable[[Any], Any]] = None,
+) -> dict[str, Any]:
     """Read and parse JSON file from filesystem.
 
     Common helper function for parsing dbt artifact JSON files (run_results.json,
     manifest.json). Handles file I/O, JSON parsing, and provides helpful error
     messages for common failure scenarios.
 
+    Decoded data is cached per file version (path, mtime, size), so repeated
+    reads of an unchanged artifact skip JSON parsing. The returned dict is
+    shared between callers and must not be mutated.
+
     Args:
         file_path: Path to JSON file (run_results.json, manifest.json, etc.).
+        persistent_cache: If True, also use an on-disk sidecar cache next to
+            the artifact so later CLI invocations skip JSON parsing.
+        transform: Optional function applied to the decoded data before it
+            is cached (see load_json_artifact).
 
     Returns:
         Parsed JSON data as dictionary.
@@ -206,10 +297,11 @@ def get_data_from_file(file_path: str) -> dict[str, Any]:
             f"Ensure dbt has run and generated the {filename} file."
         )
 
-    # Read and parse JSON
+    # Read and parse JSON (cached on file stat)
     try:
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_artifact(
+            path, persistent=persistent_cache, transform=transform
+        )
     except json.JSONDecodeError as e:
         raise ValueError(
             f"Failed to parse {filename}: invalid JSON at {file_path}. " f"Error: {e}"
@@ -219,7 +311,9 @@ def get_data_from_file(file_path: str) -> dict[str, Any]:
     return cast(dict[str, Any], data)
 
 
-def parse_run_results(file_path: str) -> RunResults:
+def parse_run_results(
+    file_path: str, persistent_cache: bool = False, lean: bool = False
+) -> RunResults:
     """Parse dbt run_results.json file.
 
     Extracts test execution results, timing information, and status from
@@ -228,6 +322,10 @@ def parse_run_results(file_path: str) -> RunResults:
 
     Args:
         file_path: Path to run_results.json file.
+        persistent_cache: If True, use the on-disk sidecar cache.
+        lean: If True, leave the RUN_RESULT_LEAN_EXCLUDED fields (compiled
+            SQL, thread_id) of each TestResult unset, so they are never held
+            in memory or in the sidecar.
 
     Returns:
         RunResults object containing metadata and test results.
@@ -242,7 +340,12 @@ def parse_run_results(file_path: str) -> RunResults:
         >>> print(f"Invocation ID: {r.metadata.invocation_id}")
         >>> print(f"Total tests: {len(r.results)}")
     """
-    data = get_data_from_file(file_path)
+    source_key = _get_source_key(file_path)
+    data = get_data_from_file(
+        file_path,
+        persistent_cache,
+        transform=_lean_run_result_columns if lean else _run_result_columns,
+    )
 
     # Extract and validate metadata
     try:
@@ -256,7 +359,7 @@ def parse_run_results(file_path: str) -> RunResults:
     # Parse metadata fields
     try:
         generated_at_str = metadata_dict["generated_at"]
-        generated_at = datetime.fromisoformat(generated_at_str.replace("Z", "+00:00"))
+        generated_at = _parse_timestamp(generated_at_str)
         invocation_id = metadata_dict["invocation_id"]
         dbt_version = metadata_dict["dbt_version"]
     except KeyError as e:
@@ -276,29 +379,30 @@ def parse_run_results(file_path: str) -> RunResults:
         elapsed_time=elapsed_time,
     )
 
-    # Extract results array (maybe empty)
-    results_data = data.get("results", [])
-
-    # Parse each test result
-    results = []
-    for result_dict in results_data:
-        test_result = TestResult(
-            unique_id=result_dict.get("unique_id", ""),
-            status=result_dict.get("status", ""),
-            # Note: dbt JSON uses "execution_time", we normalize to execution_time_seconds
-            execution_time_seconds=result_dict.get("execution_time", 0.0),
-            failures=result_dict.get("failures"),
-            message=result_dict.get("message"),
-            compiled_code=result_dict.get("compiled_code"),
-            thread_id=result_dict.get("thread_id"),
-            adapter_response=result_dict.get("adapter_response"),
+    # Result columns in TestResult field order (dbt's "execution_time" maps to
+    # execution_time_seconds); columns left out by the projection take their
+    # default. Missing results array means no results.
+    columns = data.get("result_columns", {})
+    count = len(columns.get("unique_id", ()))
+
+    # One object per node - pause GC while allocating
+    with paused_gc():
+        results = list(
+            map(
+                TestResult,
+                *(
+                    columns[key] if key in columns else repeat(default, count)
+                    for key, default in RUN_RESULT_DEFAULTS.items()
+                ),
+            )
         )
-        results.append(test_result)
 
-    return RunResults(metadata=metadata, results=results)
+    return RunResults(metadata=metadata, results=results, source_key=source_key)
 
 
-def parse_manifest(file_path: str) -> Manifest:
+def parse_manifest(
+    file_path: str, persistent_cache: bool = False, lean: bool = False
+) -> Manifest:
     """Parse dbt manifest.json file.
 
     Extracts node definitions, source configurations, and dataset lineage
@@ -307,6 +411,10 @@ def parse_manifest(file_path: str) -> Manifest:
 
     Args:
         file_path: Path to manifest.json file.
+        persistent_cache: If True, use the on-disk sidecar cache.
+        lean: If True, keep only the node and source fields dbt-correlator
+            reads (MANIFEST_NODE_FIELDS), cutting memory use and sidecar
+            size for large projects.
 
     Returns:
         Manifest object containing nodes, sources, and metadata.
@@ -321,7 +429,10 @@ def parse_manifest(file_path: str) -> Manifest:
         >>> test_node = manifest.nodes["test.my_project.unique_orders_id"]
         >>> print(test_node["database"], test_node["schema"], test_node["name"])
     """
-    data = get_data_from_file(file_path)
+    source_key = _get_source_key(file_path)
+    data = get_data_from_file(
+        file_path, persistent_cache, transform=_lean_manifest if lean else None
+    )
 
     # Extract required fields
     try:
@@ -334,7 +445,133 @@ def parse_manifest(file_path: str) -> Manifest:
             f"File may be corrupted or from unsupported dbt version."
         ) from e
 
-    return Manifest(nodes=nodes, sources=sources, metadata=metadata)
+    return Manifest(
+        nodes=nodes, sources=sources, metadata=metadata, source_key=source_key
+    )
+
+
+def _lean_manifest(data: dict[str, Any]) -> dict[str, Any]:
+    """Project decoded manifest data to the fields dbt-correlator reads.
+
+    Data missing nodes or sources is returned unchanged, so parse_manifest()
+    reports it as usual.
+    """
+    if not isinstance(data.get("nodes"), dict) or not isinstance(
+        data.get("sources"), dict
+    ):
+        return data
+
+    def project(node: dict[str, Any]) -> dict[str, Any]:
+        lean_node = {key: node[key] for key in MANIFEST_NODE_FIELDS if key in node}
+        if "depends_on" in lean_node:
+            lean_node["depends_on"] = {
+                "nodes": lean_node["depends_on"].get("nodes", [])
+            }
+        return lean_node
+
+    return {
+        **data,
+        "nodes": {uid: project(node) for uid, node in data["nodes"].items()},
+        "sources": {uid: project(node) for uid, node in data["sources"].items()},
+    }
+
+
+def _run_result_columns(data: Any, exclude: tuple[str, ...] = ()) -> Any:
+    """Project decoded run_results data to the columns parse_run_results reads.
+
+    The results array is replaced by "result_columns": a list per
+    RUN_RESULT_FIELDS entry (other than exclude), holding that field for
+    every result. Columns share a handful of lists between all results
+    instead of a dict per result, and map straight onto TestResult's
+    positional arguments. String values of RUN_RESULT_INTERNED columns are
+    interned.
+
+    Data without a results list is returned unchanged, so parse_run_results()
+    reports it as usual.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get("results"), list):
+        return data
+
+    lean = {key: data[key] for key in ("metadata", "elapsed_time") if key in data}
+    results = data["results"]
+    columns = {
+        key: [result.get(key, default) for result in results]
+        for key, default in RUN_RESULT_DEFAULTS.items()
+        if key not in exclude
+    }
+    for key in RUN_RESULT_INTERNED:
+        columns[key] = [
+            sys.intern(value) if isinstance(value, str) else value
+            for value in columns[key]
+        ]
+    lean["result_columns"] = columns
+    return lean
+
+
+def _lean_run_result_columns(data: Any) -> Any:
+    """Project run_results columns without RUN_RESULT_LEAN_EXCLUDED fields."""
+    return _run_result_columns(data, exclude=RUN_RESULT_LEAN_EXCLUDED)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 artifact timestamp, including a "Z" UTC suffix.
+
+    The suffix is only rewritten on Pythons whose fromisoformat() rejects it.
+    """
+    if not FROMISOFORMAT_ACCEPTS_Z and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _get_source_key(file_path: str) -> Optional[SourceKey]:
+    """Stat an artifact before reading it, so the key never outlives its content.
+
+    Returns None for missing files; get_data_from_file() reports those.
+    """
+    try:
+        return (str(Path(file_path).resolve()), *get_stat_key(Path(file_path)))
+    except FileNotFoundError:
+        return None
+
+
+def derived_key(
+    kind: str, run_results: RunResults, manifest: Manifest, *args: Hashable
+) -> Optional[Hashable]:
+    """Build a memoize_derived() key for a value computed from both artifacts.
+
+    Args:
+        kind: Name of the derived value (keeps different values apart).
+        run_results: Parsed run_results the value is computed from.
+        manifest: Parsed manifest the value is computed from.
+        *args: Any other inputs of the computation (e.g., namespace override).
+
+    Returns:
+        Hashable key, or None if either artifact was not parsed from a file
+        (the value is then always recomputed).
+    """
+    if run_results.source_key is None or manifest.source_key is None:
+        return None
+    return (kind, run_results.source_key, manifest.source_key, *args)
+
+
+def manifest_key(kind: str, manifest: Manifest, *args: Hashable) -> Optional[Hashable]:
+    """Build a memoize_derived() key for a value computed from the manifest alone.
+
+    Such values outlive run_results rewrites, e.g. across repeated dbt test
+    invocations against an unchanged manifest.
+
+    Args:
+        kind: Name of the derived value (keeps different values apart).
+        manifest: Parsed manifest the value is computed from.
+        *args: Any other inputs of the computation (e.g., namespace override).
+
+    Returns:
+        Hashable key, or None if the manifest was not parsed from a file
+        (the value is then always recomputed).
+    """
+    if manifest.source_key is None:
+        return None
+    return (kind, manifest.source_key, *args)
 
 
 def extract_project_name(test_unique_id: str) -> str:
@@ -353,14 +590,15 @@ def extract_project_name(test_unique_id: str) -> str:
         >>> extract_project_name("test.jaffle_shop.unique_customers.abc123")
         'jaffle_shop'
     """
-    try:
-        parts = test_unique_id.split(".")
-        return parts[1]
-    except IndexError as e:
+    # Slice out the second dot-separated part without splitting the whole id
+    start = test_unique_id.find(".") + 1
+    if not start:
         raise ValueError(
             f"Invalid test unique_id format: {test_unique_id}. "
             f"Expected format: test.project.test_name.hash"
-        ) from e
+        )
+    end = test_unique_id.find(".", start)
+    return test_unique_id[start:] if end < 0 else test_unique_id[start:end]
 
 
 def extract_model_name(test_node: dict[str, Any], test_unique_id: str) -> str:
@@ -638,29 +876,37 @@ def extract_all_model_lineage(
     lineages: list[ModelLineage] = []
 
     for model_id in target_model_ids:
-        model_node = manifest.nodes.get(model_id)
-        if not model_node:
-            logger.warning("Model node not found in manifest: %s", model_id)
-            continue
+        lineage = _build_model_lineage(model_id, manifest, namespace_override)
+        if lineage is not None:
+            lineages.append(lineage)
 
-        # Extract model name from node
-        model_name = model_node.get("alias") or model_node["name"]
+    return lineages
 
-        # Build output DatasetInfo for this model
-        output = build_dataset_info(model_node, manifest, namespace_override)
 
-        # Extract input DatasetInfo from dependencies
-        inputs = extract_model_inputs(model_node, manifest, namespace_override)
+def _build_model_lineage(
+    model_id: str, manifest: Manifest, namespace_override: Optional[str]
+) -> Optional[ModelLineage]:
+    """Build ModelLineage for one model, or None if it is not in the manifest."""
+    model_node = manifest.nodes.get(model_id)
+    if not model_node:
+        logger.warning("Model node not found in manifest: %s", model_id)
+        return None
 
-        lineage = ModelLineage(
-            unique_id=model_id,
-            name=model_name,
-            inputs=inputs,
-            output=output,
-        )
-        lineages.append(lineage)
+    # Extract model name from node
+    model_name = model_node.get("alias") or model_node["name"]
 
-    return lineages
+    # Build output DatasetInfo for this model
+    output = build_dataset_info(model_node, manifest, namespace_override)
+
+    # Extract input DatasetInfo from dependencies
+    inputs = extract_model_inputs(model_node, manifest, namespace_override)
+
+    return ModelLineage(
+        unique_id=model_id,
+        name=model_name,
+        inputs=inputs,
+        output=output,
+    )
 
 
 def get_executed_models(run_results: RunResults) -> set[str]:
@@ -765,7 +1011,11 @@ def map_test_status(dbt_status: str) -> bool:
         >>> map_test_status("fail")
         False
     """
-    return dbt_status.lower() == "pass"
+    # dbt writes lowercase statuses; only other 4-character strings need
+    # lowering to compare case-insensitively
+    return dbt_status == "pass" or (
+        len(dbt_status) == 4 and dbt_status.lower() == "pass"
+    )
 
 
 def extract_model_results(run_results: RunResults) -> dict[str, ModelExecutionResult]:
@@ -801,18 +1051,90 @@ def extract_model_results(run_results: RunResults) -> dict[str, ModelExecutionRe
             logger.debug("Skipping non-model result: %s", result.unique_id)
             continue
 
-        # Extract rows_affected from adapter_response if available
-        rows_affected: Optional[int] = None
-        if result.adapter_response:
-            rows_affected = result.adapter_response.get("rows_affected")
-
-        model_result = ModelExecutionResult(
-            unique_id=result.unique_id,
-            status=result.status,
-            execution_time_seconds=result.execution_time_seconds,
-            rows_affected=rows_affected,
-            message=result.message,
-        )
-        model_results[result.unique_id] = model_result
+        model_results[result.unique_id] = _build_execution_result(result)
 
     return model_results
+
+
+def _build_execution_result(result: TestResult) -> ModelExecutionResult:
+    """Build ModelExecutionResult from a model's run_results entry."""
+    # Extract rows_affected from adapter_response if available
+    rows_affected: Optional[int] = None
+    if result.adapter_response:
+        rows_affected = result.adapter_response.get("rows_affected")
+
+    return ModelExecutionResult(
+        unique_id=result.unique_id,
+        status=result.status,
+        execution_time_seconds=result.execution_time_seconds,
+        rows_affected=rows_affected,
+        message=result.message,
+    )
+
+
+def extract_run_data(
+    run_results: RunResults,
+    manifest: Manifest,
+    namespace_override: Optional[str] = None,
+) -> RunData:
+    """Extract executed models, runtime metrics and lineage in one pass.
+
+    Equivalent to combining get_executed_models(), extract_model_results()
+    and extract_all_model_lineage(model_ids=...), but walks run_results
+    once instead of three times. Used for the `run` and `build` commands.
+
+    The result is memoized per artifact version, so repeated calls for
+    unchanged artifacts return the same (read-only) RunData.
+
+    Args:
+        run_results: Parsed RunResults from dbt run/build.
+        manifest: Parsed manifest containing all nodes and sources.
+        namespace_override: Optional namespace override for all datasets.
+
+    Returns:
+        RunData with executed model ids, execution results and lineages.
+
+    Example:
+        >>> rr = parse_run_results("target/run_results.json")
+        >>> m = parse_manifest("target/manifest.json")
+        >>> run_data = extract_run_data(rr, m)
+        >>> run_data.lineages[0].unique_id in run_data.executed_models
+        True
+    """
+    return memoize_derived(
+        derived_key("run_data", run_results, manifest, namespace_override),
+        lambda: _extract_run_data(run_results, manifest, namespace_override),
+    )
+
+
+def _extract_run_data(
+    run_results: RunResults,
+    manifest: Manifest,
+    namespace_override: Optional[str],
+) -> RunData:
+    """Build RunData for extract_run_data() (not memoized)."""
+    executed_models: set[str] = set()
+    execution_results: dict[str, ModelExecutionResult] = {}
+    lineages: list[ModelLineage] = []
+
+    for result in run_results.results:
+        model_id = result.unique_id
+        if not model_id.startswith("model."):
+            continue
+
+        # Last result wins for metrics, as in extract_model_results()
+        execution_results[model_id] = _build_execution_result(result)
+
+        if model_id in executed_models:
+            continue
+        executed_models.add(model_id)
+
+        lineage = _build_model_lineage(model_id, manifest, namespace_override)
+        if lineage is not None:
+            lineages.append(lineage)
+
+    return RunData(
+        executed_models=executed_models,
+        execution_results=execution_results,
+        lineages=lineages,
+    )
@@ -8,6 +8,8 @@ Test Organization:
     - test_emitter.py: Tests for OpenLineage event construction and emission
     - test_cli.py: Tests for CLI commands
     - test_config.py: Tests for configuration management
+    - test_cache.py: Tests for artifact caching
+    - test_jsonio.py: Tests for JSON encoding and decoding
     - test_integration.py: End-to-end integration tests with mock HTTP
     - fixtures/: Sample dbt artifacts and test data
 
@@ -17,15 +17,21 @@ Fixtures:
 
     CLI Fixtures:
         - runner: Click CliRunner for CLI testing
+        - eager_start_test_run: One shared `test --skip-dbt-run --eager-start`
+          run against the success mock, for tests that only inspect its output
 """
 
 from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
-import responses  # type: ignore[import-not-found]
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
+
+from dbt_correlator.cli import cli
+
+if TYPE_CHECKING:
+    import responses  # type: ignore[import-not-found]
 
 # =============================================================================
 # Constants
@@ -34,6 +40,9 @@ from click.testing import CliRunner
 # Default mock Correlator endpoint used in integration tests
 MOCK_CORRELATOR_ENDPOINT = "http://localhost:8080/api/v1/lineage/events"
 
+# Committed dbt artifacts used by the mock project directories
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
 
 # =============================================================================
 # Path Fixtures
@@ -47,30 +56,21 @@ def fixtures_dir() -> Path:
     Returns:
         Path to the fixtures directory containing committed test artifacts.
     """
-    return Path(__file__).parent / "fixtures"
-
+    return FIXTURES_DIR
 
-@pytest.fixture
-def mock_dbt_project_dir(fixtures_dir: Path, tmp_path: Path) -> Path:
-    """Create a mock dbt project directory with test results fixtures.
-
-    The CLI expects artifacts at {project_dir}/target/. This fixture creates
-    a temporary directory structure with symlinks to the committed fixtures:
-        - {tmp_path}/target/manifest.json -> fixtures/manifest.json
-        - {tmp_path}/target/run_results.json -> fixtures/dbt_test_results.json
 
-    This fixture is used for testing the `test` command which expects
-    test execution results.
+def link_dbt_artifacts(project_dir: Path, run_results_name: str) -> Path:
+    """Symlink committed artifacts into {project_dir}/target/.
 
     Args:
-        fixtures_dir: Path to fixtures directory with committed artifacts.
-        tmp_path: Pytest-provided temporary directory.
+        project_dir: Directory to turn into a mock dbt project.
+        run_results_name: Fixture file to expose as target/run_results.json.
 
     Returns:
-        Path to temporary project directory with proper structure.
+        The project directory.
     """
-    manifest_path = fixtures_dir / "manifest.json"
-    run_results_path = fixtures_dir / "dbt_test_results.json"
+    manifest_path = FIXTURES_DIR / "manifest.json"
+    run_results_path = FIXTURES_DIR / run_results_name
 
     if not manifest_path.exists():
         pytest.skip(f"Fixture not found: {manifest_path}")
@@ -78,19 +78,43 @@ def mock_dbt_project_dir(fixtures_dir: Path, tmp_path: Path) -> Path:
         pytest.skip(f"Fixture not found: {run_results_path}")
 
     # Create target directory structure
-    target_dir = tmp_path / "target"
+    target_dir = project_dir / "target"
     target_dir.mkdir(parents=True, exist_ok=True)
 
     # Symlink artifacts (faster than copying)
     (target_dir / "manifest.json").symlink_to(manifest_path)
-    # Symlink to dbt_test_results.json but CLI expects run_results.json in target/
     (target_dir / "run_results.json").symlink_to(run_results_path)
 
-    return tmp_path
+    return project_dir
 
 
-@pytest.fixture
-def mock_dbt_project_dir_with_model_results(fixtures_dir: Path, tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def mock_dbt_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a mock dbt project directory with test results fixtures.
+
+    The CLI expects artifacts at {project_dir}/target/. This fixture creates
+    a temporary directory structure with symlinks to the committed fixtures:
+        - {project_dir}/target/manifest.json -> fixtures/manifest.json
+        - {project_dir}/target/run_results.json -> fixtures/dbt_test_results.json
+
+    This fixture is used for testing the `test` command which expects
+    test execution results.
+
+    Args:
+        tmp_path_factory: Pytest-provided session temporary directory factory.
+
+    Returns:
+        Path to temporary project directory with proper structure.
+    """
+    return link_dbt_artifacts(
+        tmp_path_factory.mktemp("dbt_project"), "dbt_test_results.json"
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_dbt_project_dir_with_model_results(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
     """Create a mock dbt project directory with model run results fixtures.
 
     Similar to mock_dbt_project_dir but uses dbt_run_results.json which contains
@@ -100,29 +124,14 @@ def mock_dbt_project_dir_with_model_results(fixtures_dir: Path, tmp_path: Path)
     expect model execution results with timing information.
 
     Args:
-        fixtures_dir: Path to fixtures directory with committed artifacts.
-        tmp_path: Pytest-provided temporary directory.
+        tmp_path_factory: Pytest-provided session temporary directory factory.
 
     Returns:
         Path to temporary project directory with proper structure.
     """
-    manifest_path = fixtures_dir / "manifest.json"
-    run_results_path = fixtures_dir / "dbt_run_results.json"
-
-    if not manifest_path.exists():
-        pytest.skip(f"Fixture not found: {manifest_path}")
-    if not run_results_path.exists():
-        pytest.skip(f"Fixture not found: {run_results_path}")
-
-    # Create target directory structure
-    target_dir = tmp_path / "target"
-    target_dir.mkdir(parents=True, exist_ok=True)
-
-    # Symlink artifacts (faster than copying)
-    (target_dir / "manifest.json").symlink_to(manifest_path)
-    (target_dir / "run_results.json").symlink_to(run_results_path)
-
-    return tmp_path
+    return link_dbt_artifacts(
+        tmp_path_factory.mktemp("dbt_project"), "dbt_run_results.json"
+    )
 
 
 # =============================================================================
@@ -130,7 +139,7 @@ def mock_dbt_project_dir_with_model_results(fixtures_dir: Path, tmp_path: Path)
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
     """Create Click test runner for CLI testing.
 
@@ -230,8 +239,19 @@ def _validation_error_response_body() -> dict[str, Any]:
     }
 
 
+def requests_mock() -> "responses.RequestsMock":
+    """Create a RequestsMock, importing responses only when HTTP is mocked.
+
+    Returns:
+        Unstarted responses.RequestsMock context manager.
+    """
+    import responses  # type: ignore[import-not-found]
+
+    return responses.RequestsMock()
+
+
 @pytest.fixture
-def mock_correlator_success() -> Iterator[responses.RequestsMock]:
+def mock_correlator_success() -> Iterator["responses.RequestsMock"]:
     """Mock Correlator server returning 200 OK success response.
 
     Uses the responses library to mock HTTP POST requests to the
@@ -246,9 +266,9 @@ def mock_correlator_success() -> Iterator[responses.RequestsMock]:
             response = requests.post(MOCK_CORRELATOR_ENDPOINT, json=[...])
             assert response.status_code == 200
     """
-    with responses.RequestsMock() as rsps:
+    with requests_mock() as rsps:
         rsps.add(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             json=_success_response_body(),
             status=200,
@@ -257,7 +277,7 @@ def mock_correlator_success() -> Iterator[responses.RequestsMock]:
 
 
 @pytest.fixture
-def mock_correlator_partial_success() -> Iterator[responses.RequestsMock]:
+def mock_correlator_partial_success() -> Iterator["responses.RequestsMock"]:
     """Mock Correlator server returning 207 Multi-Status partial success.
 
     This fixture simulates the scenario where some events succeed and
@@ -266,9 +286,9 @@ def mock_correlator_partial_success() -> Iterator[responses.RequestsMock]:
     Yields:
         responses.RequestsMock context with configured mock.
     """
-    with responses.RequestsMock() as rsps:
+    with requests_mock() as rsps:
         rsps.add(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             json=_partial_success_response_body(received=10, failed=2),
             status=207,
@@ -277,7 +297,7 @@ def mock_correlator_partial_success() -> Iterator[responses.RequestsMock]:
 
 
 @pytest.fixture
-def mock_correlator_validation_error() -> Iterator[responses.RequestsMock]:
+def mock_correlator_validation_error() -> Iterator["responses.RequestsMock"]:
     """Mock Correlator server returning 422 Unprocessable Entity.
 
     This fixture simulates validation errors where all events fail.
@@ -285,9 +305,9 @@ def mock_correlator_validation_error() -> Iterator[responses.RequestsMock]:
     Yields:
         responses.RequestsMock context with configured mock.
     """
-    with responses.RequestsMock() as rsps:
+    with requests_mock() as rsps:
         rsps.add(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             json=_validation_error_response_body(),
             status=422,
@@ -296,7 +316,7 @@ def mock_correlator_validation_error() -> Iterator[responses.RequestsMock]:
 
 
 @pytest.fixture
-def mock_correlator_server_error() -> Iterator[responses.RequestsMock]:
+def mock_correlator_server_error() -> Iterator["responses.RequestsMock"]:
     """Mock Correlator server returning 500 Internal Server Error.
 
     This fixture simulates server-side errors.
@@ -304,9 +324,9 @@ def mock_correlator_server_error() -> Iterator[responses.RequestsMock]:
     Yields:
         responses.RequestsMock context with configured mock.
     """
-    with responses.RequestsMock() as rsps:
+    with requests_mock() as rsps:
         rsps.add(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             json={"error": "Internal server error"},
             status=500,
@@ -315,7 +335,7 @@ def mock_correlator_server_error() -> Iterator[responses.RequestsMock]:
 
 
 @pytest.fixture
-def mock_correlator_dynamic() -> Iterator[responses.RequestsMock]:
+def mock_correlator_dynamic() -> Iterator["responses.RequestsMock"]:
     """Mock Correlator server with dynamic response based on request.
 
     This fixture provides a RequestsMock that can be configured by
@@ -332,10 +352,50 @@ def mock_correlator_dynamic() -> Iterator[responses.RequestsMock]:
                 return (200, {}, json.dumps(_success_response_body(len(events))))
 
             mock_correlator_dynamic.add_callback(
-                responses.POST,
+                "POST",
                 MOCK_CORRELATOR_ENDPOINT,
                 callback=callback
             )
     """
-    with responses.RequestsMock() as rsps:
+    with requests_mock() as rsps:
         yield rsps
+
+
+@pytest.fixture(scope="class")
+def eager_start_test_run(
+    runner: CliRunner, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Result, list[Any]]:
+    """Run `test --skip-dbt-run --eager-start` once against a 200 OK mock.
+
+    Tests that only inspect the output and emitted requests of this
+    invocation share one run per class instead of re-running the CLI.
+
+    Returns:
+        Tuple of (CLI result, captured responses calls).
+    """
+    project_dir = link_dbt_artifacts(
+        tmp_path_factory.mktemp("project"), "dbt_test_results.json"
+    )
+    with requests_mock() as rsps:
+        rsps.add(
+            "POST",
+            MOCK_CORRELATOR_ENDPOINT,
+            json=_success_response_body(),
+            status=200,
+        )
+        result = runner.invoke(
+            cli,
+            [
+                "test",
+                "--skip-dbt-run",
+                "--eager-start",
+                "--project-dir",
+                str(project_dir),
+                "--profiles-dir",
+                str(project_dir),
+                "--correlator-endpoint",
+                MOCK_CORRELATOR_ENDPOINT,
+            ],
+        )
+        # Copy before exiting: the mock resets its calls when it stops
+        return result, list(rsps.calls)
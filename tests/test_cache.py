@@ -0,0 +1,266 @@
+"""Tests for artifact caching module.
+
+This module tests the artifact cache used by the parser, including:
+    - Reuse of decoded data for unchanged artifacts
+    - Automatic invalidation when an artifact is rewritten
+    - Cache clearing
+    - On-disk sidecar cache shared across CLI invocations
+    - Pausing the garbage collector while decoding
+    - Memoizing values derived from artifacts
+
+Uses tmp_path for isolated file system testing.
+"""
+
+import gc
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from dbt_correlator.cache import (
+    SIDECAR_HEADER,
+    SIDECAR_SUFFIX,
+    clear_artifact_cache,
+    get_sidecar_path,
+    get_stat_key,
+    load_json_artifact,
+    memoize_derived,
+    paused_gc,
+)
+from dbt_correlator.parser import parse_manifest
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def cold_cache() -> Iterator[None]:
+    """Ensure every test starts and ends with an empty artifact cache."""
+    clear_artifact_cache()
+    yield
+    clear_artifact_cache()
+
+
+@pytest.fixture
+def artifact_file(tmp_path: Path) -> Path:
+    """Small JSON artifact written to a temporary directory."""
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"nodes": {}, "sources": {}, "metadata": {}}))
+    return path
+
+
+def _only_nodes(data: dict) -> dict:
+    """Transform used to test cached projections."""
+    return {"nodes": data["nodes"]}
+
+
+# =============================================================================
+# A. In-Process Cache Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestLoadJsonArtifact:
+    """Tests for stat-keyed in-process artifact cache."""
+
+    def test_unchanged_file_returns_cached_data(self, artifact_file: Path) -> None:
+        """Second load of an unchanged file returns the same decoded object."""
+        first = load_json_artifact(artifact_file)
+        second = load_json_artifact(artifact_file)
+
+        assert first is second
+
+    def test_rewritten_file_is_reloaded(self, artifact_file: Path) -> None:
+        """Rewriting the file invalidates the cached entry."""
+        first = load_json_artifact(artifact_file)
+
+        artifact_file.write_text(json.dumps({"nodes": {"model.a.b": {}}}))
+        # Force a distinct mtime even on coarse-grained filesystems
+        stat = artifact_file.stat()
+        os.utime(artifact_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_json_artifact(artifact_file)
+
+        assert second is not first
+        assert second == {"nodes": {"model.a.b": {}}}
+
+    def test_clear_artifact_cache_forces_reload(self, artifact_file: Path) -> None:
+        """Clearing the cache makes the next load decode the file again."""
+        first = load_json_artifact(artifact_file)
+        clear_artifact_cache()
+
+        assert load_json_artifact(artifact_file) is not first
+
+    def test_missing_file_raises_file_not_found(self, tmp_path: Path) -> None:
+        """Missing artifacts raise FileNotFoundError from the stat call."""
+        with pytest.raises(FileNotFoundError):
+            get_stat_key(tmp_path / "missing.json")
+
+    def test_parse_manifest_reuses_cached_data(self, artifact_file: Path) -> None:
+        """parse_manifest shares decoded nodes across calls for unchanged files."""
+        first = parse_manifest(str(artifact_file))
+        second = parse_manifest(str(artifact_file))
+
+        assert first.nodes is second.nodes
+
+
+# =============================================================================
+# B. On-Disk Sidecar Cache Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestSidecarCache:
+    """Tests for persistent sidecar cache shared across processes."""
+
+    def test_persistent_load_writes_sidecar(self, artifact_file: Path) -> None:
+        """Persistent load writes a sidecar named after the artifact stat."""
+        load_json_artifact(artifact_file, persistent=True)
+
+        sidecar = get_sidecar_path(artifact_file, *get_stat_key(artifact_file))
+        assert sidecar.exists()
+        assert sidecar.read_bytes().startswith(SIDECAR_HEADER)
+
+    def test_sidecar_used_after_in_memory_cache_cleared(
+        self, artifact_file: Path
+    ) -> None:
+        """A fresh process (cold memory cache) reads data from the sidecar."""
+        expected = load_json_artifact(artifact_file, persistent=True)
+        clear_artifact_cache()
+
+        # Break the JSON - only the sidecar can produce valid data now,
+        # while keeping the stat key identical
+        stat = artifact_file.stat()
+        artifact_file.write_text("x" * stat.st_size)
+        os.utime(artifact_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_json_artifact(artifact_file, persistent=True) == expected
+
+    def test_stale_sidecars_are_purged(self, artifact_file: Path) -> None:
+        """Writing a sidecar for a new artifact version removes older ones."""
+        load_json_artifact(artifact_file, persistent=True)
+        old_sidecar = get_sidecar_path(artifact_file, *get_stat_key(artifact_file))
+
+        artifact_file.write_text(json.dumps({"nodes": {"model.a.b": {}}}))
+        stat = artifact_file.stat()
+        os.utime(artifact_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        load_json_artifact(artifact_file, persistent=True)
+
+        assert not old_sidecar.exists()
+        assert get_sidecar_path(artifact_file, *get_stat_key(artifact_file)).exists()
+
+    def test_other_variant_sidecars_are_kept(self, artifact_file: Path) -> None:
+        """Writing one variant's sidecar leaves other variants in place."""
+        stat_key = get_stat_key(artifact_file)
+        load_json_artifact(artifact_file, persistent=True)
+        clear_artifact_cache()
+
+        load_json_artifact(artifact_file, persistent=True, transform=_only_nodes)
+
+        assert get_sidecar_path(artifact_file, *stat_key).exists()
+        assert get_sidecar_path(artifact_file, *stat_key, "only_nodes").exists()
+
+    def test_corrupt_sidecar_falls_back_to_json(self, artifact_file: Path) -> None:
+        """Unreadable sidecar content is ignored and the JSON is parsed."""
+        sidecar = get_sidecar_path(artifact_file, *get_stat_key(artifact_file))
+        sidecar.write_bytes(SIDECAR_HEADER + b"\x00garbage")
+
+        data = load_json_artifact(artifact_file, persistent=True)
+
+        assert data == {"nodes": {}, "sources": {}, "metadata": {}}
+
+    def test_transformed_data_cached_in_own_sidecar(self, artifact_file: Path) -> None:
+        """A transform's output is cached separately under the transform name."""
+        stat_key = get_stat_key(artifact_file)
+
+        data = load_json_artifact(artifact_file, persistent=True, transform=_only_nodes)
+
+        assert data == {"nodes": {}}
+        assert get_sidecar_path(artifact_file, *stat_key, "only_nodes").exists()
+        assert load_json_artifact(artifact_file) == {
+            "nodes": {},
+            "sources": {},
+            "metadata": {},
+        }
+
+    def test_non_persistent_load_writes_no_sidecar(self, artifact_file: Path) -> None:
+        """Default loads never touch the filesystem beyond the artifact."""
+        load_json_artifact(artifact_file)
+
+        assert list(artifact_file.parent.glob(f"*{SIDECAR_SUFFIX}")) == []
+
+
+# =============================================================================
+# C. Garbage Collector Pause Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestPausedGc:
+    """Tests for pausing the cyclic GC during artifact decoding."""
+
+    def test_disables_and_restores_gc(self) -> None:
+        """GC is off inside the block and back on afterwards."""
+        assert gc.isenabled()
+
+        with paused_gc():
+            assert not gc.isenabled()
+
+        assert gc.isenabled()
+
+    def test_nested_pauses_restore_only_at_outermost_exit(self) -> None:
+        """Inner blocks exiting do not re-enable GC early."""
+        with paused_gc():
+            with paused_gc():
+                pass
+            assert not gc.isenabled()
+
+        assert gc.isenabled()
+
+    def test_leaves_gc_disabled_if_it_was_disabled(self) -> None:
+        """A caller that disabled GC itself keeps it disabled."""
+        gc.disable()
+        try:
+            with paused_gc():
+                pass
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+
+# =============================================================================
+# D. Derived Value Memoization Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestMemoizeDerived:
+    """Tests for memoizing values computed from artifacts."""
+
+    def test_same_key_builds_once(self) -> None:
+        """A second lookup with the same key reuses the first value."""
+        calls: list[int] = []
+
+        def build() -> list[int]:
+            calls.append(1)
+            return [len(calls)]
+
+        first = memoize_derived(("k", 1), build)
+        second = memoize_derived(("k", 1), build)
+
+        assert second is first
+        assert len(calls) == 1
+
+    def test_none_key_always_builds(self) -> None:
+        """A None key bypasses the cache."""
+        assert memoize_derived(None, list) is not memoize_derived(None, list)
+
+    def test_clear_artifact_cache_drops_derived_values(self) -> None:
+        """Clearing the artifact cache also clears derived values."""
+        first: list[int] = memoize_derived(("k", 1), list)
+        clear_artifact_cache()
+
+        assert memoize_derived(("k", 1), list) is not first
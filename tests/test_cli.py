@@ -2,7 +2,7 @@
 
 This module tests the dbt-correlator CLI commands, including:
     - Command structure and options
-    - Execution flow (subprocess calls)
+    - Execution flow (dbt launch)
     - Event generation
     - Emission to Correlator
     - Exit code propagation
@@ -10,36 +10,92 @@ This module tests the dbt-correlator CLI commands, including:
     - Error handling
 
 Uses Click's CliRunner for CLI testing and unittest.mock for
-subprocess and HTTP mocking.
+an in-process fake dbt and HTTP mocking.
 """
 
+import functools
 import subprocess
-from collections.abc import Iterator
+import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, Callable, cast
+from unittest.mock import Mock, patch
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 from openlineage.client.event_v2 import RunEvent
 
 from dbt_correlator import __version__
-from dbt_correlator.cli import cli, get_default_job_name, get_parent_run_metadata
+from dbt_correlator.cache import get_stat_key
+from dbt_correlator.cli import (
+    PARTIAL_PARSE_FILENAME,
+    _run_dbt,
+    cli,
+    create_scratch_target,
+    get_default_job_name,
+    get_parent_run_metadata,
+    prefetch_manifest,
+)
 from dbt_correlator.emitter import ParentRunMetadata
-from dbt_correlator.parser import Manifest, RunResults, RunResultsMetadata, TestResult
+from dbt_correlator.parser import (
+    Manifest,
+    RunData,
+    RunResults,
+    RunResultsMetadata,
+    TestResult,
+)
+from tests.conftest import MOCK_CORRELATOR_ENDPOINT
+
+# Exit codes returned by the fake dbt
+DBT_EXIT_SUCCESS = 0
+DBT_EXIT_FAILURE = 1  # test failures
+DBT_EXIT_ERROR = 2  # compilation error
+
+# Leading arguments of most invocations: the test command with an endpoint
+TEST_COMMAND_ARGS = ("test", "--correlator-endpoint", MOCK_CORRELATOR_ENDPOINT)
+
+
+def invoke_test(runner: CliRunner, *extra_args: str) -> Result:
+    """Invoke the test command against the mock endpoint with extra arguments."""
+    return runner.invoke(cli, [*TEST_COMMAND_ARGS, *extra_args])
+
+
+# run_results generated_at timestamp
+MOCK_GENERATED_AT = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# Manifest nodes: two tests on the users model
+MOCK_MANIFEST_NODES: dict[str, Any] = {
+    "test.my_project.unique_users_id": {
+        "unique_id": "test.my_project.unique_users_id",
+        "test_metadata": {"name": "unique", "kwargs": {"column_name": "id"}},
+        "refs": [{"name": "users"}],
+    },
+    "test.my_project.not_null_users_email": {
+        "unique_id": "test.my_project.not_null_users_email",
+        "test_metadata": {"name": "not_null", "kwargs": {"column_name": "email"}},
+        "refs": [{"name": "users"}],
+    },
+    "model.my_project.users": {
+        "unique_id": "model.my_project.users",
+        "database": "analytics",
+        "schema": "public",
+        "name": "users",
+    },
+}
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_run_results() -> RunResults:
     """Create minimal mock RunResults for testing."""
     return RunResults(
         metadata=RunResultsMetadata(
-            generated_at=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+            generated_at=MOCK_GENERATED_AT,
             invocation_id="test-invocation-id",
             dbt_version="1.10.0",
             elapsed_time=5.5,
@@ -64,82 +120,79 @@ def mock_run_results() -> RunResults:
 
 @pytest.fixture
 def mock_manifest() -> Manifest:
-    """Create minimal mock Manifest for testing."""
+    """Create minimal mock Manifest for testing.
+
+    Nodes are shared across tests (never mutated); metadata is rebuilt per
+    test because some tests set project_name on it.
+    """
     return Manifest(
-        nodes={
-            "test.my_project.unique_users_id": {
-                "unique_id": "test.my_project.unique_users_id",
-                "test_metadata": {"name": "unique", "kwargs": {"column_name": "id"}},
-                "refs": [{"name": "users"}],
-            },
-            "test.my_project.not_null_users_email": {
-                "unique_id": "test.my_project.not_null_users_email",
-                "test_metadata": {
-                    "name": "not_null",
-                    "kwargs": {"column_name": "email"},
-                },
-                "refs": [{"name": "users"}],
-            },
-            "model.my_project.users": {
-                "unique_id": "model.my_project.users",
-                "database": "analytics",
-                "schema": "public",
-                "name": "users",
-            },
-        },
-        sources={},
-        metadata={"dbt_version": "1.10.0"},
+        nodes=MOCK_MANIFEST_NODES, sources={}, metadata={"dbt_version": "1.10.0"}
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_run_event() -> RunEvent:
-    """Create mock RunEvent for testing."""
-    mock_event = MagicMock(spec=RunEvent)
-    mock_event.eventType = "COMPLETE"
-    return mock_event
+    """Create stand-in RunEvent for testing (events only flow through mocks)."""
+    return cast(RunEvent, SimpleNamespace(eventType="COMPLETE"))
 
 
-@pytest.fixture
-def mock_completed_process_success() -> subprocess.CompletedProcess[bytes]:
-    """Mock successful dbt test subprocess result."""
-    return subprocess.CompletedProcess(
-        args=["dbt", "test"],
-        returncode=0,
-        stdout=b"Completed successfully",
-        stderr=b"",
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create read-only config files shared by the config file tests.
+
+    Returns:
+        Directory with endpoint.yml, env-endpoint.yml, invalid.yml, job.yml
+        and a discover/ subdirectory holding an auto-discoverable config.
+    """
+    config_dir: Path = tmp_path_factory.mktemp("config")
+    (config_dir / "endpoint.yml").write_text(
+        """\
+correlator:
+  endpoint: http://config-file-endpoint:8080/api/v1/lineage/events
+  namespace: from-config
+"""
+    )
+    (config_dir / "env-endpoint.yml").write_text(
+        """\
+correlator:
+  endpoint: ${MY_ENDPOINT}
+"""
     )
+    (config_dir / "invalid.yml").write_text("invalid: yaml: [unclosed")
+    (config_dir / "job.yml").write_text("job:\n  name: from_config\n")
+    (config_dir / "discover").mkdir()
+    (config_dir / "discover" / ".dbt-correlator.yml").write_text(
+        """\
+correlator:
+  endpoint: http://auto-discovered:8080/api/v1/lineage/events
+  namespace: auto-discovered-namespace
+"""
+    )
+    return config_dir
 
 
-@pytest.fixture
-def mock_completed_process_failure() -> subprocess.CompletedProcess[bytes]:
-    """Mock failed dbt test subprocess result (test failures)."""
-    return subprocess.CompletedProcess(
-        args=["dbt", "test"],
-        returncode=1,
-        stdout=b"1 of 5 tests failed",
-        stderr=b"",
-    )
+@pytest.fixture(scope="session")
+def help_result(runner: CliRunner) -> Callable[..., Result]:
+    """Invoke --help for a (sub)command once per session and share the result.
 
+    Help output does not depend on any mocks, so tests checking different
+    parts of the same help text can reuse one invocation.
+    """
 
-@pytest.fixture
-def mock_completed_process_error() -> subprocess.CompletedProcess[bytes]:
-    """Mock dbt test subprocess error (compilation error)."""
-    return subprocess.CompletedProcess(
-        args=["dbt", "test"],
-        returncode=2,
-        stdout=b"",
-        stderr=b"Compilation error",
-    )
+    @functools.cache
+    def invoke_help(*command: str) -> Result:
+        return runner.invoke(cli, [*command, "--help"])
+
+    return invoke_help
 
 
 @pytest.fixture
 def cli_mocks(
+    monkeypatch: pytest.MonkeyPatch,
     mock_run_results: RunResults,
     mock_manifest: Manifest,
     mock_run_event: RunEvent,
-    mock_completed_process_success: subprocess.CompletedProcess[bytes],
-) -> Iterator[dict[str, Any]]:
+) -> dict[str, Any]:
     """Consolidated fixture that mocks all CLI dependencies.
 
     This fixture eliminates the need to repeat multiple @patch decorators on every test.
@@ -148,45 +201,41 @@ def cli_mocks(
     Returns:
         Dictionary with all mock objects for assertion access.
     """
-    with (
-        patch("dbt_correlator.cli.subprocess.run") as mock_subprocess,
-        patch("dbt_correlator.cli.emit_events") as mock_emit,
-        patch("dbt_correlator.cli.construct_test_events") as mock_construct,
-        patch("dbt_correlator.cli.construct_lineage_events") as mock_lineage_events,
-        patch("dbt_correlator.cli.create_wrapping_event") as mock_wrapping,
-        patch("dbt_correlator.cli.parse_manifest") as mock_parse_manifest,
-        patch("dbt_correlator.cli.parse_run_results") as mock_parse_results,
-        patch("dbt_correlator.cli.extract_all_model_lineage") as mock_extract_lineage,
-        patch("dbt_correlator.cli.get_executed_models") as mock_get_executed,
-        patch("dbt_correlator.cli.extract_model_results") as mock_extract_model_results,
-    ):
-        # Set default return values
-        mock_subprocess.return_value = mock_completed_process_success
-        mock_parse_results.return_value = mock_run_results
-        mock_parse_manifest.return_value = mock_manifest
-        mock_wrapping.return_value = mock_run_event
-        mock_construct.return_value = [mock_run_event]
-        # construct_lineage_events returns list of events
-        mock_lineage_events.return_value = [mock_run_event]
-        mock_extract_lineage.return_value = []  # Empty list of ModelLineage
-        mock_get_executed.return_value = {"model.my_project.users"}
-        mock_extract_model_results.return_value = {}
-
-        yield {
-            "subprocess": mock_subprocess,
-            "emit": mock_emit,
-            "construct": mock_construct,
-            "construct_lineage": mock_lineage_events,
-            "wrapping": mock_wrapping,
-            "parse_manifest": mock_parse_manifest,
-            "parse_results": mock_parse_results,
-            "extract_lineage": mock_extract_lineage,
-            "get_executed": mock_get_executed,
-            "extract_model_results": mock_extract_model_results,
-            "run_results": mock_run_results,
-            "manifest": mock_manifest,
-            "run_event": mock_run_event,
-        }
+    # Key -> patched attribute. monkeypatch sets and restores plain
+    # attributes, with no patcher objects to enter and exit per test. Plain
+    # Mock skips MagicMock's magic-method setup, which none of these need.
+    targets = {
+        "dbt": "dbt_correlator.cli._run_dbt",
+        "emit": "dbt_correlator.emitter.emit_events",
+        "construct": "dbt_correlator.emitter.construct_test_events",
+        "construct_lineage": "dbt_correlator.emitter.iter_lineage_events",
+        "wrapping": "dbt_correlator.emitter.create_wrapping_event",
+        "parse_manifest": "dbt_correlator.parser.parse_manifest",
+        "parse_results": "dbt_correlator.parser.parse_run_results",
+        "extract_run_data": "dbt_correlator.parser.extract_run_data",
+    }
+    mocks: dict[str, Any] = {key: Mock() for key in targets}
+    for key, target in targets.items():
+        monkeypatch.setattr(target, mocks[key])
+
+    # Set default return values
+    mocks["dbt"].return_value = DBT_EXIT_SUCCESS
+    mocks["parse_results"].return_value = mock_run_results
+    mocks["parse_manifest"].return_value = mock_manifest
+    mocks["wrapping"].return_value = mock_run_event
+    mocks["construct"].return_value = [mock_run_event]
+    # iter_lineage_events yields events; a list stands in for the generator
+    mocks["construct_lineage"].return_value = [mock_run_event]
+    mocks["extract_run_data"].return_value = RunData(
+        executed_models={"model.my_project.users"},
+        execution_results={},
+        lineages=[],  # Empty list of ModelLineage
+    )
+
+    mocks["run_results"] = mock_run_results
+    mocks["manifest"] = mock_manifest
+    mocks["run_event"] = mock_run_event
+    return mocks
 
 
 # =============================================================================
@@ -206,17 +255,17 @@ class TestCommandStructure:
         assert __version__ in result.output
         assert "dbt-correlator" in result.output
 
-    def test_cli_help_option(self, runner: CliRunner) -> None:
+    def test_cli_help_option(self, help_result: Callable[..., Result]) -> None:
         """Test that --help option shows help text."""
-        result = runner.invoke(cli, ["--help"])
+        result = help_result()
 
         assert result.exit_code == 0
         assert "dbt-correlator" in result.output
         assert "test" in result.output  # test command listed
 
-    def test_test_command_help(self, runner: CliRunner) -> None:
+    def test_test_command_help(self, help_result: Callable[..., Result]) -> None:
         """Test that 'dbt-correlator test --help' shows test command help."""
-        result = runner.invoke(cli, ["test", "--help"])
+        result = help_result("test")
 
         assert result.exit_code == 0
         assert "--correlator-endpoint" in result.output
@@ -231,6 +280,38 @@ class TestCommandStructure:
         assert result.exit_code != 0
         assert "correlator-endpoint" in result.output.lower()
 
+    def test_cli_import_does_not_load_emitter_or_parser(self) -> None:
+        """Test that importing the CLI defers emitter, parser and other heavy imports.
+
+        Runs in a fresh interpreter since this test session has already
+        imported everything.
+        """
+        code = (
+            "import sys, dbt_correlator.cli\n"
+            "heavy = ('dbt_correlator.emitter', 'dbt_correlator.parser',"
+            " 'openlineage.client', 'requests', 'yaml', 'uuid6', 'orjson')\n"
+            "sys.exit(sorted(m for m in heavy if m in sys.modules) or 0)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_workflow_commands_share_parameter_types(self) -> None:
+        """Test that test, run and build reuse one instance of each option type."""
+        commands = [cli.commands[name] for name in ("test", "run", "build")]
+
+        options = ("project_dir", "profiles_dir", "emit_compression")
+        for option in (*options, "emit_concurrency"):
+            types = {
+                id(param.type)
+                for command in commands
+                for param in command.params
+                if param.name == option
+            }
+            assert len(types) == 1, option
+
 
 # =============================================================================
 # B. Execution Flow Tests
@@ -244,38 +325,60 @@ class TestExecutionFlow:
     def test_test_command_runs_dbt_test(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that test command calls subprocess.run with dbt test."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        """Test that test command launches dbt test."""
+        invoke_test(runner)
 
-        cli_mocks["subprocess"].assert_called_once()
-        call_args = cli_mocks["subprocess"].call_args
+        cli_mocks["dbt"].assert_called_once()
+        call_args = cli_mocks["dbt"].call_args
         assert "dbt" in call_args[0][0]
         assert "test" in call_args[0][0]
 
+    def test_dbt_launched_without_closing_fds(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that dbt inherits the process group and skips the fd close pass."""
+        run = Mock(return_value=SimpleNamespace(returncode=DBT_EXIT_FAILURE))
+        monkeypatch.setattr("dbt_correlator.cli.subprocess.run", run)
+
+        assert _run_dbt(["dbt", "test"], ".") == DBT_EXIT_FAILURE
+
+        kwargs = run.call_args.kwargs
+        assert kwargs["close_fds"] is False
+        assert not kwargs.get("start_new_session")
+
+    def test_artifacts_parsed_concurrently(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that manifest is parsed on a worker thread alongside run_results."""
+        threads: dict[str, threading.Thread] = {}
+
+        def record(name: str, value: Any) -> Any:
+            def side_effect(*args: Any, **kwargs: Any) -> Any:
+                threads[name] = threading.current_thread()
+                return value
+
+            return side_effect
+
+        cli_mocks["parse_manifest"].side_effect = record(
+            "manifest", cli_mocks["manifest"]
+        )
+        cli_mocks["parse_results"].side_effect = record(
+            "run_results", cli_mocks["run_results"]
+        )
+
+        result = invoke_test(runner, "--job-name", "my_job")
+
+        assert result.exit_code == 0
+        assert threads["run_results"] is threading.main_thread()
+        assert threads["manifest"] is not threading.main_thread()
+
     def test_test_command_passes_dbt_args(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that pass-through args (--select) are passed to dbt test."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--",
-                "--select",
-                "my_model",
-            ],
-        )
+        invoke_test(runner, "--", "--select", "my_model")
 
-        call_args = cli_mocks["subprocess"].call_args[0][0]
+        call_args = cli_mocks["dbt"].call_args[0][0]
         assert "--select" in call_args
         assert "my_model" in call_args
 
@@ -283,18 +386,9 @@ class TestExecutionFlow:
         self, runner: CliRunner, cli_mocks: dict[str, Any], tmp_path: Path
     ) -> None:
         """Test that --project-dir is passed to dbt."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--project-dir",
-                str(tmp_path),
-            ],
-        )
+        invoke_test(runner, "--project-dir", str(tmp_path))
 
-        call_args = cli_mocks["subprocess"].call_args[0][0]
+        call_args = cli_mocks["dbt"].call_args[0][0]
         assert "--project-dir" in call_args
         assert str(tmp_path) in call_args
 
@@ -305,18 +399,9 @@ class TestExecutionFlow:
         profiles_dir = tmp_path / "profiles"
         profiles_dir.mkdir()
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--profiles-dir",
-                str(profiles_dir),
-            ],
-        )
+        invoke_test(runner, "--profiles-dir", str(profiles_dir))
 
-        call_args = cli_mocks["subprocess"].call_args[0][0]
+        call_args = cli_mocks["dbt"].call_args[0][0]
         assert "--profiles-dir" in call_args
         assert str(profiles_dir) in call_args
 
@@ -334,67 +419,47 @@ class TestEventGeneration:
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that START event is created before dbt test runs."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         start_call = cli_mocks["wrapping"].call_args_list[0]
         assert start_call[0][0] == "START"
 
-    def test_test_command_generates_complete_event_on_success(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
-    ) -> None:
-        """Test that COMPLETE event is created when dbt test succeeds."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
-
-        complete_call = cli_mocks["wrapping"].call_args_list[1]
-        assert complete_call[0][0] == "COMPLETE"
-
-    def test_test_command_generates_fail_event_on_failure(
+    @pytest.mark.parametrize(
+        ("dbt_exit_code", "expected_event_type"),
+        [(DBT_EXIT_SUCCESS, "COMPLETE"), (DBT_EXIT_FAILURE, "FAIL")],
+    )
+    def test_test_command_generates_terminal_event(
         self,
         runner: CliRunner,
         cli_mocks: dict[str, Any],
-        mock_completed_process_failure: subprocess.CompletedProcess[bytes],
+        dbt_exit_code: int,
+        expected_event_type: str,
     ) -> None:
-        """Test that FAIL event is created when dbt test fails."""
-        cli_mocks["subprocess"].return_value = mock_completed_process_failure
+        """Test that COMPLETE/FAIL event is created when dbt test succeeds/fails."""
+        cli_mocks["dbt"].return_value = dbt_exit_code
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
+
+        terminal_call = cli_mocks["wrapping"].call_args_list[1]
+        assert terminal_call[0][0] == expected_event_type
+
+    def test_terminal_time_measured_from_start_on_monotonic_clock(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that the terminal event time is START time plus elapsed time."""
+        with patch("dbt_correlator.cli.time") as mock_time:
+            mock_time.monotonic.side_effect = [100.0, 160.5]
+            invoke_test(runner)
 
-        fail_call = cli_mocks["wrapping"].call_args_list[1]
-        assert fail_call[0][0] == "FAIL"
+        start_call, complete_call = cli_mocks["wrapping"].call_args_list
+        elapsed = complete_call[0][4] - start_call[0][4]
+        assert elapsed.total_seconds() == 60.5
 
     def test_test_command_constructs_test_events(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that test events are constructed from artifacts."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         cli_mocks["construct"].assert_called_once()
         call_kwargs = cli_mocks["construct"].call_args[1]
@@ -420,7 +485,7 @@ class TestEmission:
         1. START event immediately
         2. lineage + test + terminal events in batch
         """
-        endpoint = "http://localhost:8080/api/v1/lineage/events"
+        endpoint = MOCK_CORRELATOR_ENDPOINT
         runner.invoke(cli, ["test", "--correlator-endpoint", endpoint])
 
         # Should be called twice (START + batch)
@@ -434,16 +499,7 @@ class TestEmission:
     ) -> None:
         """Test that API key is passed to emit_events when provided."""
         api_key = "test-api-key-123"
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--correlator-api-key",
-                api_key,
-            ],
-        )
+        invoke_test(runner, "--correlator-api-key", api_key)
 
         # Should be called twice (START + batch)
         assert cli_mocks["emit"].call_count == 2
@@ -451,6 +507,49 @@ class TestEmission:
         for call in cli_mocks["emit"].call_args_list:
             assert call[0][2] == api_key
 
+    @pytest.mark.parametrize(
+        ("args", "expected"), [([], "none"), (["--emit-compression", "gzip"], "gzip")]
+    )
+    def test_emit_compression_passed_to_emit_events(
+        self,
+        runner: CliRunner,
+        cli_mocks: dict[str, Any],
+        args: list[str],
+        expected: str,
+    ) -> None:
+        """Test that --emit-compression reaches every emit_events call."""
+        invoke_test(runner, *args)
+
+        assert cli_mocks["emit"].call_count == 2
+        for call in cli_mocks["emit"].call_args_list:
+            assert call.kwargs["compression"] == expected
+
+    @pytest.mark.parametrize(
+        ("args", "expected"), [([], 8), (["--emit-concurrency", "2"], 2)]
+    )
+    def test_emit_concurrency_passed_to_emit_events(
+        self,
+        runner: CliRunner,
+        cli_mocks: dict[str, Any],
+        args: list[str],
+        expected: int,
+    ) -> None:
+        """Test that --emit-concurrency bounds every emit_events call."""
+        invoke_test(runner, *args)
+
+        assert cli_mocks["emit"].call_count == 2
+        for call in cli_mocks["emit"].call_args_list:
+            assert call.kwargs["max_workers"] == expected
+
+    def test_emit_concurrency_rejects_zero(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that --emit-concurrency below 1 is a usage error."""
+        result = runner.invoke(cli, ["test", "--emit-concurrency", "0"])
+
+        assert result.exit_code == 2
+        cli_mocks["emit"].assert_not_called()
+
     def test_test_command_batch_emits_all_events(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
@@ -467,14 +566,7 @@ class TestEmission:
         ]
         # Note: construct_lineage is NOT called for test command
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         # Should be called twice (START + batch)
         assert cli_mocks["emit"].call_count == 2
@@ -482,7 +574,7 @@ class TestEmission:
         start_events = cli_mocks["emit"].call_args_list[0][0][0]
         assert len(start_events) == 1
         # Second call: test events (2) + terminal (1) = 3 events (no lineage)
-        batch_events = cli_mocks["emit"].call_args_list[1][0][0]
+        batch_events = list(cli_mocks["emit"].call_args_list[1][0][0])
         assert len(batch_events) == 3
 
 
@@ -495,61 +587,18 @@ class TestEmission:
 class TestExitCodes:
     """Tests for exit code propagation from dbt."""
 
-    def test_test_command_exits_with_dbt_exit_code_success(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
-    ) -> None:
-        """Test that CLI exits with 0 when dbt test succeeds."""
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
-
-        assert cli_mocks
-        assert result.exit_code == 0
-
-    def test_test_command_exits_with_dbt_exit_code_failure(
-        self,
-        runner: CliRunner,
-        cli_mocks: dict[str, Any],
-        mock_completed_process_failure: subprocess.CompletedProcess[bytes],
-    ) -> None:
-        """Test that CLI exits with 1 when dbt test has failures."""
-        cli_mocks["subprocess"].return_value = mock_completed_process_failure
-
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
-
-        assert result.exit_code == 1
-
-    def test_test_command_exits_with_dbt_exit_code_error(
-        self,
-        runner: CliRunner,
-        cli_mocks: dict[str, Any],
-        mock_completed_process_error: subprocess.CompletedProcess[bytes],
+    @pytest.mark.parametrize(
+        "dbt_exit_code", [DBT_EXIT_SUCCESS, DBT_EXIT_FAILURE, DBT_EXIT_ERROR]
+    )
+    def test_test_command_exits_with_dbt_exit_code(
+        self, runner: CliRunner, cli_mocks: dict[str, Any], dbt_exit_code: int
     ) -> None:
-        """Test that CLI exits with 2 when dbt has compilation error."""
-        cli_mocks["subprocess"].return_value = mock_completed_process_error
+        """Test that CLI exits with dbt's exit code."""
+        cli_mocks["dbt"].return_value = dbt_exit_code
 
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        result = invoke_test(runner)
 
-        assert result.exit_code == 2
+        assert result.exit_code == dbt_exit_code
 
 
 # =============================================================================
@@ -564,53 +613,133 @@ class TestSkipDbtRun:
     def test_test_command_skip_dbt_run_skips_subprocess(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that --skip-dbt-run skips subprocess call."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--skip-dbt-run",
-            ],
-        )
+        """Test that --skip-dbt-run skips launching dbt."""
+        invoke_test(runner, "--skip-dbt-run")
 
-        cli_mocks["subprocess"].assert_not_called()
+        cli_mocks["dbt"].assert_not_called()
 
     def test_test_command_skip_dbt_run_uses_existing_artifacts(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that --skip-dbt-run still parses existing artifacts."""
-        runner.invoke(
+        invoke_test(runner, "--skip-dbt-run")
+
+        cli_mocks["parse_results"].assert_called_once()
+        # Manifest parsed for job_name is reused for artifact processing
+        cli_mocks["parse_manifest"].assert_called_once()
+
+    def test_test_command_skip_dbt_run_still_emits_events(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that --skip-dbt-run still emits events."""
+        invoke_test(runner, "--skip-dbt-run")
+
+        # START is folded into the single batch - no dbt run to observe
+        assert cli_mocks["emit"].call_count == 1
+
+    @pytest.mark.parametrize("command", ["test", "run", "build"])
+    def test_skip_dbt_run_batches_start_event(
+        self, runner: CliRunner, cli_mocks: dict[str, Any], command: str
+    ) -> None:
+        """Test that --skip-dbt-run sends START at the head of the only batch."""
+        cli_mocks["wrapping"].side_effect = lambda event_type, *args, **kwargs: (
+            event_type
+        )
+
+        result = runner.invoke(
             cli,
             [
-                "test",
+                command,
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
                 "--skip-dbt-run",
             ],
         )
 
-        cli_mocks["parse_results"].assert_called_once()
-        # parse_manifest is called twice: once for job_name, once for artifacts
-        assert cli_mocks["parse_manifest"].call_count >= 1
+        assert result.exit_code == 0
+        assert cli_mocks["emit"].call_count == 1
+        events = list(cli_mocks["emit"].call_args[0][0])
+        assert events[0] == "START"
+        assert events[-1] == "COMPLETE"
 
-    def test_test_command_skip_dbt_run_still_emits_events(
+    def test_skip_dbt_run_with_explicit_eager_start_emits_twice(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that --skip-dbt-run still emits events."""
-        runner.invoke(
+        """Test that an explicit --eager-start overrides the skip-path batching."""
+        invoke_test(runner, "--skip-dbt-run", "--eager-start")
+
+        assert cli_mocks["emit"].call_count == 2
+
+    @pytest.mark.parametrize(
+        ("args", "expected"), [([], False), (["--manifest-lean"], True)]
+    )
+    def test_manifest_lean_passed_to_parse_manifest(
+        self,
+        runner: CliRunner,
+        cli_mocks: dict[str, Any],
+        args: list[str],
+        expected: bool,
+    ) -> None:
+        """Test that --manifest-lean reaches every parse_manifest call."""
+        invoke_test(runner, "--skip-dbt-run", *args)
+
+        for call in cli_mocks["parse_manifest"].call_args_list:
+            assert call.kwargs["lean"] is expected
+
+    def test_artifacts_not_cached_on_disk_by_default(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that nothing is written to target/ unless the user opts in."""
+        invoke_test(runner, "--skip-dbt-run")
+
+        assert cli_mocks["parse_results"].call_args[1]["persistent_cache"] is False
+        assert cli_mocks["parse_manifest"].call_args[1]["persistent_cache"] is False
+
+    def test_cache_artifacts_enables_sidecar_cache(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that --cache-artifacts enables the persistent sidecar cache."""
+        invoke_test(runner, "--skip-dbt-run", "--cache-artifacts")
+
+        assert cli_mocks["parse_results"].call_args[1]["persistent_cache"] is True
+        assert cli_mocks["parse_manifest"].call_args[1]["persistent_cache"] is True
+
+    def test_scratch_target_redirects_dbt_and_is_removed(
+        self, runner: CliRunner, cli_mocks: dict[str, Any], tmp_path: Path
+    ) -> None:
+        """Test that --scratch-target reads artifacts from a removed temp dir."""
+        result = runner.invoke(
             cli,
             [
-                "test",
+                "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--skip-dbt-run",
+                MOCK_CORRELATOR_ENDPOINT,
+                "--project-dir",
+                str(tmp_path),
+                "--scratch-target",
+                "--cache-artifacts",
             ],
         )
 
-        # Test command emits twice (START + batch)
-        assert cli_mocks["emit"].call_count == 2
+        assert result.exit_code == 0
+        cmd = cli_mocks["dbt"].call_args[0][0]
+        target_path = Path(cmd[cmd.index("--target-path") + 1])
+        run_results_path = Path(cli_mocks["parse_results"].call_args[0][0])
+        assert run_results_path == target_path / "run_results.json"
+        assert cli_mocks["parse_results"].call_args[1]["persistent_cache"] is False
+        assert not target_path.exists()
+
+    def test_create_scratch_target_seeds_partial_parse(self, tmp_path: Path) -> None:
+        """Test that dbt's partial parse state is copied into the scratch dir."""
+        (tmp_path / "target").mkdir()
+        (tmp_path / "target" / PARTIAL_PARSE_FILENAME).write_bytes(b"state")
+
+        target_path = Path(create_scratch_target(str(tmp_path)))
+        try:
+            assert (target_path / PARTIAL_PARSE_FILENAME).read_bytes() == b"state"
+        finally:
+            target_path.joinpath(PARTIAL_PARSE_FILENAME).unlink()
+            target_path.rmdir()
 
 
 # =============================================================================
@@ -627,18 +756,11 @@ class TestErrorHandling:
     ) -> None:
         """Test that missing artifacts produce clear error."""
         cli_mocks["parse_results"].side_effect = FileNotFoundError(
-            "run_results.json not found"
-        )
-
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
+            "run_results.json not found"
         )
 
+        result = invoke_test(runner)
+
         assert result.exit_code != 0
         assert "run_results.json" in result.output or "not found" in result.output
 
@@ -646,52 +768,30 @@ class TestErrorHandling:
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that dbt not found produces clear error."""
-        cli_mocks["subprocess"].side_effect = FileNotFoundError("dbt not found")
+        cli_mocks["dbt"].side_effect = FileNotFoundError("dbt not found")
 
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        result = invoke_test(runner)
 
         assert result.exit_code != 0
         assert "dbt" in result.output.lower()
 
-    def test_test_command_handles_correlator_unreachable(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
-    ) -> None:
-        """Test that Correlator unreachable logs warning but doesn't fail dbt."""
-        cli_mocks["emit"].side_effect = ConnectionError("Connection refused")
-
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "warning" in result.output.lower() or "failed" in result.output.lower()
-
-    def test_test_command_handles_emission_timeout(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    @pytest.mark.parametrize(
+        "emit_error",
+        [
+            ConnectionError("Connection refused"),  # Correlator unreachable
+            TimeoutError("Request timed out"),  # emission timeout
+        ],
+    )
+    def test_test_command_handles_emission_errors(
+        self,
+        runner: CliRunner,
+        cli_mocks: dict[str, Any],
+        emit_error: Exception,
     ) -> None:
-        """Test that emission timeout logs warning but doesn't fail dbt."""
-        cli_mocks["emit"].side_effect = TimeoutError("Request timed out")
+        """Test that emission errors log a warning but don't fail dbt."""
+        cli_mocks["emit"].side_effect = emit_error
 
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        result = invoke_test(runner)
 
         assert result.exit_code == 0
         assert "warning" in result.output.lower() or "failed" in result.output.lower()
@@ -707,26 +807,10 @@ class TestConfigFileIntegration:
     """Tests for config file integration with CLI."""
 
     def test_test_command_with_config_file(
-        self, runner: CliRunner, cli_mocks: dict[str, Any], tmp_path: Path
+        self, runner: CliRunner, cli_mocks: dict[str, Any], config_dir: Path
     ) -> None:
         """Test that config file values are used when no CLI args provided."""
-        config_file = tmp_path / ".dbt-correlator.yml"
-        config_file.write_text(
-            """\
-correlator:
-  endpoint: http://config-file-endpoint:8080/api/v1/lineage/events
-  namespace: from-config
-"""
-        )
-
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--config",
-                str(config_file),
-            ],
-        )
+        runner.invoke(cli, ["test", "--config", str(config_dir / "endpoint.yml")])
 
         # Verify the endpoint from config file was used (test emits twice)
         assert cli_mocks["emit"].call_count == 2
@@ -737,24 +821,15 @@ correlator:
             )
 
     def test_cli_args_override_config_file(
-        self, runner: CliRunner, cli_mocks: dict[str, Any], tmp_path: Path
+        self, runner: CliRunner, cli_mocks: dict[str, Any], config_dir: Path
     ) -> None:
         """Test that CLI args take precedence over config file values."""
-        config_file = tmp_path / ".dbt-correlator.yml"
-        config_file.write_text(
-            """\
-correlator:
-  endpoint: http://config-file-endpoint:8080
-  namespace: from-config
-"""
-        )
-
         runner.invoke(
             cli,
             [
                 "test",
                 "--config",
-                str(config_file),
+                str(config_dir / "endpoint.yml"),
                 "--correlator-endpoint",
                 "http://cli-override:8080/api/v1/lineage/events",
             ],
@@ -766,37 +841,31 @@ correlator:
         for call in cli_mocks["emit"].call_args_list:
             assert call[0][1] == "http://cli-override:8080/api/v1/lineage/events"
 
-    def test_config_option_shown_in_help(self, runner: CliRunner) -> None:
+    def test_config_option_shown_in_help(
+        self, help_result: Callable[..., Result]
+    ) -> None:
         """Test that --config option appears in help."""
-        result = runner.invoke(cli, ["test", "--help"])
+        result = help_result("test")
 
         assert result.exit_code == 0
         assert "--config" in result.output
 
     def test_invalid_config_file_shows_error(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, config_dir: Path
     ) -> None:
         """Test that invalid YAML config file produces clear error."""
-        config_file = tmp_path / "invalid.yml"
-        config_file.write_text("invalid: yaml: [unclosed")
-
         result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--config",
-                str(config_file),
-            ],
+            cli, ["test", "--config", str(config_dir / "invalid.yml")]
         )
 
         assert result.exit_code != 0
         assert "invalid" in result.output.lower() or "yaml" in result.output.lower()
 
     def test_missing_config_file_with_explicit_path_shows_error(
-        self, runner: CliRunner, tmp_path: Path
+        self, runner: CliRunner, config_dir: Path
     ) -> None:
         """Test that explicitly specified missing config file shows error."""
-        non_existent = tmp_path / "does-not-exist.yml"
+        non_existent = config_dir / "does-not-exist.yml"
 
         result = runner.invoke(
             cli,
@@ -814,28 +883,13 @@ correlator:
         self,
         runner: CliRunner,
         cli_mocks: dict[str, Any],
-        tmp_path: Path,
+        config_dir: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that env vars in config file are expanded."""
         monkeypatch.setenv("MY_ENDPOINT", "http://from-env:8080/api/v1/lineage/events")
 
-        config_file = tmp_path / ".dbt-correlator.yml"
-        config_file.write_text(
-            """\
-correlator:
-  endpoint: ${MY_ENDPOINT}
-"""
-        )
-
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--config",
-                str(config_file),
-            ],
-        )
+        runner.invoke(cli, ["test", "--config", str(config_dir / "env-endpoint.yml")])
 
         # Test command emits twice (START + batch)
         assert cli_mocks["emit"].call_count == 2
@@ -847,22 +901,12 @@ correlator:
         self,
         runner: CliRunner,
         cli_mocks: dict[str, Any],
-        tmp_path: Path,
+        config_dir: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that .dbt-correlator.yml is auto-discovered in cwd without --config."""
-        # Create config file in tmp_path (will be cwd)
-        config_file = tmp_path / ".dbt-correlator.yml"
-        config_file.write_text(
-            """\
-correlator:
-  endpoint: http://auto-discovered:8080/api/v1/lineage/events
-  namespace: auto-discovered-namespace
-"""
-        )
-
-        # Change working directory to tmp_path
-        monkeypatch.chdir(tmp_path)
+        # Change working directory to the one holding .dbt-correlator.yml
+        monkeypatch.chdir(config_dir / "discover")
 
         # Invoke WITHOUT --config flag - should auto-discover
         runner.invoke(
@@ -879,7 +923,7 @@ correlator:
         self,
         runner: CliRunner,
         cli_mocks: dict[str, Any],
-        tmp_path: Path,
+        config_dir: Path,
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that CORRELATOR_ENDPOINT env var overrides config file value."""
@@ -888,30 +932,43 @@ correlator:
             "CORRELATOR_ENDPOINT", "http://from-env-var:8080/api/v1/lineage/events"
         )
 
-        # Create config file with different endpoint
-        config_file = tmp_path / ".dbt-correlator.yml"
-        config_file.write_text(
-            """\
-correlator:
-  endpoint: http://from-config-file:8080/api/v1/lineage/events
-"""
-        )
-
-        # Invoke with config file - env var should still win
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--config",
-                str(config_file),
-            ],
-        )
+        # Invoke with a config file naming another endpoint - env var should win
+        runner.invoke(cli, ["test", "--config", str(config_dir / "endpoint.yml")])
 
         # Verify env var wins over config file (test emits twice)
         assert cli_mocks["emit"].call_count == 2
         for call in cli_mocks["emit"].call_args_list:
             assert call[0][1] == "http://from-env-var:8080/api/v1/lineage/events"
 
+    def test_config_not_loaded_during_shell_completion(self, config_dir: Path) -> None:
+        """Test that resilient parsing (shell completion) skips config loading."""
+        missing = str(config_dir / "missing.yml")
+
+        with patch("dbt_correlator.cli.load_yaml_config") as mock_load:
+            ctx = cli.commands["test"].make_context(
+                "test", ["--config", missing], resilient_parsing=True
+            )
+
+        mock_load.assert_not_called()
+        assert ctx.default_map is None
+
+    def test_config_file_layered_over_existing_default_map(
+        self, config_dir: Path
+    ) -> None:
+        """Test that config values override, and fall back to, a given default_map."""
+        config_file = config_dir / "job.yml"
+
+        ctx = cli.commands["test"].make_context(
+            "test",
+            ["--config", str(config_file)],
+            default_map={"job_name": "from_map", "dataset_namespace": "ns"},
+        )
+
+        assert ctx.default_map is not None
+        assert ctx.default_map["job_name"] == "from_config"
+        assert ctx.default_map["dataset_namespace"] == "ns"
+        assert ctx.params["job_name"] == "from_config"
+
 
 # =============================================================================
 # I. Run Command Tests
@@ -922,9 +979,9 @@ correlator:
 class TestRunCommand:
     """Tests for 'dbt-correlator run' command."""
 
-    def test_run_command_help(self, runner: CliRunner) -> None:
+    def test_run_command_help(self, help_result: Callable[..., Result]) -> None:
         """Test that 'dbt-correlator run --help' shows run command help."""
-        result = runner.invoke(cli, ["run", "--help"])
+        result = help_result("run")
 
         assert result.exit_code == 0
         assert "--correlator-endpoint" in result.output
@@ -939,24 +996,42 @@ class TestRunCommand:
         assert result.exit_code != 0
         assert "correlator-endpoint" in result.output.lower()
 
+    def test_lineage_and_terminal_events_share_completion_time(
+        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    ) -> None:
+        """Test that lineage events and the terminal event use one clock read."""
+        runner.invoke(
+            cli,
+            [
+                "run",
+                "--correlator-endpoint",
+                MOCK_CORRELATOR_ENDPOINT,
+            ],
+        )
+
+        event_time = cli_mocks["construct_lineage"].call_args.kwargs["event_time"]
+        terminal_call = cli_mocks["wrapping"].call_args_list[-1]
+        assert terminal_call.args[0] == "COMPLETE"
+        assert terminal_call.args[4].isoformat() == event_time
+
     def test_run_command_runs_dbt_run(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that run command calls subprocess.run with dbt run."""
+        """Test that run command launches dbt run."""
         runner.invoke(
             cli,
             [
                 "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
-        # Check subprocess was called with 'dbt run'
-        subprocess_calls = cli_mocks["subprocess"].call_args_list
+        # Check dbt was launched with 'dbt run'
+        dbt_calls = cli_mocks["dbt"].call_args_list
         # Find the call with 'run' command (skip any 'test' calls)
         run_call = None
-        for call in subprocess_calls:
+        for call in dbt_calls:
             if "run" in call[0][0]:
                 run_call = call
                 break
@@ -974,11 +1049,11 @@ class TestRunCommand:
             [
                 "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
-        cli_mocks["extract_lineage"].assert_called_once()
+        cli_mocks["extract_run_data"].assert_called_once()
         cli_mocks["construct_lineage"].assert_called_once()
 
     def test_run_command_emits_lineage_events(
@@ -990,7 +1065,7 @@ class TestRunCommand:
             [
                 "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
@@ -1000,20 +1075,20 @@ class TestRunCommand:
     def test_run_command_passes_dataset_namespace(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that --dataset-namespace is passed to extract_all_model_lineage."""
+        """Test that --dataset-namespace is passed to lineage extraction."""
         runner.invoke(
             cli,
             [
                 "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
                 "--dataset-namespace",
                 "postgresql://localhost:5432/mydb",
             ],
         )
 
-        # Verify namespace_override was passed to extract_all_model_lineage
-        call_kwargs = cli_mocks["extract_lineage"].call_args[1]
+        # Verify namespace_override was passed to extract_run_data
+        call_kwargs = cli_mocks["extract_run_data"].call_args[1]
         assert (
             call_kwargs.get("namespace_override") == "postgresql://localhost:5432/mydb"
         )
@@ -1027,14 +1102,13 @@ class TestRunCommand:
             [
                 "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
                 "--skip-dbt-run",
             ],
         )
 
-        # subprocess should only be called for emit, not dbt run
-        # When skipping, subprocess.run for 'dbt run' should not be called
-        for call in cli_mocks["subprocess"].call_args_list:
+        # When skipping, dbt run should not be launched
+        for call in cli_mocks["dbt"].call_args_list:
             cmd = call[0][0]
             # Should not have a 'dbt run' call
             assert not (
@@ -1046,16 +1120,14 @@ class TestRunCommand:
     ) -> None:
         """Test that run command propagates dbt exit code."""
         # Set up failure return code
-        cli_mocks["subprocess"].return_value = subprocess.CompletedProcess(
-            args=["dbt", "run"], returncode=1, stdout=b"", stderr=b""
-        )
+        cli_mocks["dbt"].return_value = DBT_EXIT_FAILURE
 
         result = runner.invoke(
             cli,
             [
                 "run",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
@@ -1071,9 +1143,9 @@ class TestRunCommand:
 class TestBuildCommand:
     """Tests for 'dbt-correlator build' command."""
 
-    def test_build_command_help(self, runner: CliRunner) -> None:
+    def test_build_command_help(self, help_result: Callable[..., Result]) -> None:
         """Test that 'dbt-correlator build --help' shows build command help."""
-        result = runner.invoke(cli, ["build", "--help"])
+        result = help_result("build")
 
         assert result.exit_code == 0
         assert "--correlator-endpoint" in result.output
@@ -1094,20 +1166,20 @@ class TestBuildCommand:
     def test_build_command_runs_dbt_build(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that build command calls subprocess.run with dbt build."""
+        """Test that build command launches dbt build."""
         runner.invoke(
             cli,
             [
                 "build",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
-        # Check subprocess was called with 'dbt build'
-        subprocess_calls = cli_mocks["subprocess"].call_args_list
+        # Check dbt was launched with 'dbt build'
+        dbt_calls = cli_mocks["dbt"].call_args_list
         build_call = None
-        for call in subprocess_calls:
+        for call in dbt_calls:
             if "build" in call[0][0]:
                 build_call = call
                 break
@@ -1125,7 +1197,7 @@ class TestBuildCommand:
             [
                 "build",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
@@ -1146,7 +1218,7 @@ class TestBuildCommand:
             [
                 "build",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
@@ -1168,16 +1240,14 @@ class TestBuildCommand:
     ) -> None:
         """Test that build command propagates dbt exit code."""
         # Set up failure return code (test failures)
-        cli_mocks["subprocess"].return_value = subprocess.CompletedProcess(
-            args=["dbt", "build"], returncode=1, stdout=b"", stderr=b""
-        )
+        cli_mocks["dbt"].return_value = DBT_EXIT_FAILURE
 
         result = runner.invoke(
             cli,
             [
                 "build",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
@@ -1192,13 +1262,13 @@ class TestBuildCommand:
             [
                 "build",
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
                 "--skip-dbt-run",
             ],
         )
 
         # Should not have a 'dbt build' call
-        for call in cli_mocks["subprocess"].call_args_list:
+        for call in cli_mocks["dbt"].call_args_list:
             cmd = call[0][0]
             assert not (
                 "dbt" in cmd and "build" in cmd and "--project-dir" in cmd
@@ -1214,9 +1284,11 @@ class TestBuildCommand:
 class TestCLIShowsAllCommands:
     """Tests to verify all commands are visible in CLI help."""
 
-    def test_cli_help_shows_all_commands(self, runner: CliRunner) -> None:
+    def test_cli_help_shows_all_commands(
+        self, help_result: Callable[..., Result]
+    ) -> None:
         """Test that main CLI help shows test, run, and build commands."""
-        result = runner.invoke(cli, ["--help"])
+        result = help_result()
 
         assert result.exit_code == 0
         assert "test" in result.output
@@ -1259,14 +1331,7 @@ class TestDynamicJobName:
         # Set up manifest with project_name
         cli_mocks["manifest"].metadata["project_name"] = "my_project"
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         # Verify wrapping event was called with dynamic job name
         wrapping_calls = cli_mocks["wrapping"].call_args_list
@@ -1282,16 +1347,7 @@ class TestDynamicJobName:
         """Test that --job-name overrides dynamic job name."""
         cli_mocks["manifest"].metadata["project_name"] = "my_project"
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--job-name",
-                "custom_job_name",
-            ],
-        )
+        invoke_test(runner, "--job-name", "custom_job_name")
 
         # Verify custom job name was used
         wrapping_calls = cli_mocks["wrapping"].call_args_list
@@ -1390,9 +1446,7 @@ class TestOpenLineageEnvVarCompatibility:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that OPENLINEAGE_API_KEY env var is used when no API key provided."""
-        monkeypatch.setenv(
-            "CORRELATOR_ENDPOINT", "http://localhost:8080/api/v1/lineage/events"
-        )
+        monkeypatch.setenv("CORRELATOR_ENDPOINT", MOCK_CORRELATOR_ENDPOINT)
         monkeypatch.setenv("OPENLINEAGE_API_KEY", "openlineage-api-key-123")
 
         runner.invoke(cli, ["test"])
@@ -1409,9 +1463,7 @@ class TestOpenLineageEnvVarCompatibility:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that CORRELATOR_API_KEY takes priority over OPENLINEAGE_API_KEY."""
-        monkeypatch.setenv(
-            "CORRELATOR_ENDPOINT", "http://localhost:8080/api/v1/lineage/events"
-        )
+        monkeypatch.setenv("CORRELATOR_ENDPOINT", MOCK_CORRELATOR_ENDPOINT)
         monkeypatch.setenv("CORRELATOR_API_KEY", "correlator-api-key-456")
         monkeypatch.setenv("OPENLINEAGE_API_KEY", "openlineage-api-key-123")
 
@@ -1429,22 +1481,11 @@ class TestOpenLineageEnvVarCompatibility:
         monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that CLI --correlator-api-key overrides all env vars."""
-        monkeypatch.setenv(
-            "CORRELATOR_ENDPOINT", "http://localhost:8080/api/v1/lineage/events"
-        )
+        monkeypatch.setenv("CORRELATOR_ENDPOINT", MOCK_CORRELATOR_ENDPOINT)
         monkeypatch.setenv("CORRELATOR_API_KEY", "correlator-env-key")
         monkeypatch.setenv("OPENLINEAGE_API_KEY", "openlineage-env-key")
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--correlator-api-key",
-                "cli-override-key",
-            ],
-        )
+        invoke_test(runner, "--correlator-api-key", "cli-override-key")
 
         # CLI arg should win (test emits twice)
         assert cli_mocks["emit"].call_count == 2
@@ -1473,108 +1514,85 @@ class TestOpenLineageEnvVarCompatibility:
 
 @pytest.mark.unit
 class TestStartEmissionTiming:
-    """Tests to verify START event is emitted before dbt execution."""
+    """Tests to verify START event is emitted as dbt execution starts."""
 
-    def test_start_event_emitted_before_dbt_test_runs(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    @pytest.mark.parametrize("command", ["test", "run", "build"])
+    def test_start_event_emitted_while_dbt_runs(
+        self, runner: CliRunner, cli_mocks: dict[str, Any], command: str
     ) -> None:
-        """Test that START event is emitted BEFORE dbt test subprocess runs.
+        """Test that START is emitted concurrently with the dbt subprocess.
 
-        This is critical for tracking job lifecycle in OpenLineage consumers.
-        The START event should be emitted immediately when the command starts,
-        not after dbt execution completes.
+        The START emission blocks until dbt has been launched, which would
+        deadlock if dbt waited for it. START must still be emitted before the
+        final batch carrying the terminal event.
         """
+        dbt_launched = threading.Event()
         call_order: list[str] = []
+        original_dbt = cli_mocks["dbt"]
 
-        # Track call order
-        original_subprocess = cli_mocks["subprocess"]
-
-        def track_emit(*args: Any, **kwargs: Any) -> None:
+        def track_emit(events: Any, *args: Any, **kwargs: Any) -> None:
+            if not call_order:
+                assert dbt_launched.wait(timeout=5), "START blocked dbt launch"
             call_order.append("emit")
 
-        def track_subprocess(*args: Any, **kwargs: Any) -> Any:
-            call_order.append("subprocess")
-            return original_subprocess.return_value
+        def track_dbt(*args: Any, **kwargs: Any) -> Any:
+            dbt_launched.set()
+            return original_dbt.return_value
 
         cli_mocks["emit"].side_effect = track_emit
-        cli_mocks["subprocess"].side_effect = track_subprocess
+        cli_mocks["dbt"].side_effect = track_dbt
 
-        runner.invoke(
+        result = runner.invoke(
             cli,
             [
-                "test",
+                command,
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
             ],
         )
 
-        # Verify emit was called before subprocess
-        # Call order should be: emit (START), subprocess (dbt test), emit (batch)
-        assert call_order[0] == "emit", "START event should be emitted before dbt runs"
-        assert call_order[1] == "subprocess", "dbt should run after START emission"
-        assert call_order[2] == "emit", "Batch emission should happen after dbt"
+        assert result.exit_code == 0
+        assert call_order == ["emit", "emit"]
+        start_call, batch_call = cli_mocks["emit"].call_args_list
+        assert len(start_call[0][0]) == 1
+        assert len(list(batch_call[0][0])) > 1
 
-    def test_start_event_emitted_before_dbt_run_runs(
+    def test_start_emission_failure_only_warns(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
-        """Test that START event is emitted BEFORE dbt run subprocess runs."""
-        call_order: list[str] = []
-
-        original_subprocess = cli_mocks["subprocess"]
-
-        def track_emit(*args: Any, **kwargs: Any) -> None:
-            call_order.append("emit")
+        """Test that a failed background START emission is reported as a warning."""
+        cli_mocks["emit"].side_effect = [ConnectionError("refused"), None]
 
-        def track_subprocess(*args: Any, **kwargs: Any) -> Any:
-            call_order.append("subprocess")
-            return original_subprocess.return_value
-
-        cli_mocks["emit"].side_effect = track_emit
-        cli_mocks["subprocess"].side_effect = track_subprocess
-
-        runner.invoke(
-            cli,
-            [
-                "run",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        result = invoke_test(runner)
 
-        # Verify emit (START) was called before subprocess (dbt run)
-        assert call_order[0] == "emit", "START event should be emitted before dbt runs"
-        assert call_order[1] == "subprocess", "dbt should run after START emission"
+        assert result.exit_code == 0
+        assert "Failed to emit START event: refused" in result.output
+        assert cli_mocks["emit"].call_count == 2
 
-    def test_start_event_emitted_before_dbt_build_runs(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
+    @pytest.mark.parametrize("command", ["test", "run", "build"])
+    def test_batch_start_defers_start_to_final_emission(
+        self, runner: CliRunner, cli_mocks: dict[str, Any], command: str
     ) -> None:
-        """Test that START event is emitted BEFORE dbt build subprocess runs."""
-        call_order: list[str] = []
-
-        original_subprocess = cli_mocks["subprocess"]
-
-        def track_emit(*args: Any, **kwargs: Any) -> None:
-            call_order.append("emit")
-
-        def track_subprocess(*args: Any, **kwargs: Any) -> Any:
-            call_order.append("subprocess")
-            return original_subprocess.return_value
-
-        cli_mocks["emit"].side_effect = track_emit
-        cli_mocks["subprocess"].side_effect = track_subprocess
+        """Test that --batch-start sends START at the head of a single batch."""
+        cli_mocks["wrapping"].side_effect = lambda event_type, *args, **kwargs: (
+            event_type
+        )
 
-        runner.invoke(
+        result = runner.invoke(
             cli,
             [
-                "build",
+                command,
                 "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
+                MOCK_CORRELATOR_ENDPOINT,
+                "--batch-start",
             ],
         )
 
-        # Verify emit (START) was called before subprocess (dbt build)
-        assert call_order[0] == "emit", "START event should be emitted before dbt runs"
-        assert call_order[1] == "subprocess", "dbt should run after START emission"
+        assert result.exit_code == 0
+        assert cli_mocks["emit"].call_count == 1
+        events = list(cli_mocks["emit"].call_args[0][0])
+        assert events[0] == "START"
+        assert events[-1] == "COMPLETE"
 
 
 # =============================================================================
@@ -1595,53 +1613,20 @@ class TestTestCommandNoLineageEmission:
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that test command does NOT extract model lineage."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
-        # extract_all_model_lineage should NOT be called for test command
-        cli_mocks["extract_lineage"].assert_not_called()
+        # Lineage extraction should NOT run for test command
+        cli_mocks["extract_run_data"].assert_not_called()
 
     def test_test_command_does_not_call_construct_lineage_events(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that test command does NOT construct lineage events."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         # construct_lineage_events should NOT be called for test command
         cli_mocks["construct_lineage"].assert_not_called()
 
-    def test_test_command_does_not_call_get_executed_models(
-        self, runner: CliRunner, cli_mocks: dict[str, Any]
-    ) -> None:
-        """Test that test command does NOT call get_executed_models.
-
-        get_executed_models is only used for lineage extraction in run/build.
-        """
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
-
-        # get_executed_models should NOT be called for test command
-        cli_mocks["get_executed"].assert_not_called()
-
     def test_test_command_only_emits_test_events_plus_terminal(
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
@@ -1651,17 +1636,10 @@ class TestTestCommandNoLineageEmission:
             cli_mocks["run_event"],
         ]
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         # Second emit call should have test events + terminal only
-        batch_events = cli_mocks["emit"].call_args_list[1][0][0]
+        batch_events = list(cli_mocks["emit"].call_args_list[1][0][0])
         # 2 test events + 1 terminal = 3 events (no lineage!)
         assert len(batch_events) == 3
 
@@ -1669,15 +1647,10 @@ class TestTestCommandNoLineageEmission:
         self, runner: CliRunner, cli_mocks: dict[str, Any]
     ) -> None:
         """Test that --dataset-namespace is passed to construct_test_events."""
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-                "--dataset-namespace",
-                "postgresql://mydb.example.com:5432/analytics",
-            ],
+        invoke_test(
+            runner,
+            "--dataset-namespace",
+            "postgresql://mydb.example.com:5432/analytics",
         )
 
         # Verify namespace_override was passed to construct_test_events
@@ -1883,14 +1856,7 @@ class TestWorkflowOrchestratorParent:
         )
         monkeypatch.delenv("OPENLINEAGE_ROOT_PARENT_ID", raising=False)
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         # Both START and terminal wrapping events should have parent
         assert cli_mocks["wrapping"].call_count == 2
@@ -1924,14 +1890,7 @@ class TestWorkflowOrchestratorParent:
             "airflow/demo_pipeline/019c7c79-aaaa-bbbb-cccc-111122223333",
         )
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         for call in cli_mocks["wrapping"].call_args_list:
             kwargs = call[1] if call[1] else {}
@@ -1954,15 +1913,54 @@ class TestWorkflowOrchestratorParent:
         monkeypatch.delenv("OPENLINEAGE_PARENT_ID", raising=False)
         monkeypatch.delenv("OPENLINEAGE_ROOT_PARENT_ID", raising=False)
 
-        runner.invoke(
-            cli,
-            [
-                "test",
-                "--correlator-endpoint",
-                "http://localhost:8080/api/v1/lineage/events",
-            ],
-        )
+        invoke_test(runner)
 
         for call in cli_mocks["wrapping"].call_args_list:
             kwargs = call[1] if call[1] else {}
             assert kwargs.get("parent") is None
+
+
+# =============================================================================
+# Q. Manifest Prefetch Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestManifestPrefetch:
+    """Tests for background manifest parsing while dbt executes."""
+
+    def test_parses_manifest_once_rewritten(self, tmp_path: Path) -> None:
+        """Test that a manifest differing from the baseline is parsed once."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text('{"nodes": {}, "sources": {}, "metadata": {}}')
+        stop = threading.Event()
+
+        with patch("dbt_correlator.parser.parse_manifest") as mock_parse:
+            prefetch_manifest(manifest_path, None, stop, poll_interval=0.001)
+
+        mock_parse.assert_called_once_with(
+            str(manifest_path), persistent_cache=False, lean=False
+        )
+
+    def test_skips_manifest_unchanged_since_baseline(self, tmp_path: Path) -> None:
+        """Test that the stale pre-run manifest is never parsed."""
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text('{"nodes": {}, "sources": {}, "metadata": {}}')
+        baseline = get_stat_key(manifest_path)
+        stop = threading.Event()
+        threading.Timer(0.05, stop.set).start()
+
+        with patch("dbt_correlator.parser.parse_manifest") as mock_parse:
+            prefetch_manifest(manifest_path, baseline, stop, poll_interval=0.001)
+
+        mock_parse.assert_not_called()
+
+    def test_stops_when_manifest_never_written(self, tmp_path: Path) -> None:
+        """Test that prefetch exits on stop when dbt never writes a manifest."""
+        stop = threading.Event()
+        stop.set()
+
+        with patch("dbt_correlator.parser.parse_manifest") as mock_parse:
+            prefetch_manifest(tmp_path / "manifest.json", None, stop)
+
+        mock_parse.assert_not_called()
@@ -13,12 +13,17 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+import yaml
 
 from dbt_correlator.config import (
+    CONFIG_TO_CLI_MAPPING,
     _interpolate_env_vars,
+    _parse_yaml_file,
+    build_default_map,
     flatten_config,
     get_manifest_path,
     get_run_results_path,
+    get_yaml_safe_loader,
     load_yaml_config,
 )
 
@@ -258,6 +263,47 @@ class TestConfigFileParsing:
         assert config["correlator"]["api_key"] == "env-secret-key"
         assert config["correlator"]["namespace"] == "production"  # No interpolation
 
+    def test_unchanged_config_file_is_parsed_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Repeated loads reuse parsed YAML but still re-apply env vars."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("correlator:\n  endpoint: ${CACHE_TEST_ENDPOINT}\n")
+        _parse_yaml_file.cache_clear()
+
+        monkeypatch.setenv("CACHE_TEST_ENDPOINT", "http://first:8080")
+        first = load_yaml_config(config_file)
+        monkeypatch.setenv("CACHE_TEST_ENDPOINT", "http://second:8080")
+        second = load_yaml_config(config_file)
+
+        assert _parse_yaml_file.cache_info().misses == 1
+        assert first["correlator"]["endpoint"] == "http://first:8080"
+        assert second["correlator"]["endpoint"] == "http://second:8080"
+
+    def test_rewritten_config_file_is_reparsed(self, tmp_path: Path):
+        """Changing the config file invalidates the cached YAML."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("job:\n  name: first\n")
+        assert load_yaml_config(config_file)["job"]["name"] == "first"
+
+        config_file.write_text("job:\n  name: second_job\n")
+
+        assert load_yaml_config(config_file)["job"]["name"] == "second_job"
+
+    def test_uses_libyaml_loader_when_available(self):
+        """The C-accelerated safe loader is preferred when PyYAML provides it."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+        assert get_yaml_safe_loader() is expected
+
+    def test_safe_loader_rejects_python_tags(self, tmp_path: Path):
+        """Arbitrary Python object tags are refused like yaml.safe_load does."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("job: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_yaml_config(config_file)
+
 
 # =============================================================================
 # C. Environment Variable Interpolation Tests
@@ -361,6 +407,22 @@ class TestFlattenConfig:
         assert "unknown_section" not in result
         assert "foo" not in result
 
+    def test_build_default_map_matches_flatten_then_rename(
+        self, nested_config_dict: dict[str, Any]
+    ):
+        """Single-pass mapping equals flatten_config plus CLI renaming."""
+        flat = flatten_config(nested_config_dict)
+        expected = {CONFIG_TO_CLI_MAPPING[key]: value for key, value in flat.items()}
+
+        assert build_default_map(nested_config_dict) == expected
+        assert expected["project_dir"] == "/my/project"
+
+    def test_build_default_map_skips_non_dict_sections(self):
+        """A scalar where a section is expected is ignored."""
+        assert build_default_map({"correlator": "oops", "job": {"name": "j"}}) == {
+            "job_name": "j"
+        }
+
 
 # =============================================================================
 # E. Path Helper Tests
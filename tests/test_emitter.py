@@ -13,11 +13,14 @@ Test Coverage:
     - TestEmitEventsOpenLineageConsumerCompatibility: Consumer compatibility
 """
 
+import gzip
 import json
+import time
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import attr
@@ -25,10 +28,15 @@ import pytest
 import requests
 from openlineage.client.event_v2 import RunState
 
+from dbt_correlator.cache import clear_artifact_cache
 from dbt_correlator.emitter import (
     ParentRunMetadata,
     _build_parent_facet,
+    _encode_batch,
+    _get_session,
+    _resolve_test_dataset,
     _serialize_event_with_extended_fields,
+    _to_primitive,
     construct_lineage_event,
     construct_lineage_events,
     construct_test_events,
@@ -44,6 +52,7 @@ from dbt_correlator.parser import (
     RunResults,
     RunResultsMetadata,
     TestResult,
+    build_dataset_info,
     parse_manifest,
     parse_run_results,
 )
@@ -53,6 +62,9 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 RUN_RESULTS_PATH = FIXTURES_DIR / "dbt_test_results.json"
 MANIFEST_PATH = FIXTURES_DIR / "manifest.json"
 
+# Timestamp shared by wrapping event tests
+EVENT_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
 
 @pytest.fixture
 def sample_run_results():
@@ -247,6 +259,108 @@ class TestGroupTestsByDataset:
             assert isinstance(test["unique_id"], str)
             assert test["unique_id"].startswith("test.")
 
+    def test_dataset_info_built_once_per_model(
+        self, sample_run_results, sample_manifest
+    ) -> None:
+        """Test that dataset info is built once per model, not once per test."""
+        clear_artifact_cache()
+        with patch(
+            "dbt_correlator.emitter.build_dataset_info",
+            wraps=build_dataset_info,
+        ) as mock_build:
+            grouped = group_tests_by_dataset(sample_run_results, sample_manifest)
+
+        built_for = [c.args[0]["unique_id"] for c in mock_build.call_args_list]
+        assert len(built_for) == len(set(built_for))
+        assert len(built_for) == len(grouped)
+
+    def test_resolution_reused_for_same_manifest(
+        self, sample_run_results, sample_manifest
+    ) -> None:
+        """Test that test-to-dataset resolution is shared per manifest version.
+
+        A new run_results against the same manifest (e.g., repeated dbt test
+        runs) groups its tests without resolving them again.
+        """
+        clear_artifact_cache()
+        first = group_tests_by_dataset(sample_run_results, sample_manifest)
+        rerun = RunResults(
+            metadata=sample_run_results.metadata,
+            results=sample_run_results.results,
+            source_key=("other_run_results.json", 1, 1),
+        )
+
+        with patch("dbt_correlator.emitter._resolve_test_dataset") as mock_resolve:
+            second = group_tests_by_dataset(rerun, sample_manifest)
+
+        mock_resolve.assert_not_called()
+        assert second == first
+
+    def test_unmappable_test_resolved_once_and_warned_every_run(self, caplog) -> None:
+        """Test that resolution failures are cached but still logged per run."""
+        clear_artifact_cache()
+        test_id = "test.jaffle_shop.source_not_null_raw_orders_id.abc123"
+        manifest = Manifest(
+            nodes={test_id: {"unique_id": test_id, "refs": []}},
+            sources={},
+            metadata={},
+            source_key=("manifest.json", 1, 1),
+        )
+        run_results = RunResults(
+            metadata=RunResultsMetadata(
+                generated_at=datetime.now(),
+                invocation_id="test-invocation-id",
+                dbt_version="1.10.15",
+                elapsed_time=0.0,
+            ),
+            results=[
+                TestResult(unique_id=test_id, status="pass", execution_time_seconds=0.1)
+            ],
+        )
+
+        with patch(
+            "dbt_correlator.emitter._resolve_test_dataset",
+            wraps=_resolve_test_dataset,
+        ) as mock_resolve:
+            first = group_tests_by_dataset(run_results, manifest)
+            second = group_tests_by_dataset(run_results, manifest)
+
+        assert first == second == {}
+        assert mock_resolve.call_count == 1
+        warnings = [r for r in caplog.records if "has no refs" in r.getMessage()]
+        assert len(warnings) == 2
+
+    def test_missing_model_reason_logged_without_quotes(self, caplog) -> None:
+        """Test that a cached KeyError reason keeps its plain message."""
+        clear_artifact_cache()
+        test_id = "test.jaffle_shop.not_null_gone_id.abc123"
+        manifest = Manifest(
+            nodes={test_id: {"unique_id": test_id, "refs": [{"name": "gone"}]}},
+            sources={},
+            metadata={},
+            source_key=("manifest.json", 1, 1),
+        )
+        run_results = RunResults(
+            metadata=RunResultsMetadata(
+                generated_at=datetime.now(),
+                invocation_id="test-invocation-id",
+                dbt_version="1.10.15",
+                elapsed_time=0.0,
+            ),
+            results=[
+                TestResult(unique_id=test_id, status="pass", execution_time_seconds=0.1)
+            ],
+        )
+
+        group_tests_by_dataset(run_results, manifest)
+
+        expected = (
+            "Model node not found in manifest: model.jaffle_shop.gone. "
+            f"Referenced by test: {test_id}"
+        )
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(m.endswith(f": {expected}") for m in messages), messages
+
     def test_empty_results(self) -> None:
         """Test grouping with no test results.
 
@@ -331,7 +445,7 @@ class TestCreateWrappingEvent:
             - Timestamp is properly formatted
         """
         run_id = str(uuid.uuid4())
-        timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        timestamp = EVENT_TIME
 
         event = create_wrapping_event(
             event_type="START",
@@ -405,7 +519,7 @@ class TestCreateWrappingEvent:
     def test_wrapping_event_includes_parent_facet(self) -> None:
         """Test wrapping event has ParentRunFacet when parent params provided."""
         run_id = str(uuid.uuid4())
-        timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        timestamp = EVENT_TIME
 
         event = create_wrapping_event(
             event_type="START",
@@ -430,7 +544,7 @@ class TestCreateWrappingEvent:
     def test_wrapping_event_includes_parent_and_root(self) -> None:
         """Test wrapping event has both parent and root when all params provided."""
         run_id = str(uuid.uuid4())
-        timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        timestamp = EVENT_TIME
 
         event = create_wrapping_event(
             event_type="START",
@@ -458,7 +572,7 @@ class TestCreateWrappingEvent:
     def test_wrapping_event_no_parent_when_standalone(self) -> None:
         """Test wrapping event has no ParentRunFacet when running standalone."""
         run_id = str(uuid.uuid4())
-        timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        timestamp = EVENT_TIME
 
         event = create_wrapping_event(
             event_type="START",
@@ -846,6 +960,29 @@ class TestConstructTestEvents:
             "COMPLETE/FAIL are terminal states reserved for wrapping events."
         )
 
+    def test_construct_test_events_reuses_datasets_for_unchanged_artifacts(
+        self, sample_run_results, sample_manifest
+    ) -> None:
+        """Test that datasets are built once per artifact version.
+
+        Repeated construction for unchanged artifacts reuses the memoized
+        input datasets, while run identity is applied to each new event.
+        """
+        run_id_1 = "550e8400-e29b-41d4-a716-446655440001"
+        run_id_2 = "550e8400-e29b-41d4-a716-446655440002"
+        first = construct_test_events(
+            sample_run_results, sample_manifest, "dbt", "job", run_id_1
+        )[0]
+        second = construct_test_events(
+            sample_run_results, sample_manifest, "dbt", "job", run_id_2
+        )[0]
+
+        assert second is not first
+        assert first.run.runId == run_id_1
+        assert second.run.runId == run_id_2
+        assert second.inputs is not first.inputs
+        assert all(a is b for a, b in zip(first.inputs, second.inputs))
+
 
 # ============================================================================
 # Tests for emit_events()
@@ -880,7 +1017,7 @@ class TestEmitEvents:
         )
 
         # Mock HTTP request
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -905,7 +1042,7 @@ class TestEmitEvents:
             assert "Content-Type" in headers or "content-type" in headers
 
             # Verify body is JSON array (OpenLineage batch format)
-            json_data = call_args[1].get("json")
+            json_data = json.loads(call_args[1]["data"])
             assert isinstance(json_data, list), "Events must be wrapped in array"
             assert len(json_data) == 1
 
@@ -935,7 +1072,7 @@ class TestEmitEvents:
             "eb31681b-641b-4f73-bf93-cc339decae23",
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -993,7 +1130,7 @@ class TestEmitEvents:
             "eb31681b-641b-4f73-bf93-cc339decae23",
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 207
             mock_response.json.return_value = {
@@ -1047,7 +1184,7 @@ class TestEmitEvents:
             "eb31681b-641b-4f73-bf93-cc339decae23",
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -1096,7 +1233,7 @@ class TestEmitEvents:
         )
 
         # Mock connection error
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = requests.ConnectionError("Connection refused")
 
             # Should raise ConnectionError with helpful message
@@ -1131,7 +1268,7 @@ class TestEmitEvents:
         )
 
         # Mock 422 validation error
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 422
             mock_response.json.return_value = {
@@ -1170,7 +1307,7 @@ class TestEmitEvents:
         )
 
         # Mock timeout
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = requests.Timeout("Request timed out")
 
             # Should raise TimeoutError
@@ -1195,7 +1332,7 @@ class TestEmitEvents:
 
         This is important for efficiency - no unnecessary HTTP calls.
         """
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Call with empty list
             emit_events([], "http://localhost:8080/api/v1/lineage/events")
 
@@ -1204,6 +1341,343 @@ class TestEmitEvents:
                 mock_post.call_count == 0
             ), "Should not make HTTP call for empty batch"
 
+    def test_reuses_shared_session_across_calls(self, minimal_test_data) -> None:
+        """Test that consecutive emissions share one pooled HTTP session.
+
+        Validates that:
+            - _get_session returns the same Session on every call
+            - emit_events posts through that Session by default
+            - An explicitly passed session is used instead
+        """
+        run_results, manifest = minimal_test_data
+        events = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )
+        endpoint = "http://localhost:8080/api/v1/lineage/events"
+
+        assert _get_session() is _get_session()
+
+        with patch.object(_get_session(), "post") as mock_post:
+            mock_post.return_value = MagicMock(status_code=204)
+            emit_events(events, endpoint)
+            emit_events(events, endpoint)
+
+            assert mock_post.call_count == 2
+
+        custom_session = MagicMock()
+        custom_session.post.return_value = MagicMock(status_code=204)
+        emit_events(events, endpoint, session=custom_session)
+
+        assert custom_session.post.call_count == 1
+
+    def test_session_pool_covers_emit_concurrency(self) -> None:
+        """Test that the pool keeps a connection per concurrent POST."""
+        adapter = _get_session(32).get_adapter("http://localhost:8080")
+
+        assert adapter._pool_maxsize == 32
+        assert _get_session(1) is _get_session()
+
+    def test_gzip_compression_sets_content_encoding(self, minimal_test_data) -> None:
+        """Test that gzip compression sends a compressed body with its header."""
+        run_results, manifest = minimal_test_data
+        events = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value = MagicMock(status_code=204)
+            emit_events(
+                events,
+                "http://localhost:8080/api/v1/lineage/events",
+                compression="gzip",
+            )
+
+            kwargs = mock_post.call_args[1]
+            assert kwargs["headers"]["Content-Encoding"] == "gzip"
+            json_data = json.loads(gzip.decompress(kwargs["data"]))
+            assert isinstance(json_data, list)
+            assert len(json_data) == 1
+
+    def test_batch_encoded_per_event_as_json_array(self, minimal_test_data) -> None:
+        """Test that per-event encoding yields the same array as a bulk dump."""
+        run_results, manifest = minimal_test_data
+        event = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )[0]
+
+        single = json.loads(_encode_batch([event]))
+        body = _encode_batch([event, event])
+
+        assert json.loads(body) == single * 2
+        assert single[0]["eventType"] == "RUNNING"
+        assert _encode_batch([]) == b"[]"
+
+    def test_zstd_compression_sets_content_encoding(self, minimal_test_data) -> None:
+        """Test that zstd compression sends a compressed body with its header."""
+        zstandard = pytest.importorskip("zstandard")
+        run_results, manifest = minimal_test_data
+        events = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value = MagicMock(status_code=204)
+            emit_events(
+                events,
+                "http://localhost:8080/api/v1/lineage/events",
+                compression="zstd",
+            )
+
+            kwargs = mock_post.call_args[1]
+            assert kwargs["headers"]["Content-Encoding"] == "zstd"
+            body = zstandard.ZstdDecompressor().decompress(kwargs["data"])
+            assert len(json.loads(body)) == 1
+
+    def test_zstd_without_zstandard_package_rejected(self) -> None:
+        """Test that zstd compression needs the optional zstandard package."""
+        with (
+            patch("dbt_correlator.emitter.zstandard", None),
+            pytest.raises(ValueError, match=r"correlator-dbt\[zstd\]"),
+        ):
+            emit_events([], "http://localhost:8080/events", compression="zstd")
+
+    def test_unsupported_media_type_falls_back_to_identity(
+        self, minimal_test_data
+    ) -> None:
+        """Test that a 415 for a compressed body resends it uncompressed.
+
+        Validates that:
+            - The rejected batch is resent without Content-Encoding
+            - Later batches to the same endpoint skip compression
+        """
+        run_results, manifest = minimal_test_data
+        events = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )
+        endpoint = "http://localhost:8080/api/v1/lineage/events"
+
+        with (
+            patch("dbt_correlator.emitter._uncompressed_endpoints", set()),
+            patch("requests.Session.post") as mock_post,
+        ):
+            mock_post.side_effect = [
+                MagicMock(status_code=415),
+                MagicMock(status_code=204),
+                MagicMock(status_code=204),
+            ]
+            emit_events(events, endpoint, compression="gzip")
+            emit_events(events, endpoint, compression="gzip")
+
+            first, retry, later = (c[1] for c in mock_post.call_args_list)
+            assert first["headers"]["Content-Encoding"] == "gzip"
+            for kwargs in (retry, later):
+                assert "Content-Encoding" not in kwargs["headers"]
+                assert len(json.loads(kwargs["data"])) == 1
+
+    def test_large_batch_split_with_terminal_chunk_last(
+        self, minimal_test_data
+    ) -> None:
+        """Test that events beyond batch_size are split into multiple POSTs.
+
+        Validates that:
+            - Each POST carries at most batch_size events
+            - Every event is sent exactly once
+            - The chunk holding the final (terminal) event is sent last
+        """
+        run_results, manifest = minimal_test_data
+        event = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )[0]
+        terminal = create_wrapping_event(
+            "COMPLETE",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+            "test_job",
+            "dbt",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value = MagicMock(status_code=204)
+            emit_events(
+                [event] * 7 + [terminal],
+                "http://localhost:8080/api/v1/lineage/events",
+                batch_size=3,
+            )
+
+            bodies = [json.loads(c[1]["data"]) for c in mock_post.call_args_list]
+            assert sorted(len(body) for body in bodies) == [2, 3, 3]
+            assert bodies[-1][-1]["eventType"] == "COMPLETE"
+
+    def test_generator_emitted_in_chunks(self, minimal_test_data) -> None:
+        """Test that a lazily produced event stream is emitted like a list.
+
+        Validates that:
+            - A generator is consumed exactly once
+            - Chunks respect batch_size
+            - The chunk holding the terminal event is sent last
+        """
+        run_results, manifest = minimal_test_data
+        event = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )[0]
+        terminal = create_wrapping_event(
+            "COMPLETE",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+            "test_job",
+            "dbt",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+        def stream():
+            yield from [event] * 6
+            yield terminal
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value = MagicMock(status_code=204)
+            emit_events(
+                stream(),
+                "http://localhost:8080/api/v1/lineage/events",
+                batch_size=3,
+            )
+
+            bodies = [json.loads(c[1]["data"]) for c in mock_post.call_args_list]
+            assert sorted(len(body) for body in bodies) == [1, 3, 3]
+            assert len(bodies[-1]) == 1
+            assert bodies[-1][0]["eventType"] == "COMPLETE"
+
+    def test_first_chunk_sent_before_other_chunks(self, minimal_test_data) -> None:
+        """Test that the chunk holding a batched START is POSTed first."""
+        run_results, manifest = minimal_test_data
+        event = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )[0]
+        start, terminal = (
+            create_wrapping_event(
+                event_type,
+                "eb31681b-641b-4f73-bf93-cc339decae23",
+                "test_job",
+                "dbt",
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+            for event_type in ("START", "COMPLETE")
+        )
+
+        # Bodies in the order the backend finished receiving them; the START
+        # chunk is slow, so it would finish last if sent alongside the others
+        received: list[list[dict[str, Any]]] = []
+
+        def post(url: str, data: bytes, **kwargs: Any) -> MagicMock:
+            body = json.loads(data)
+            if body[0]["eventType"] == "START":
+                time.sleep(0.05)
+            received.append(body)
+            return MagicMock(status_code=204)
+
+        with patch("requests.Session.post", side_effect=post):
+            emit_events(
+                [start, *[event] * 10, terminal],
+                "http://localhost:8080/api/v1/lineage/events",
+                batch_size=3,
+            )
+
+        assert len(received) == 4
+        assert received[0][0]["eventType"] == "START"
+        assert received[-1][-1]["eventType"] == "COMPLETE"
+
+    def test_unexpected_chunk_error_raised_as_connection_error(
+        self, minimal_test_data
+    ) -> None:
+        """Test that a worker's unexpected failure keeps the documented types."""
+        run_results, manifest = minimal_test_data
+        events = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = RuntimeError("boom")
+            with pytest.raises(ConnectionError, match="boom"):
+                emit_events(
+                    events * 3,
+                    "http://localhost:8080/api/v1/lineage/events",
+                    batch_size=1,
+                )
+
+            assert mock_post.call_count == 3
+
+    def test_max_workers_below_one_rejected(self) -> None:
+        """Test that emit_events rejects a concurrency bound below 1."""
+        with pytest.raises(ValueError, match="max_workers"):
+            emit_events([], "http://localhost:8080/events", max_workers=0)
+
+    def test_failed_chunk_does_not_stop_terminal_chunk(self, minimal_test_data) -> None:
+        """Test that a failing chunk still lets the final chunk be sent."""
+        run_results, manifest = minimal_test_data
+        events = construct_test_events(
+            run_results,
+            manifest,
+            "dbt",
+            "test_job",
+            "eb31681b-641b-4f73-bf93-cc339decae23",
+        )
+
+        with patch("requests.Session.post") as mock_post:
+            mock_post.side_effect = [
+                requests.ConnectionError("refused"),
+                MagicMock(status_code=204),
+            ]
+            with pytest.raises(ConnectionError):
+                emit_events(
+                    events * 2,
+                    "http://localhost:8080/api/v1/lineage/events",
+                    batch_size=1,
+                )
+
+            assert mock_post.call_count == 2
+
+    def test_unsupported_compression_raises_value_error(self) -> None:
+        """Test that an unknown compression is rejected before any request."""
+        with patch("requests.Session.post") as mock_post:
+            with pytest.raises(ValueError, match="Unsupported emit compression"):
+                emit_events([], "http://localhost:8080", compression="brotli")
+
+            assert mock_post.call_count == 0
+
 
 @pytest.mark.integration
 class TestEmitEventsIntegration:
@@ -1517,6 +1991,16 @@ class TestConstructLineageEvents:
         assert "model.jaffle_shop.stg_customers" in job_names
         assert "model.jaffle_shop.customers" in job_names
 
+    def test_invalid_event_time_rejected(self, sample_model_lineages) -> None:
+        """Test that every lineage event is validated on construction."""
+        with pytest.raises(ValueError, match="month must be in 1..12"):
+            construct_lineage_events(
+                model_lineages=sample_model_lineages,
+                job_namespace="dbt",
+                producer="https://test/producer",
+                event_time="2024-13-01T00:00:00Z",
+            )
+
     def test_each_model_gets_unique_run_id(self, sample_model_lineages) -> None:
         """Test that each model gets a UNIQUE runId (Bug 4 fix).
 
@@ -1666,7 +2150,7 @@ class TestEmitEventsOpenLineageConsumerCompatibility:
             "eb31681b-641b-4f73-bf93-cc339decae23",
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 204
             mock_response.text = ""  # No content
@@ -1695,7 +2179,7 @@ class TestEmitEventsOpenLineageConsumerCompatibility:
             "eb31681b-641b-4f73-bf93-cc339decae23",
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = '{"summary": {"successful": 1, "failed": 0}}'
@@ -1727,7 +2211,7 @@ class TestEmitEventsOpenLineageConsumerCompatibility:
             "eb31681b-641b-4f73-bf93-cc339decae23",
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = ""  # Empty body
@@ -1768,7 +2252,7 @@ class TestEmitEventsOpenLineageConsumerCompatibility:
             execution_result=execution_result,
         )
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = '{"summary": {"successful": 1, "failed": 0}}'
@@ -1785,7 +2269,7 @@ class TestEmitEventsOpenLineageConsumerCompatibility:
 
             # Verify JSON body structure
             call_args = mock_post.call_args
-            json_data = call_args[1].get("json")
+            json_data = json.loads(call_args[1]["data"])
 
             assert isinstance(json_data, list)
             assert len(json_data) == 1
@@ -2176,6 +2660,27 @@ class TestConstructLineageEventsWithParent:
             )
             assert event.run.facets["parent"].job.name == "jaffle_shop.build"
 
+    def test_parent_facet_built_once(self, sample_model_lineages) -> None:
+        """Test that all events share one ParentRunFacet built once per batch."""
+        with patch(
+            "dbt_correlator.emitter._build_parent_facet",
+            wraps=_build_parent_facet,
+        ) as mock_build:
+            events = construct_lineage_events(
+                model_lineages=sample_model_lineages,
+                job_namespace="dbt://demo",
+                producer="https://github.com/correlator-io/correlator-dbt/0.1.2",
+                event_time="2024-01-01T12:00:00Z",
+                parent=ParentRunMetadata(
+                    run_id="550e8400-e29b-41d4-a716-446655440000",
+                    job_namespace="dbt://demo",
+                    job_name="jaffle_shop.build",
+                ),
+            )
+
+        mock_build.assert_called_once()
+        assert events[0].run.facets["parent"] is events[1].run.facets["parent"]
+
     def test_no_parent_facet_when_params_none(self, sample_model_lineages) -> None:
         """Test that no parent facet when params are None."""
         events = construct_lineage_events(
@@ -2361,3 +2866,32 @@ class TestConstructTestEventsConsolidatedPattern:
                     assert "message" in assertion, "message should be in assertion"
                     # durationMs should be an integer (milliseconds)
                     assert isinstance(assertion["durationMs"], int)
+
+    def test_to_primitive_matches_attr_asdict(
+        self, sample_run_results, sample_manifest
+    ) -> None:
+        """Test that the cached-field serializer matches attr.asdict output."""
+        events = [
+            *construct_test_events(
+                run_results=sample_run_results,
+                manifest=sample_manifest,
+                job_namespace="dbt://demo",
+                job_name="jaffle_shop.test",
+                run_id="550e8400-e29b-41d4-a716-446655440000",
+            ),
+            create_wrapping_event(
+                "START",
+                "550e8400-e29b-41d4-a716-446655440000",
+                "jaffle_shop.test",
+                "dbt://demo",
+                datetime(2024, 1, 1, tzinfo=timezone.utc),
+            ),
+        ]
+
+        def serialize(inst, field, value):
+            return value.value if isinstance(value, Enum) else value
+
+        for event in events:
+            expected = attr.asdict(event, value_serializer=serialize)  # type: ignore
+            assert _to_primitive(event) == expected
+        assert _to_primitive(events[-1])["eventType"] == "START"
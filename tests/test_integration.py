@@ -18,20 +18,20 @@ making them:
     - CI/CD friendly: No dbt installation required
 """
 
-import json
 import re
 from pathlib import Path
-from typing import Any, cast
-from uuid import UUID
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
-import requests
-import responses  # type: ignore[import-not-found]
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
+from dbt_correlator import jsonio
 from dbt_correlator.cli import cli
 from tests.conftest import MOCK_CORRELATOR_ENDPOINT
 
+if TYPE_CHECKING:
+    import responses  # type: ignore[import-not-found]
+
 # =============================================================================
 # Constants
 # =============================================================================
@@ -41,10 +41,31 @@ from tests.conftest import MOCK_CORRELATOR_ENDPOINT
 EXPECTED_MIN_TEST_EVENTS = 1  # At minimum we should have some test events
 
 # OpenLineage schema URL pattern
-OPENLINEAGE_SCHEMA_URL_PATTERN = (
+OPENLINEAGE_SCHEMA_URL_PATTERN = re.compile(
     r"https://openlineage\.io/spec/\d+-\d+-\d+/OpenLineage\.json"
 )
 
+# Keys every emitted event (and its job) must carry
+REQUIRED_EVENT_KEYS = frozenset(
+    {"eventTime", "eventType", "producer", "schemaURL", "run", "job"}
+)
+REQUIRED_JOB_KEYS = frozenset({"namespace", "name"})
+
+# Raw 200 OK body for callback-based mocks, encoded once
+SUCCESS_RESPONSE_BODY = b'{"status": "success", "summary": {"received": 1}}'
+
+# Emission warnings expected when Correlator is unreachable or times out
+CONNECTION_WARNING_PATTERN = re.compile(r"warning|error|failed|connection", re.I)
+TIMEOUT_WARNING_PATTERN = re.compile(r"warning|timeout|error", re.I)
+
+# Canonical hyphenated UUID (as emitted in run.runId)
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I
+)
+
+# Basic ISO 8601 prefix (YYYY-MM-DDTHH:MM:SS with optional timezone)
+ISO8601_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
 
 # =============================================================================
 # Helper Functions
@@ -60,14 +81,12 @@ def parse_request_body(request: Any) -> list[dict[str, Any]]:
     Returns:
         Parsed JSON as list of event dictionaries.
     """
-    body = request.body
-    if isinstance(body, bytes):
-        body = body.decode("utf-8")
-    return cast(list[dict[str, Any]], json.loads(body))
+    # Both JSON backends accept bytes or str, so no decode step is needed
+    return cast(list[dict[str, Any]], jsonio.loads(request.body))
 
 
 def is_valid_uuid(value: str) -> bool:
-    """Check if a string is a valid UUID.
+    """Check if a string is a UUID in canonical hyphenated form.
 
     Args:
         value: String to validate.
@@ -75,11 +94,7 @@ def is_valid_uuid(value: str) -> bool:
     Returns:
         True if valid UUID, False otherwise.
     """
-    try:
-        UUID(value)
-        return True
-    except ValueError:
-        return False
+    return UUID_PATTERN.fullmatch(value) is not None
 
 
 def is_valid_iso8601(value: str) -> bool:
@@ -91,9 +106,7 @@ def is_valid_iso8601(value: str) -> bool:
     Returns:
         True if valid ISO 8601 format, False otherwise.
     """
-    # Basic ISO 8601 pattern check (YYYY-MM-DDTHH:MM:SS with optional timezone)
-    pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"
-    return bool(re.match(pattern, value))
+    return bool(ISO8601_PATTERN.match(value))
 
 
 # =============================================================================
@@ -111,10 +124,7 @@ class TestEndToEndWithMockServer:
     """
 
     def test_end_to_end_with_existing_artifacts(
-        self,
-        runner: CliRunner,
-        mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        self, eager_start_test_run: tuple[Result, list[Any]]
     ) -> None:
         """Full workflow using --skip-dbt-run with fixture artifacts.
 
@@ -123,34 +133,20 @@ class TestEndToEndWithMockServer:
             2. Event count matches expected (START + test events + COMPLETE)
             3. Exit code is 0
         """
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--skip-dbt-run",
-                "--project-dir",
-                str(mock_dbt_project_dir),
-                "--profiles-dir",
-                str(mock_dbt_project_dir),
-                "--correlator-endpoint",
-                MOCK_CORRELATOR_ENDPOINT,
-            ],
-        )
+        result, calls = eager_start_test_run
 
         # Verify exit code
         assert result.exit_code == 0, f"CLI failed with: {result.output}"
 
         # Verify HTTP POSTs were made (START + batch)
-        assert (
-            len(mock_correlator_success.calls) == 2
-        ), "Expected 2 HTTP POSTs (START + batch)"
+        assert len(calls) == 2, "Expected 2 HTTP POSTs (START + batch)"
 
         # First call should be START event
-        start_events = parse_request_body(mock_correlator_success.calls[0].request)
+        start_events = parse_request_body(calls[0].request)
         assert len(start_events) == 1, "First call should have 1 START event"
 
         # Second call should be batch with lineage + test + terminal events
-        batch_events = parse_request_body(mock_correlator_success.calls[1].request)
+        batch_events = parse_request_body(calls[1].request)
         assert isinstance(batch_events, list), "Events should be a JSON array"
 
         # Should have: lineage events + test events + COMPLETE (minimum 2)
@@ -166,7 +162,7 @@ class TestEndToEndWithMockServer:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate OpenLineage event structure matches spec.
 
@@ -200,49 +196,44 @@ class TestEndToEndWithMockServer:
         valid_event_types = {"START", "COMPLETE", "FAIL", "RUNNING", "ABORT", "OTHER"}
 
         for i, event in enumerate(events):
+            # Required keys (top-level and nested)
+            missing = REQUIRED_EVENT_KEYS - event.keys()
+            assert not missing, f"Event {i} missing {sorted(missing)}"
+            missing = REQUIRED_JOB_KEYS - event["job"].keys()
+            assert not missing, f"Event {i} missing job.{sorted(missing)}"
+            assert "runId" in event["run"], f"Event {i} missing run.runId"
+
             # eventTime validation
-            assert "eventTime" in event, f"Event {i} missing eventTime"
             assert is_valid_iso8601(
                 event["eventTime"]
             ), f"Event {i} has invalid eventTime: {event['eventTime']}"
 
             # eventType validation
-            assert "eventType" in event, f"Event {i} missing eventType"
             assert (
                 event["eventType"] in valid_event_types
             ), f"Event {i} has invalid eventType: {event['eventType']}"
 
             # producer validation
-            assert "producer" in event, f"Event {i} missing producer"
             assert event["producer"].startswith(
                 "http"
             ), f"Event {i} has invalid producer URL"
 
             # schemaURL validation
-            assert "schemaURL" in event, f"Event {i} missing schemaURL"
-            assert re.match(
-                OPENLINEAGE_SCHEMA_URL_PATTERN, event["schemaURL"]
+            assert OPENLINEAGE_SCHEMA_URL_PATTERN.match(
+                event["schemaURL"]
             ), f"Event {i} has invalid schemaURL: {event['schemaURL']}"
 
             # run.runId validation
-            assert "run" in event, f"Event {i} missing run"
-            assert "runId" in event["run"], f"Event {i} missing run.runId"
             assert is_valid_uuid(
                 event["run"]["runId"]
             ), f"Event {i} has invalid runId: {event['run']['runId']}"
 
             # job validation
-            assert "job" in event, f"Event {i} missing job"
-            assert "namespace" in event["job"], f"Event {i} missing job.namespace"
-            assert "name" in event["job"], f"Event {i} missing job.name"
             assert event["job"]["namespace"], f"Event {i} has empty job.namespace"
             assert event["job"]["name"], f"Event {i} has empty job.name"
 
     def test_end_to_end_data_quality_assertions_facet(
-        self,
-        runner: CliRunner,
-        mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        self, eager_start_test_run: tuple[Result, list[Any]]
     ) -> None:
         """Validate dataQualityAssertions facet structure.
 
@@ -252,40 +243,27 @@ class TestEndToEndWithMockServer:
             - assertions array with proper structure
             - Each assertion has: assertion name and success boolean
         """
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--skip-dbt-run",
-                "--project-dir",
-                str(mock_dbt_project_dir),
-                "--profiles-dir",
-                str(mock_dbt_project_dir),
-                "--correlator-endpoint",
-                MOCK_CORRELATOR_ENDPOINT,
-            ],
-        )
+        result, calls = eager_start_test_run
 
         assert result.exit_code == 0, f"CLI failed with: {result.output}"
 
         # Test events are in the second call (batch)
         # First call is START event
-        assert len(mock_correlator_success.calls) == 2, "Expected 2 HTTP calls"
-        batch_events = parse_request_body(mock_correlator_success.calls[1].request)
+        assert len(calls) == 2, "Expected 2 HTTP calls"
+        batch_events = parse_request_body(calls[1].request)
 
         # Find test events (RUNNING events with inputs that have dataQualityAssertions)
         # Note: Test events use RUNNING type (intermediate data carrier)
         # COMPLETE/FAIL are terminal states for wrapping events only
-        test_events = [
-            e
-            for e in batch_events
-            if e.get("eventType") == "RUNNING"
-            and e.get("inputs")
-            and any(
-                "dataQualityAssertions" in inp.get("inputFacets", {})
-                for inp in e.get("inputs", [])
-            )
-        ]
+        test_events = []
+        for e in batch_events:
+            if e.get("eventType") != "RUNNING":
+                continue
+            for inp in e.get("inputs") or ():
+                facets = inp.get("inputFacets")
+                if facets and "dataQualityAssertions" in facets:
+                    test_events.append(e)
+                    break
 
         assert (
             len(test_events) >= EXPECTED_MIN_TEST_EVENTS
@@ -327,10 +305,7 @@ class TestEndToEndWithMockServer:
                     ), "Assertion 'success' must be boolean"
 
     def test_end_to_end_batch_emission(
-        self,
-        runner: CliRunner,
-        mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        self, eager_start_test_run: tuple[Result, list[Any]]
     ) -> None:
         """Verify all events batched in single POST.
 
@@ -340,35 +315,21 @@ class TestEndToEndWithMockServer:
             - Array contains START + test events + COMPLETE
             - All events share same run.runId
         """
-        result = runner.invoke(
-            cli,
-            [
-                "test",
-                "--skip-dbt-run",
-                "--project-dir",
-                str(mock_dbt_project_dir),
-                "--profiles-dir",
-                str(mock_dbt_project_dir),
-                "--correlator-endpoint",
-                MOCK_CORRELATOR_ENDPOINT,
-            ],
-        )
+        result, calls = eager_start_test_run
 
         assert result.exit_code == 0, f"CLI failed with: {result.output}"
 
         # Verify 2 HTTP POSTs (START + batch)
-        assert (
-            len(mock_correlator_success.calls) == 2
-        ), f"Expected 2 HTTP calls, got {len(mock_correlator_success.calls)}"
+        assert len(calls) == 2, f"Expected 2 HTTP calls, got {len(calls)}"
 
         # First call: START event
-        start_events = parse_request_body(mock_correlator_success.calls[0].request)
+        start_events = parse_request_body(calls[0].request)
         assert isinstance(start_events, list), "Events must be JSON array"
         assert len(start_events) == 1, "First call should have 1 START event"
         assert start_events[0].get("eventType") == "START", "First event must be START"
 
         # Second call: batch events (lineage + test + terminal)
-        batch_events = parse_request_body(mock_correlator_success.calls[1].request)
+        batch_events = parse_request_body(calls[1].request)
         assert isinstance(batch_events, list), "Events must be JSON array"
 
         # Verify terminal event present in batch
@@ -379,8 +340,11 @@ class TestEndToEndWithMockServer:
 
         # Verify all events share same runId (across both calls)
         all_events = start_events + batch_events
-        run_ids = {e["run"]["runId"] for e in all_events}
-        assert len(run_ids) == 1, f"All events must share same runId, found: {run_ids}"
+        run_id = all_events[0]["run"]["runId"]
+        for event in all_events[1:]:
+            assert (
+                event["run"]["runId"] == run_id
+            ), f"All events must share same runId: {run_id} vs {event['run']['runId']}"
 
         # Verify START is first and terminal is last in logical order
         assert all_events[0]["eventType"] == "START", "First event must be START"
@@ -393,7 +357,7 @@ class TestEndToEndWithMockServer:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
         tmp_path: Path,
     ) -> None:
         """Test config file integration in full workflow.
@@ -422,6 +386,7 @@ job:
             [
                 "test",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--config",
                 str(config_file),
             ],
@@ -547,7 +512,7 @@ class TestErrorScenarios:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_dynamic: responses.RequestsMock,
+        mock_correlator_dynamic: "responses.RequestsMock",
     ) -> None:
         """Fire-and-forget behavior when Correlator is unreachable.
 
@@ -557,9 +522,11 @@ class TestErrorScenarios:
             3. Assert exit code is 0 (fire-and-forget)
             4. Assert warning message in output
         """
+        import requests
+
         # Mock connection error
         mock_correlator_dynamic.add(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             body=requests.ConnectionError("Connection refused"),
         )
@@ -582,19 +549,15 @@ class TestErrorScenarios:
         assert result.exit_code == 0, f"Expected exit code 0, got: {result.exit_code}"
 
         # Should have warning about connection failure
-        output_lower = result.output.lower()
-        assert (
-            "warning" in output_lower
-            or "error" in output_lower
-            or "failed" in output_lower
-            or "connection" in output_lower
+        assert CONNECTION_WARNING_PATTERN.search(
+            result.output
         ), f"Expected warning about connection, got: {result.output}"
 
     def test_end_to_end_correlator_timeout(
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_dynamic: responses.RequestsMock,
+        mock_correlator_dynamic: "responses.RequestsMock",
     ) -> None:
         """Timeout handling - fire-and-forget.
 
@@ -604,9 +567,11 @@ class TestErrorScenarios:
             3. Assert exit code is 0
             4. Assert warning message in output
         """
+        import requests
+
         # Mock timeout error
         mock_correlator_dynamic.add(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             body=requests.Timeout("Request timed out"),
         )
@@ -629,18 +594,15 @@ class TestErrorScenarios:
         assert result.exit_code == 0, f"Expected exit code 0, got: {result.exit_code}"
 
         # Should have warning about timeout
-        output_lower = result.output.lower()
-        assert (
-            "warning" in output_lower
-            or "timeout" in output_lower
-            or "error" in output_lower
+        assert TIMEOUT_WARNING_PATTERN.search(
+            result.output
         ), f"Expected warning about timeout, got: {result.output}"
 
     def test_end_to_end_correlator_validation_error(
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_validation_error: responses.RequestsMock,
+        mock_correlator_validation_error: "responses.RequestsMock",
     ) -> None:
         """422 validation error response handling.
 
@@ -655,6 +617,7 @@ class TestErrorScenarios:
             [
                 "test",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir),
                 "--profiles-dir",
@@ -674,7 +637,7 @@ class TestErrorScenarios:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_partial_success: responses.RequestsMock,
+        mock_correlator_partial_success: "responses.RequestsMock",
     ) -> None:
         """207 partial success response handling.
 
@@ -689,6 +652,7 @@ class TestErrorScenarios:
             [
                 "test",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir),
                 "--profiles-dir",
@@ -708,7 +672,7 @@ class TestErrorScenarios:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_dynamic: responses.RequestsMock,
+        mock_correlator_dynamic: "responses.RequestsMock",
     ) -> None:
         """Verify X-API-Key header sent when configured.
 
@@ -718,15 +682,17 @@ class TestErrorScenarios:
             3. Assert request has X-API-Key: secret123 header
             4. Assert exit code is 0
         """
-        # Track request headers
+        # Track the API key header only
         captured_headers: dict[str, str] = {}
 
-        def capture_request(request: Any) -> tuple[int, dict[str, str], str]:
-            captured_headers.update(request.headers)
-            return 200, {}, '{"status": "success", "summary": {"received": 1}}'
+        def capture_request(request: Any) -> tuple[int, dict[str, str], bytes]:
+            api_key = request.headers.get("X-API-Key")
+            if api_key is not None:
+                captured_headers["X-API-Key"] = api_key
+            return 200, {}, SUCCESS_RESPONSE_BODY
 
         mock_correlator_dynamic.add_callback(
-            responses.POST,
+            "POST",
             MOCK_CORRELATOR_ENDPOINT,
             callback=capture_request,
         )
@@ -775,7 +741,7 @@ class TestLineageEmission:
         self,
         runner: CliRunner,
         mock_dbt_project_dir_with_model_results: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate run command emits lineage events.
 
@@ -789,6 +755,7 @@ class TestLineageEmission:
             [
                 "run",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir_with_model_results),
                 "--profiles-dir",
@@ -821,7 +788,7 @@ class TestLineageEmission:
         self,
         runner: CliRunner,
         mock_dbt_project_dir_with_model_results: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate lineage event structure has inputs and outputs.
 
@@ -835,6 +802,7 @@ class TestLineageEmission:
             [
                 "run",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir_with_model_results),
                 "--profiles-dir",
@@ -883,7 +851,7 @@ class TestLineageEmission:
         self,
         runner: CliRunner,
         mock_dbt_project_dir_with_model_results: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate run command includes outputStatistics facet.
 
@@ -896,6 +864,7 @@ class TestLineageEmission:
             [
                 "run",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir_with_model_results),
                 "--profiles-dir",
@@ -959,7 +928,7 @@ class TestBuildCommandIntegration:
         self,
         runner: CliRunner,
         mock_dbt_project_dir_with_model_results: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate build command emits lineage events for executed models.
 
@@ -977,6 +946,7 @@ class TestBuildCommandIntegration:
             [
                 "build",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir_with_model_results),
                 "--profiles-dir",
@@ -1004,7 +974,7 @@ class TestBuildCommandIntegration:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate all build command events share the same runId.
 
@@ -1016,6 +986,7 @@ class TestBuildCommandIntegration:
             [
                 "build",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir),
                 "--profiles-dir",
@@ -1046,7 +1017,7 @@ class TestBuildCommandIntegration:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Validate build command event ordering.
 
@@ -1060,6 +1031,7 @@ class TestBuildCommandIntegration:
             [
                 "build",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir),
                 "--profiles-dir",
@@ -1101,7 +1073,7 @@ class TestParentRunFacetIntegration:
         self,
         runner: CliRunner,
         mock_dbt_project_dir_with_model_results: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Test that dbt run lineage events include ParentRunFacet.
 
@@ -1115,6 +1087,7 @@ class TestParentRunFacetIntegration:
             [
                 "run",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir_with_model_results),
                 "--profiles-dir",
@@ -1163,7 +1136,7 @@ class TestParentRunFacetIntegration:
         self,
         runner: CliRunner,
         mock_dbt_project_dir: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Test that dbt test events have no ParentRunFacet when standalone.
 
@@ -1179,6 +1152,7 @@ class TestParentRunFacetIntegration:
             [
                 "test",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir),
                 "--profiles-dir",
@@ -1219,7 +1193,7 @@ class TestParentRunFacetIntegration:
         self,
         runner: CliRunner,
         mock_dbt_project_dir_with_model_results: Path,
-        mock_correlator_success: responses.RequestsMock,
+        mock_correlator_success: "responses.RequestsMock",
     ) -> None:
         """Test parent hierarchy in build command when standalone (no orchestrator).
 
@@ -1232,6 +1206,7 @@ class TestParentRunFacetIntegration:
             [
                 "build",
                 "--skip-dbt-run",
+                "--eager-start",
                 "--project-dir",
                 str(mock_dbt_project_dir_with_model_results),
                 "--profiles-dir",
@@ -0,0 +1,61 @@
+"""Tests for JSON encoding and decoding module.
+
+This module tests the JSON helpers used for artifacts and event payloads,
+including:
+    - Round-tripping with the active backend
+    - Standard library fallback when orjson is not installed
+    - Equivalent handling of input only the standard library accepts
+"""
+
+import json
+
+import pytest
+
+from dbt_correlator import jsonio
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(params=["active", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test with the active backend and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return str(request.param)
+
+
+# =============================================================================
+# A. Encoding and Decoding Tests
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestJsonio:
+    """Tests for jsonio.loads and jsonio.dumps."""
+
+    def test_round_trip(self, backend: str) -> None:
+        """Encoded data decodes back to an equal object."""
+        data = [{"eventType": "START", "inputs": [], "name": "héllo", "count": 3}]
+
+        encoded = jsonio.dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert jsonio.loads(encoded) == data
+        assert json.loads(encoded) == data
+
+    def test_dumps_is_compact(self, backend: str) -> None:
+        """Output contains no insignificant whitespace."""
+        assert jsonio.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_loads_accepts_nan(self, backend: str) -> None:
+        """NaN literals accepted by the stdlib decode with either backend."""
+        data = jsonio.loads(b'{"execution_time": NaN}')
+
+        assert data["execution_time"] != data["execution_time"]
+
+    def test_loads_invalid_json_raises_decode_error(self, backend: str) -> None:
+        """Invalid JSON raises json.JSONDecodeError with either backend."""
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"{invalid")
@@ -22,17 +22,20 @@ Test Coverage:
 """
 
 import json
-import os
 import re
-import tempfile
+import sys
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-from uuid import UUID
 
 import pytest
 
+from dbt_correlator import parser
 from dbt_correlator.parser import (
+    MANIFEST_NODE_FIELDS,
+    RUN_RESULT_FIELDS,
+    RUN_RESULT_LEAN_EXCLUDED,
     DatasetInfo,
     Manifest,
     ModelExecutionResult,
@@ -40,6 +43,7 @@ from dbt_correlator.parser import (
     RunResults,
     RunResultsMetadata,
     TestResult,
+    _run_result_columns,
     build_dataset_info,
     build_namespace,
     extract_all_model_lineage,
@@ -47,6 +51,8 @@ from dbt_correlator.parser import (
     extract_model_name,
     extract_model_results,
     extract_project_name,
+    extract_run_data,
+    get_data_from_file,
     get_executed_models,
     get_models_with_tests,
     map_test_status,
@@ -64,10 +70,83 @@ DBT_RUN_RESULTS_PATH = FIXTURES_DIR / "dbt_run_results.json"
 # Valid test status values (dbt test statuses)
 VALID_TEST_STATUSES = {"pass", "fail", "error", "skipped", "warn"}
 
+# dbt test status -> map_test_status() result
+EXPECTED_STATUS_MAP = {"pass": True, "fail": False, "error": False, "skipped": False}
+
+# Generic test types recognisable from a unique_id, most specific first
+TEST_TYPES = ("accepted_values", "not_null", "unique", "relationships")
+
 # Pattern for dbt unique_id (test.project.test_name.hash or unit_test.project.model.test_name)
 # Handles both regular tests and unit tests
 UNIQUE_ID_PATTERN = re.compile(r"^(test|unit_test)\.\w+\.[\w\.]+$")
 
+# Canonical hyphenated UUID (dbt invocation_id)
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I
+)
+
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def edge_case_artifacts(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the malformed/incomplete/empty artifacts once per session.
+
+    Files:
+        - malformed_run_results.json: invalid JSON
+        - missing_metadata_run_results.json: results without a metadata key
+        - empty_run_results.json: valid metadata, zero results
+        - malformed_manifest.json: invalid JSON
+
+    Returns:
+        Directory containing the artifact files.
+    """
+    artifacts_dir: Path = tmp_path_factory.mktemp("edge_case_artifacts")
+
+    (artifacts_dir / "malformed_run_results.json").write_text(
+        '{"metadata": {"invalid json here}'
+    )
+
+    missing_metadata_data = {
+        "results": [
+            {
+                "unique_id": "test.my_project.test_1.abc123",
+                "status": "pass",
+                "execution_time": 0.1,
+                "failures": 0,
+                "thread_id": "Thread-1",
+            }
+        ],
+        "elapsed_time": 0.1,
+        # Missing "metadata" key entirely
+    }
+    (artifacts_dir / "missing_metadata_run_results.json").write_text(
+        json.dumps(missing_metadata_data)
+    )
+
+    empty_results_data = {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/run-results/v6.json",
+            "dbt_version": "1.10.15",
+            "generated_at": "2025-12-09T18:34:51.064443Z",
+            "invocation_id": "test-invocation-empty-12345",
+        },
+        "elapsed_time": 0.0,
+        "results": [],  # Empty array - no tests ran
+    }
+    (artifacts_dir / "empty_run_results.json").write_text(
+        json.dumps(empty_results_data)
+    )
+
+    (artifacts_dir / "malformed_manifest.json").write_text(
+        '{"nodes": {"test.project": incomplete json'
+    )
+
+    return artifacts_dir
+
 
 # =============================================================================
 # Tests for parse_run_results()
@@ -102,7 +181,7 @@ class TestParseRunResults:
         assert result.metadata.generated_at.year == 2025
         assert result.metadata.generated_at.month == 12
         assert result.metadata.generated_at.day == 9
-        assert result.metadata.elapsed_time == pytest.approx(0.325, abs=0.001)
+        assert abs(result.metadata.elapsed_time - 0.325) <= 0.001
 
         # Assert: Verify test results are extracted (30 tests in fixture)
         assert len(result.results) == 30, "Should extract all 30 test results"
@@ -115,7 +194,7 @@ class TestParseRunResults:
         )
         assert first_test.status == "pass"
         # Fixture value: 0.030359268188476562 (more precise check)
-        assert first_test.execution_time_seconds == pytest.approx(0.030359, abs=0.0001)
+        assert abs(first_test.execution_time_seconds - 0.030359) <= 0.0001
         assert first_test.failures == 0
         assert first_test.thread_id == "Thread-1 (worker)"
         assert first_test.compiled_code is not None
@@ -146,29 +225,37 @@ class TestParseRunResults:
         assert statuses == {"pass"}, "All tests should have 'pass' status in fixture"
 
         # Assert: Each test has required fields with proper validation
-        for test in result.results:
-            # Validate unique_id exists and matches pattern
-            assert test.unique_id, "Each test must have unique_id"
-            assert UNIQUE_ID_PATTERN.match(
-                test.unique_id
-            ), f"unique_id must match pattern (test|unit_test).<project>.<name>.<hash>, got: {test.unique_id}"
-
-            # Validate status is one of valid values
-            assert test.status, "Each test must have status"
-            assert (
-                test.status in VALID_TEST_STATUSES
-            ), f"Status must be one of {VALID_TEST_STATUSES}, got: {test.status}"
-
-            # Validate numeric fields
-            assert (
-                test.execution_time_seconds >= 0
-            ), "Execution time must be non-negative"
-            assert test.failures is not None, "Each test must have failures count"
-            assert isinstance(test.failures, int), "Failures must be integer"
-            assert test.failures >= 0, "Failures count must be non-negative"
-
-            # Validate thread_id
-            assert test.thread_id, "Each test must have thread_id"
+        # (each check collects offenders so a failure names them all)
+        bad_ids = [
+            test.unique_id
+            for test in result.results
+            if not (test.unique_id and UNIQUE_ID_PATTERN.match(test.unique_id))
+        ]
+        pattern = "(test|unit_test).<project>.<name>.<hash>"
+        assert not bad_ids, f"unique_id must match pattern {pattern}, got: {bad_ids}"
+
+        # Validate status is one of valid values
+        assert (
+            statuses <= VALID_TEST_STATUSES
+        ), f"Status must be one of {VALID_TEST_STATUSES}, got: {statuses}"
+
+        # Validate numeric fields
+        bad_numbers = [
+            test.unique_id
+            for test in result.results
+            if test.execution_time_seconds < 0
+            or not isinstance(test.failures, int)
+            or test.failures < 0
+        ]
+        assert not bad_numbers, (
+            "Execution time and failures count must be non-negative integers, "
+            f"got: {bad_numbers}"
+        )
+
+        # Validate thread_id
+        assert all(
+            test.thread_id for test in result.results
+        ), "Each test must have thread_id"
 
         # Assert: Execution times vary across tests
         execution_times = [test.execution_time_seconds for test in result.results]
@@ -179,16 +266,12 @@ class TestParseRunResults:
         ), "Max execution time should be reasonable (<10s)"
 
         # Assert: Different test types present (check unique_id patterns)
-        test_types = set()
-        for test in result.results:
-            if "accepted_values" in test.unique_id:
-                test_types.add("accepted_values")
-            elif "not_null" in test.unique_id:
-                test_types.add("not_null")
-            elif "unique" in test.unique_id:
-                test_types.add("unique")
-            elif "relationships" in test.unique_id:
-                test_types.add("relationships")
+        # (first matching type wins, so "unique" cannot shadow longer names)
+        test_types = {
+            next((t for t in TEST_TYPES if t in test.unique_id), None)
+            for test in result.results
+        }
+        test_types.discard(None)
 
         assert (
             len(test_types) >= 2
@@ -218,7 +301,7 @@ class TestParseRunResults:
             len(error_message) > 20
         ), f"Error message too short to be helpful: {error_message}"
 
-    def test_parse_run_results_malformed_json(self) -> None:
+    def test_parse_run_results_malformed_json(self, edge_case_artifacts: Path) -> None:
         """Test error handling when run_results.json contains invalid JSON.
 
         Validates that:
@@ -226,31 +309,23 @@ class TestParseRunResults:
             - Error message is helpful for debugging
             - Parser doesn't crash or return partial data
         """
-        # Arrange: Create temporary file with malformed JSON
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as temp_file:
-            temp_file.write('{"metadata": {"invalid json here}')
-            malformed_path = temp_file.name
-
-        try:
-            # Act & Assert: Should raise JSONDecodeError or ValueError
-            with pytest.raises((json.JSONDecodeError, ValueError)) as exc_info:
-                parse_run_results(malformed_path)
-
-            # Assert: Error message should mention JSON parsing issue
-            error_message = str(exc_info.value)
-            assert len(error_message) > 0, "Error message should not be empty"
-            # Error should indicate JSON parsing problem
-            assert any(
-                keyword in error_message.lower()
-                for keyword in ["json", "parse", "decode", "invalid"]
-            ), f"Error should indicate JSON parsing issue, got: {error_message}"
-        finally:
-            # Cleanup: Remove temporary file
-            os.unlink(malformed_path)
-
-    def test_parse_run_results_missing_metadata(self) -> None:
+        # Arrange: File with malformed JSON
+        malformed_path = edge_case_artifacts / "malformed_run_results.json"
+
+        # Act & Assert: Should raise JSONDecodeError or ValueError
+        with pytest.raises((json.JSONDecodeError, ValueError)) as exc_info:
+            parse_run_results(str(malformed_path))
+
+        # Assert: Error message should mention JSON parsing issue
+        error_message = str(exc_info.value)
+        assert any(
+            keyword in error_message.lower()
+            for keyword in ["json", "parse", "decode", "invalid"]
+        ), f"Error should indicate JSON parsing issue, got: {error_message}"
+
+    def test_parse_run_results_missing_metadata(
+        self, edge_case_artifacts: Path
+    ) -> None:
         """Test error handling when required metadata fields are missing.
 
         Validates that:
@@ -258,42 +333,20 @@ class TestParseRunResults:
             - Error message is helpful
             - Parser doesn't return partial/invalid data
         """
-        # Arrange: Create file with missing metadata
-        incomplete_data = {
-            "results": [
-                {
-                    "unique_id": "test.my_project.test_1.abc123",
-                    "status": "pass",
-                    "execution_time": 0.1,
-                    "failures": 0,
-                    "thread_id": "Thread-1",
-                }
-            ],
-            "elapsed_time": 0.1,
-            # Missing "metadata" key entirely
-        }
+        # Arrange: File with missing metadata
+        incomplete_path = edge_case_artifacts / "missing_metadata_run_results.json"
+
+        # Act & Assert: Should raise KeyError or ValueError
+        with pytest.raises((KeyError, ValueError)) as exc_info:
+            parse_run_results(str(incomplete_path))
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as temp_file:
-            json.dump(incomplete_data, temp_file)
-            incomplete_path = temp_file.name
-
-        try:
-            # Act & Assert: Should raise KeyError or ValueError
-            with pytest.raises((KeyError, ValueError)) as exc_info:
-                parse_run_results(incomplete_path)
-
-            # Assert: Error message should mention metadata
-            error_message = str(exc_info.value).lower()
-            assert (
-                "metadata" in error_message
-            ), f"Error should mention 'metadata', got: {exc_info.value}"
-        finally:
-            # Cleanup
-            os.unlink(incomplete_path)
-
-    def test_parse_run_results_empty_results(self) -> None:
+        # Assert: Error message should mention metadata
+        error_message = str(exc_info.value).lower()
+        assert (
+            "metadata" in error_message
+        ), f"Error should mention 'metadata', got: {exc_info.value}"
+
+    def test_parse_run_results_empty_results(self, edge_case_artifacts: Path) -> None:
         """Test parsing run_results.json with zero test results.
 
         Validates that:
@@ -301,39 +354,20 @@ class TestParseRunResults:
             - Metadata still extracted correctly
             - Returns RunResults with empty results list
         """
-        # Arrange: Create file with empty results array
-        empty_results_data = {
-            "metadata": {
-                "dbt_schema_version": "https://schemas.getdbt.com/dbt/run-results/v6.json",
-                "dbt_version": "1.10.15",
-                "generated_at": "2025-12-09T18:34:51.064443Z",
-                "invocation_id": "test-invocation-empty-12345",
-            },
-            "elapsed_time": 0.0,
-            "results": [],  # Empty array - no tests ran
-        }
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as temp_file:
-            json.dump(empty_results_data, temp_file)
-            empty_path = temp_file.name
+        # Arrange: File with empty results array
+        empty_path = edge_case_artifacts / "empty_run_results.json"
 
-        try:
-            # Act: Parse file with empty results
-            result = parse_run_results(empty_path)
+        # Act: Parse file with empty results
+        result = parse_run_results(str(empty_path))
 
-            # Assert: Should return valid RunResults instance
-            assert isinstance(result, RunResults), "Should return RunResults instance"
-            assert len(result.results) == 0, "Should handle empty results array"
+        # Assert: Should return valid RunResults instance
+        assert isinstance(result, RunResults), "Should return RunResults instance"
+        assert len(result.results) == 0, "Should handle empty results array"
 
-            # Assert: Metadata should still be extracted correctly
-            assert result.metadata.invocation_id == "test-invocation-empty-12345"
-            assert result.metadata.dbt_version == "1.10.15"
-            assert result.metadata.elapsed_time == 0.0
-        finally:
-            # Cleanup
-            os.unlink(empty_path)
+        # Assert: Metadata should still be extracted correctly
+        assert result.metadata.invocation_id == "test-invocation-empty-12345"
+        assert result.metadata.dbt_version == "1.10.15"
+        assert result.metadata.elapsed_time == 0.0
 
     def test_parse_run_results_openlineage_compliance(self) -> None:
         """Test that parsed data meets OpenLineage event requirements.
@@ -358,13 +392,10 @@ class TestParseRunResults:
         ), "generated_at must be reasonable timestamp"
 
         # Assert: Invocation ID is valid UUID format (OpenLineage runId requirement)
-        try:
-            UUID(result.metadata.invocation_id)
-        except ValueError as e:
-            pytest.fail(
-                f"invocation_id must be valid UUID for OpenLineage runId, "
-                f"got: {result.metadata.invocation_id}, error: {e}"
-            )
+        assert UUID_PATTERN.fullmatch(result.metadata.invocation_id), (
+            f"invocation_id must be valid UUID for OpenLineage runId, "
+            f"got: {result.metadata.invocation_id}"
+        )
 
         # Assert: dbt_version is present and looks like semver (OpenLineage producer)
         assert (
@@ -377,6 +408,22 @@ class TestParseRunResults:
         # Assert: Elapsed time is present and reasonable
         assert result.metadata.elapsed_time >= 0, "elapsed_time must be non-negative"
 
+    @pytest.mark.parametrize("accepts_z", [True, False], ids=["native", "fallback"])
+    def test_generated_at_z_suffix_parsed_as_utc(
+        self, accepts_z: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that "Z" timestamps parse to UTC with and without native support."""
+        if accepts_z and sys.version_info < (3, 11):
+            pytest.skip("fromisoformat() accepts 'Z' from Python 3.11")
+        monkeypatch.setattr(parser, "FROMISOFORMAT_ACCEPTS_Z", accepts_z)
+
+        parsed = parser._parse_timestamp("2025-12-09T18:34:51.064443Z")
+
+        assert parsed == datetime(2025, 12, 9, 18, 34, 51, 64443, tzinfo=timezone.utc)
+        assert parser._parse_timestamp("2025-12-09T18:34:51+00:00") == parsed.replace(
+            microsecond=0
+        )
+
 
 # =============================================================================
 # Tests for parse_manifest()
@@ -409,13 +456,10 @@ class TestParseManifest:
         assert isinstance(result.nodes, dict), "Nodes should be a dictionary"
         assert len(result.nodes) == 40, "Should have 40 nodes (13 models + 27 tests)"
 
-        # Assert: Verify test nodes are present
-        test_nodes = [key for key in result.nodes if key.startswith("test.")]
-        assert len(test_nodes) == 27, "Should have 27 test nodes"
-
-        # Assert: Verify model nodes are present
-        model_nodes = [key for key in result.nodes if key.startswith("model.")]
-        assert len(model_nodes) >= 13, "Should have at least 13 model nodes"
+        # Assert: Verify test and model nodes are present (counted in one pass)
+        node_counts = Counter(key.split(".", 1)[0] for key in result.nodes)
+        assert node_counts["test"] == 27, "Should have 27 test nodes"
+        assert node_counts["model"] >= 13, "Should have at least 13 model nodes"
 
         # Assert: Verify a specific test node exists and has expected structure
         test_node_key = "test.jaffle_shop.unique_customers_customer_id.c5af1ff4b1"
@@ -437,11 +481,15 @@ class TestParseManifest:
 
         # Assert: Verify metadata is extracted
         assert isinstance(result.metadata, dict), "Metadata should be a dictionary"
-        assert result.metadata["dbt_version"] == "1.10.15"
-        assert result.metadata["project_name"] == "jaffle_shop"
-        assert result.metadata["adapter_type"] == "duckdb"
-        assert "invocation_id" in result.metadata
-        assert "generated_at" in result.metadata
+        expected_metadata = {
+            "dbt_version": "1.10.15",
+            "project_name": "jaffle_shop",
+            "adapter_type": "duckdb",
+        }
+        assert (
+            expected_metadata.items() <= result.metadata.items()
+        ), f"Metadata should include {expected_metadata}"
+        assert {"invocation_id", "generated_at"} <= result.metadata.keys()
 
     def test_parse_manifest_missing_file(self) -> None:
         """Test error handling when manifest.json is missing.
@@ -467,7 +515,7 @@ class TestParseManifest:
             len(error_message) > 20
         ), f"Error message too short to be helpful: {error_message}"
 
-    def test_parse_manifest_malformed_json(self) -> None:
+    def test_parse_manifest_malformed_json(self, edge_case_artifacts: Path) -> None:
         """Test error handling when manifest.json contains invalid JSON.
 
         Validates that:
@@ -475,28 +523,85 @@ class TestParseManifest:
             - Error message is helpful for debugging
             - Parser doesn't crash or return partial data
         """
-        # Arrange: Create temporary file with malformed JSON
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as temp_file:
-            temp_file.write('{"nodes": {"test.project": incomplete json')
-            malformed_path = temp_file.name
-
-        try:
-            # Act & Assert: Should raise JSONDecodeError or ValueError
-            with pytest.raises((json.JSONDecodeError, ValueError)) as exc_info:
-                parse_manifest(malformed_path)
-
-            # Assert: Error message should mention JSON parsing issue
-            error_message = str(exc_info.value)
-            assert len(error_message) > 0, "Error message should not be empty"
-            assert any(
-                keyword in error_message.lower()
-                for keyword in ["json", "parse", "decode", "invalid"]
-            ), f"Error should indicate JSON parsing issue, got: {error_message}"
-        finally:
-            # Cleanup: Remove temporary file
-            os.unlink(malformed_path)
+        # Arrange: File with malformed JSON
+        malformed_path = edge_case_artifacts / "malformed_manifest.json"
+
+        # Act & Assert: Should raise JSONDecodeError or ValueError
+        with pytest.raises((json.JSONDecodeError, ValueError)) as exc_info:
+            parse_manifest(str(malformed_path))
+
+        # Assert: Error message should mention JSON parsing issue
+        error_message = str(exc_info.value)
+        assert any(
+            keyword in error_message.lower()
+            for keyword in ["json", "parse", "decode", "invalid"]
+        ), f"Error should indicate JSON parsing issue, got: {error_message}"
+
+    def test_parse_manifest_lean_keeps_only_used_fields(self) -> None:
+        """Test that lean parsing drops unused fields without changing results.
+
+        Validates:
+            - Nodes and sources only contain MANIFEST_NODE_FIELDS
+            - depends_on keeps only its nodes list
+            - Lineage extracted from the lean manifest matches the full one
+        """
+        full = parse_manifest(str(MANIFEST_PATH))
+        lean = parse_manifest(str(MANIFEST_PATH), lean=True)
+
+        for node in [*lean.nodes.values(), *lean.sources.values()]:
+            assert set(node) <= set(MANIFEST_NODE_FIELDS)
+            assert set(node.get("depends_on", {})) <= {"nodes"}
+        assert lean.metadata == full.metadata
+        assert extract_all_model_lineage(lean) == extract_all_model_lineage(full)
+
+    def test_parse_run_results_caches_only_used_fields(self) -> None:
+        """Test that unused run_results fields are dropped before caching.
+
+        Validates:
+            - Results are cached as one column per RUN_RESULT_FIELDS entry
+            - Top-level invocation args are dropped
+            - Parsed results are unchanged
+        """
+        path = str(DBT_RUN_RESULTS_PATH)
+        parsed = parse_run_results(path)
+        # The column projection is what load_json_artifact cached for this file
+        lean = get_data_from_file(path, transform=_run_result_columns)
+        full = get_data_from_file(path)
+
+        assert "args" not in lean
+        assert "results" not in lean
+        assert tuple(lean["result_columns"]) == RUN_RESULT_FIELDS
+        for column in lean["result_columns"].values():
+            assert len(column) == len(full["results"])
+        assert [r.unique_id for r in parsed.results] == [
+            r["unique_id"] for r in full["results"]
+        ]
+        first = full["results"][0]
+        assert parsed.results[0].adapter_response == first["adapter_response"]
+
+    def test_parse_run_results_interns_statuses(self) -> None:
+        """Test that results with the same status share one interned string."""
+        result = parse_run_results(str(DBT_TEST_RESULTS_PATH))
+
+        assert all(test.status is sys.intern("pass") for test in result.results)
+
+    def test_parse_run_results_lean_drops_unused_fields(self) -> None:
+        """Test that lean parsing leaves compiled SQL and thread IDs unset.
+
+        Validates:
+            - RUN_RESULT_LEAN_EXCLUDED fields are None on every result
+            - All other fields match a full parse
+        """
+        full = parse_run_results(str(DBT_TEST_RESULTS_PATH))
+        lean = parse_run_results(str(DBT_TEST_RESULTS_PATH), lean=True)
+
+        assert full.results[0].compiled_code is not None
+        assert len(lean.results) == len(full.results)
+        for lean_result, full_result in zip(lean.results, full.results):
+            for name in RUN_RESULT_LEAN_EXCLUDED:
+                assert getattr(lean_result, name) is None
+                setattr(full_result, name, None)
+            assert lean_result == full_result
 
 
 # =============================================================================
@@ -592,34 +697,36 @@ class TestResolveTestToModelNode:
 class TestExtractProjectName:
     """Tests for extracting project name from test unique_id."""
 
-    def test_extract_project_name_valid(self) -> None:
-        """Test extracting project name from valid test unique_id.
+    @pytest.mark.parametrize(
+        ("test_unique_id", "expected"),
+        [
+            ("test.jaffle_shop.unique_customers_customer_id.c5af1ff4b1", "jaffle_shop"),
+            ("test.jaffle_shop", "jaffle_shop"),
+            ("test..name", ""),
+        ],
+        ids=["standard", "no-trailing-part", "empty-project"],
+    )
+    def test_extract_project_name(self, test_unique_id: str, expected: str) -> None:
+        """Test extracting project name from test unique_id.
 
         Validates:
             - Correctly parses project name from second position
             - Works with standard format: test.project.test_name.hash
+            - Ids without a trailing part resolve like split(".")[1]
         """
-        # Arrange: Valid test unique_id
-        test_unique_id = "test.jaffle_shop.unique_customers_customer_id.c5af1ff4b1"
-
-        # Act: Extract project name
         project_name = extract_project_name(test_unique_id)
 
-        # Assert: Should return correct project name
-        assert (
-            project_name == "jaffle_shop"
-        ), f"Expected 'jaffle_shop', got '{project_name}'"
+        assert project_name == expected, f"Expected '{expected}', got '{project_name}'"
 
-    def test_extract_project_name_invalid_format(self) -> None:
+    @pytest.mark.parametrize("invalid_unique_id", ["test", ""], ids=["no-dot", "empty"])
+    def test_extract_project_name_invalid_format(self, invalid_unique_id: str) -> None:
         """Test error handling for invalid test unique_id format.
 
         Validates that:
-            - ValueError is raised for malformed unique_id
+            - ValueError is raised for a unique_id without a dot separator
+              (including the empty string)
             - Error message explains expected format
         """
-        # Arrange: Invalid unique_id (only one part - no dot separator)
-        invalid_unique_id = "test"  # Missing project, test_name, and hash
-
         # Act & Assert: Should raise ValueError
         with pytest.raises(ValueError) as exc_info:  # noqa: PT011
             extract_project_name(invalid_unique_id)
@@ -629,19 +736,6 @@ class TestExtractProjectName:
         assert "format" in error_message.lower(), "Error should mention format issue"
         assert invalid_unique_id in error_message, "Error should include the invalid ID"
 
-    def test_extract_project_name_empty_string(self) -> None:
-        """Test error handling for empty unique_id string.
-
-        Validates graceful handling of edge case.
-        """
-        # Act & Assert: Should raise ValueError
-        with pytest.raises(ValueError) as exc_info:  # noqa: PT011
-            extract_project_name("")
-
-        # Assert: Error message should be helpful
-        error_message = str(exc_info.value)
-        assert len(error_message) > 0, "Error message should not be empty"
-
 
 # =============================================================================
 # Tests for extract_model_name()
@@ -686,59 +780,36 @@ class TestExtractModelName:
             model_name == "orders"
         ), f"Should return first ref 'orders', got '{model_name}'"
 
-    def test_get_model_name_from_test_no_refs(self) -> None:
-        """Test error handling when test node has no refs array.
+    @pytest.mark.parametrize(
+        ("test_node", "expected_keyword"),
+        [
+            ({"name": "some_test"}, "refs"),  # Missing refs
+            ({"refs": []}, "refs"),  # Empty refs
+            ({"refs": [{"package": "some_package"}]}, "name"),  # Ref without name
+        ],
+        ids=["no_refs", "empty_refs", "ref_without_name"],
+    )
+    def test_get_model_name_from_test_invalid_refs(
+        self, test_node: dict[str, Any], expected_keyword: str
+    ) -> None:
+        """Test error handling when test node refs cannot name a model.
 
         Validates that:
             - ValueError is raised
-            - Error message is helpful
+            - Error message names the problem and includes the test ID
         """
-        # Arrange: Test node without refs
-        test_node = {"name": "some_test"}  # Missing refs
         test_unique_id = "test.jaffle_shop.orphan_test.abc123"
 
-        # Act & Assert: Should raise ValueError
-        with pytest.raises(ValueError) as exc_info:  # noqa: PT011
-            extract_model_name(test_node, test_unique_id)
-
-        # Assert: Error message should mention refs
-        error_message = str(exc_info.value)
-        assert "refs" in error_message.lower(), "Error should mention missing refs"
-        assert test_unique_id in error_message, "Error should include test ID"
-
-    def test_get_model_name_from_test_empty_refs(self) -> None:
-        """Test error handling when test node has empty refs array.
-
-        Validates handling of edge case where refs exists but is empty.
-        """
-        # Arrange: Test node with empty refs array
-        test_node: dict[str, Any] = {"refs": []}  # Empty refs
-        test_unique_id = "test.jaffle_shop.test_with_no_refs.abc123"
-
         # Act & Assert: Should raise ValueError
         with pytest.raises(ValueError) as exc_info:  # noqa: PT011
             extract_model_name(test_node, test_unique_id)
 
         # Assert: Error message should be helpful
         error_message = str(exc_info.value)
-        assert len(error_message) > 0, "Error message should not be empty"
-
-    def test_get_model_name_from_test_ref_without_name(self) -> None:
-        """Test error handling when ref exists but has no name field.
-
-        Validates handling of malformed ref structure.
-        """
-        # Arrange: Test node with ref but no name
-        test_node = {"refs": [{"package": "some_package"}]}  # Missing 'name' key
-        test_unique_id = "test.jaffle_shop.malformed_ref.abc123"
-
-        # Act & Assert: Should raise ValueError
-        with pytest.raises(ValueError) as exc_info:  # noqa: PT011
-            extract_model_name(test_node, test_unique_id)
-
-        # Assert: Error message should mention name issue
-        error_message = str(exc_info.value)
-        assert "name" in error_message.lower(), "Error should mention missing name"
+        assert (
+            expected_keyword in error_message.lower()
+        ), f"Error should mention {expected_keyword}, got: {error_message}"
+        assert test_unique_id in error_message, "Error should include test ID"
 
 
 # =============================================================================
@@ -750,56 +821,31 @@ class TestExtractModelName:
 class TestMapTestStatus:
     """Tests for mapping dbt test status to boolean."""
 
-    def test_map_test_status_pass(self) -> None:
-        """Test mapping 'pass' status to True.
+    def test_map_test_status_full_table(self) -> None:
+        """Test mapping every dbt test status to a boolean.
 
         Validates:
             - "pass" → True (test succeeded)
-        """
-        # Act: Map 'pass' status
-        result = map_test_status("pass")
-
-        # Assert: Should return True
-        assert result is True, "'pass' should map to True"
-
-    def test_map_test_status_fail(self) -> None:
-        """Test mapping 'fail' status to False.
-
-        Validates:
             - "fail" → False (test failed)
-        """
-        # Act: Map 'fail' status
-        result = map_test_status("fail")
-
-        # Assert: Should return False
-        assert result is False, "'fail' should map to False"
-
-    def test_map_test_status_error(self) -> None:
-        """Test mapping 'error' status to False.
-
-        Validates:
             - "error" → False (test encountered error)
+            - "skipped" → False (treated as failure for incident correlation)
+            - Results are real bools, not merely truthy/falsy values
         """
-        # Act: Map 'error' status
-        result = map_test_status("error")
-
-        # Assert: Should return False
-        assert result is False, "'error' should map to False"
-
-    def test_map_test_status_skipped(self) -> None:
-        """Test mapping 'skipped' status to False.
+        actual = {status: map_test_status(status) for status in EXPECTED_STATUS_MAP}
 
-        Validates:
-            - "skipped" → False (treat as failure for correlation)
-            - Skipped tests are considered failures for incident correlation purposes
-        """
-        # Act: Map 'skipped' status
-        result = map_test_status("skipped")
+        assert actual == EXPECTED_STATUS_MAP
+        assert all(isinstance(value, bool) for value in actual.values())
 
-        # Assert: Should return False
-        assert (
-            result is False
-        ), "'skipped' should map to False (treated as failure for correlation)"
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [("PASS", True), ("Pass", True), ("FAIL", False)],
+        ids=["PASS", "Pass", "FAIL"],
+    )
+    def test_map_test_status_case_insensitive(
+        self, status: str, expected: bool
+    ) -> None:
+        """Test that status matching ignores case."""
+        assert map_test_status(status) is expected
 
 
 # =============================================================================
@@ -1980,3 +2026,131 @@ class TestExtractModelResults:
         assert skipped_result.execution_time_seconds == 0.0
         assert skipped_result.message is not None
         assert "SKIP" in skipped_result.message
+
+
+# =============================================================================
+# Tests for extract_run_data()
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestExtractRunData:
+    """Tests for single-pass extraction of executed model data."""
+
+    def test_extract_run_data_matches_separate_extractors(self) -> None:
+        """Test that the fused pass agrees with the individual extractors.
+
+        Validates:
+            - executed_models equals get_executed_models()
+            - execution_results equals extract_model_results()
+            - lineages cover the same models as extract_all_model_lineage()
+        """
+        # Arrange: Parse real dbt run artifacts
+        run_results = parse_run_results(str(DBT_RUN_RESULTS_PATH))
+        manifest = parse_manifest(str(MANIFEST_PATH))
+        executed = get_executed_models(run_results)
+
+        # Act: Extract everything in one pass
+        run_data = extract_run_data(run_results, manifest)
+
+        # Assert: Same results as the three separate passes
+        assert run_data.executed_models == executed
+        assert run_data.execution_results == extract_model_results(run_results)
+        expected_lineages = extract_all_model_lineage(manifest, model_ids=executed)
+        assert sorted(run_data.lineages, key=lambda lin: lin.unique_id) == sorted(
+            expected_lineages, key=lambda lin: lin.unique_id
+        )
+
+    def test_extract_run_data_deduplicates_repeated_models(self) -> None:
+        """Test that a model appearing twice yields one lineage, last metrics.
+
+        Validates:
+            - Lineage is built once per model
+            - Execution result reflects the last run_results entry
+            - Models missing from the manifest are skipped for lineage
+        """
+        # Arrange: Same model twice plus one unknown model
+        manifest = parse_manifest(str(MANIFEST_PATH))
+        run_results = RunResults(
+            metadata=RunResultsMetadata(
+                generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                invocation_id="test-invocation",
+                dbt_version="1.10.0",
+                elapsed_time=1.0,
+            ),
+            results=[
+                TestResult("model.jaffle_shop.customers", "error", 1.0),
+                TestResult("model.jaffle_shop.customers", "success", 2.0),
+                TestResult("model.jaffle_shop.unknown", "success", 1.0),
+                TestResult("test.jaffle_shop.not_null_x", "pass", 1.0),
+            ],
+        )
+
+        # Act
+        run_data = extract_run_data(run_results, manifest)
+
+        # Assert
+        assert run_data.executed_models == {
+            "model.jaffle_shop.customers",
+            "model.jaffle_shop.unknown",
+        }
+        assert [lin.unique_id for lin in run_data.lineages] == [
+            "model.jaffle_shop.customers"
+        ]
+        customers = run_data.execution_results["model.jaffle_shop.customers"]
+        assert customers.status == "success"
+        assert customers.execution_time_seconds == 2.0
+
+    def test_extract_run_data_memoized_for_unchanged_artifacts(self) -> None:
+        """Test that parsed artifacts with the same version share one RunData.
+
+        Validates:
+            - Parsed artifacts carry a source_key
+            - Repeated extraction for unchanged files returns the same object
+            - A different namespace override is computed separately
+            - Artifacts built in memory (no source_key) are never memoized
+        """
+        run_results = parse_run_results(str(DBT_RUN_RESULTS_PATH))
+        manifest = parse_manifest(str(MANIFEST_PATH))
+        assert run_results.source_key is not None
+        assert manifest.source_key is not None
+
+        first = extract_run_data(run_results, manifest)
+        second = extract_run_data(
+            parse_run_results(str(DBT_RUN_RESULTS_PATH)),
+            parse_manifest(str(MANIFEST_PATH)),
+        )
+        overridden = extract_run_data(run_results, manifest, "postgres://other")
+
+        assert second is first
+        assert overridden is not first
+
+        in_memory = RunResults(metadata=run_results.metadata, results=[])
+        assert extract_run_data(in_memory, manifest) is not extract_run_data(
+            in_memory, manifest
+        )
+
+
+# =============================================================================
+# Tests for record memory layout
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs 3.10+")
+class TestSlottedRecords:
+    """Tests that per-test/per-model records use __slots__ instead of a __dict__."""
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            TestResult("test.p.t", "pass", 0.1),
+            DatasetInfo(namespace="duckdb://db", name="main.customers"),
+            ModelExecutionResult("model.p.m", "success", 1.0),
+            ModelLineage("model.p.m", "m", [], DatasetInfo(namespace="n", name="s.m")),
+        ],
+        ids=lambda record: type(record).__name__,
+    )
+    def test_record_has_no_instance_dict(self, record: Any) -> None:
+        """Test that slotted records carry no per-instance __dict__."""
+        assert not hasattr(record, "__dict__")